@@ -5,6 +5,7 @@ Collects candidate information and conducts AI-powered technical interviews.
 """
 
 import streamlit as st
+import logging
 import sys
 from pathlib import Path
 
@@ -20,6 +21,12 @@ except ImportError as e:
     st.error("Please ensure all required files are in place.")
     st.stop()
 
+# The only logging setup for the app; library modules just create loggers
+logging.basicConfig(
+    level=Config.LOG_LEVEL,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
 
 def main() -> None:
     """Main application entry point with error handling."""
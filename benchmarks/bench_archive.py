@@ -0,0 +1,173 @@
+"""Benchmark: CSV store vs. Parquet archive for a typical reporting query.
+
+Generates a synthetic interview history spread over two years, stores it
+as the append-only CSV file and compacts it into the month-partitioned
+Parquet archive. It then times "all candidates for position X last
+quarter" with each reader. Every reader runs in a fresh interpreter so
+the growth of its peak resident memory over the imported libraries can
+be reported.
+
+Usage:
+    python benchmarks/bench_archive.py [--rows N] [--runs N]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.schema import CSV_COLUMNS, DATE_FORMAT, write_records  # noqa: E402
+
+POSITIONS = [
+    "Backend Engineer", "Frontend Engineer", "Data Scientist", "DevOps Engineer",
+    "Mobile Developer", "QA Engineer", "Data Engineer", "ML Engineer",
+]
+LOCATIONS = ["Berlin", "London", "New York", "Bangalore", "Toronto", "Remote"]
+QUERY_POSITION = "Data Engineer"
+QUERY_SINCE = "2025-10-01"
+QUERY_UNTIL = "2026-01-01"
+START_DATE = datetime(2024, 1, 1)
+DAYS = 731
+
+READERS = {
+    # The original path: read the whole file with pandas, then filter
+    "csv_full_scan": """
+import pandas as pd
+df = pd.read_csv(os.path.join(data_dir, "candidate_data.csv"), encoding="utf-8")
+df = df[(df["Which position are you applying for?"] == position)
+        & (df["interview_date"] >= since) & (df["interview_date"] < until)]
+""",
+    # Streaming loader with projection and date predicate (CSV backend)
+    "csv_streaming": """
+import pandas as pd
+from core.storage import CsvCandidateStore
+store = CsvCandidateStore(os.path.join(data_dir, "candidate_data.csv"))
+frames = [
+    chunk[chunk["Which position are you applying for?"] == position]
+    for chunk in store.iter_frames(50000, columns, since, until)
+]
+df = pd.concat(frames, ignore_index=True)
+""",
+    "parquet_archive": """
+from core.archive import ParquetArchive
+archive = ParquetArchive(os.path.join(data_dir, "archive"))
+df = archive.read(columns, since, until, where={"position": position})
+""",
+}
+
+
+def build_dataset(data_dir: str, rows: int) -> None:
+    from core.archive import ParquetArchive
+    from core.storage import CsvCandidateStore
+
+    rng = random.Random(42)
+    answer = "A detailed technical answer discussing trade-offs and examples. " * 12
+    dates = sorted(START_DATE + timedelta(seconds=rng.randrange(DAYS * 86400)) for _ in range(rows))
+
+    records = []
+    for i, date in enumerate(dates):
+        record = dict.fromkeys(CSV_COLUMNS, "")
+        record.update({
+            "interview_date": date.strftime(DATE_FORMAT),
+            "What is your full name?": f"Candidate {i}",
+            "What is your email address?": f"candidate{i}@example.com",
+            "What is your phone number?": f"+1555{i:07d}",
+            "How many years of experience do you have?": str(rng.randint(0, 20)),
+            "Which position are you applying for?": rng.choice(POSITIONS),
+            "Where are you currently located?": rng.choice(LOCATIONS),
+            "Please list your tech stack (languages, frameworks, and tools you know).": "Python, SQL, Docker",
+        })
+        for slot in range(1, 6):
+            record[f"Technical_Q{slot}"] = f"Question {slot} about distributed systems?"
+            record[f"Technical_A{slot}"] = answer
+        records.append(record)
+
+    csv_path = os.path.join(data_dir, "candidate_data.csv")
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        write_records(f, records)
+
+    archive = ParquetArchive(os.path.join(data_dir, "archive"))
+    archive.compact(CsvCandidateStore(csv_path))
+
+
+def run_reader(name: str, data_dir: str) -> dict:
+    code = f"""
+import json, os, resource, sys, time
+sys.path.insert(0, {PROJECT_ROOT!r})
+
+def peak_rss_kb():
+    # VmHWM is per process image; ru_maxrss would include the parent's peak
+    try:
+        with open("/proc/self/status") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+data_dir, position = {data_dir!r}, {QUERY_POSITION!r}
+since, until = {QUERY_SINCE!r}, {QUERY_UNTIL!r}
+columns = ["interview_date", "full_name", "email", "position"]
+# Library imports are excluded from both the timing and the memory figure
+import pandas, pyarrow.dataset
+baseline_kb = peak_rss_kb()
+started = time.perf_counter()
+{READERS[name]}
+elapsed = time.perf_counter() - started
+peak_kb = peak_rss_kb()
+print(json.dumps({{"seconds": elapsed, "rows": len(df), "max_rss_mb": (peak_kb - baseline_kb) / 1024}}))
+"""
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr else "failed"}
+    return json.loads(result.stdout)
+
+
+def directory_size_mb(path: str) -> float:
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total / 1024 / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--runs", type=int, default=3, help="runs per reader; the fastest is reported")
+    args = parser.parse_args()
+
+    try:
+        import pandas  # noqa: F401
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        print(f"skipped: {e}")
+        return 0
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        started = time.perf_counter()
+        build_dataset(data_dir, args.rows)
+        print(f"built {args.rows} interviews in {time.perf_counter() - started:.1f}s")
+        print(f"csv file: {os.path.getsize(os.path.join(data_dir, 'candidate_data.csv')) / 1024 / 1024:.1f} MiB, "
+              f"parquet archive: {directory_size_mb(os.path.join(data_dir, 'archive')):.1f} MiB")
+        print(f'query: position == "{QUERY_POSITION}" and {QUERY_SINCE} <= interview_date < {QUERY_UNTIL}\n')
+
+        for name in READERS:
+            results = [run_reader(name, data_dir) for _ in range(args.runs)]
+            errors = [result["error"] for result in results if "error" in result]
+            if errors:
+                print(f"{name:<16} failed: {errors[0]}")
+                continue
+            best = min(results, key=lambda result: result["seconds"])
+            print(f"{name:<16} {best['seconds'] * 1000:9.1f} ms  {best['max_rss_mb']:8.1f} MiB peak RSS growth  "
+                  f"{best['rows']} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""Benchmark: end-to-end load test with many concurrent candidates.
+
+Drives complete interviews through a headless ``TalentScoutChatbot``
+(no browser, no Streamlit runtime): each simulated candidate answers the
+basic questions and every technical question, the way the app's reruns
+do. So every turn includes the session store write, and waiting for the
+next technical question counts towards that turn. The OpenAI API is
+replaced by the local fake server in fake_openai.py, with configurable
+latency and failure rate, started in a subprocess unless --base-url is
+given.
+
+--batching turns on batched question generation (one JSON-mode request
+for the candidates arriving within the batch window); the number of API
+requests the fake server received is reported to compare both modes.
+
+Reports p50/p95/p99 per-turn latency (overall and per kind; the
+"transition" turn is the last basic answer, which waits for the first
+technical question), interviews
+per minute and memory per session. --json saves the results and
+--baseline compares a run against saved results.
+
+Usage:
+    python benchmarks/bench_load.py [--candidates 200] [--stacks 0] [--think-ms 200]
+                                    [--latency-ms 800] [--failure-rate 0.02]
+                                    [--json results.json] [--baseline results.json]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+WORDS = ("latency throughput cache index partition replica queue retry backoff thread "
+         "process lock schema migration deploy rollback metric alert consumer shard").split()
+STACKS = ["Python, Django, PostgreSQL", "JavaScript, React, Node.js", "Java, Spring Boot, Kafka",
+          "Go, Kubernetes, gRPC", "TypeScript, Angular, GraphQL", "C#, .NET, Azure"]
+
+
+def percentile(samples, fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def start_fake_api(args) -> "tuple[subprocess.Popen, str]":
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(PROJECT_ROOT, "benchmarks", "fake_openai.py"), "--port", "0",
+         "--latency-ms", str(args.latency_ms), "--chunk-ms", str(args.chunk_ms),
+         "--failure-rate", str(args.failure_rate)],
+        stdout=subprocess.PIPE, text=True
+    )
+    return process, process.stdout.readline().strip()
+
+
+def candidate_answers(chatbot, index: int, run_id: str, stack: str, rng: random.Random) -> list:
+    """Valid answers to the basic questions, in the chatbot's question order."""
+    from core.validation import QUESTION_IDS
+
+    by_id = {
+        "full_name": f"Candidate {index}",
+        "email": f"candidate{index}.{run_id}@example.com",
+        "phone": f"+49 151 {rng.randint(1000000, 9999999)}{index % 10}",
+        "experience_years": str(rng.randint(0, 20)),
+        "position": rng.choice(["Backend Engineer", "Frontend Engineer", "SRE"]),
+        "location": rng.choice(["Berlin", "Bangalore", "Toronto"]),
+        "tech_stack": stack,
+    }
+    return [by_id[QUESTION_IDS[question]] for question in chatbot.basic_questions]
+
+
+def run_interview(chatbot, index: int, args, run_id: str, turns: list, lock: threading.Lock) -> dict:
+    from core.interview_engine import InterviewPhases
+
+    rng = random.Random(index)
+    # Unique stacks miss the question bank and cache, so each interview calls the API
+    variant = index % args.stacks if args.stacks else index
+    stack = f"{STACKS[variant % len(STACKS)]}, Service{variant}"
+    session = chatbot.new_interview_session()
+    session_id = f"{run_id}-{index}"
+    version = 0
+    local_turns = []
+
+    def timed_turn(kind: str, action) -> None:
+        nonlocal version
+        started = time.perf_counter()
+        action()
+        version = chatbot.session_store.save(session_id, session.to_dict(), version)
+        local_turns.append((kind, time.perf_counter() - started))
+
+    def answer(text: str) -> None:
+        session.submit(text)
+        if session.phase == InterviewPhases.TECHNICAL:
+            # The next question must be on screen before the turn is over
+            session.refresh(timeout=None if session.waiting_for_questions else 0)
+
+    time.sleep(rng.uniform(0, args.ramp_s))
+    timed_turn("greeting", lambda: session.start(f"Hi! {chatbot.data_handler.get_candidate_count()} so far"))
+    answers = candidate_answers(chatbot, index, run_id, stack, rng)
+    for number, text in enumerate(answers, 1):
+        time.sleep(rng.uniform(0.5, 1.5) * args.think_ms / 1000)
+        # The last basic answer waits for the first technical question
+        timed_turn("transition" if number == len(answers) else "basic", lambda: answer(text))
+    while session.phase == InterviewPhases.TECHNICAL and not session.exited:
+        time.sleep(rng.uniform(0.5, 1.5) * args.think_ms / 1000)
+        words = " ".join(rng.choice(WORDS) for _ in range(args.answer_words))
+        timed_turn("technical", lambda: answer(f"In my experience {words}."))
+
+    started = time.perf_counter()
+    saved = chatbot.data_handler.save_candidate_data(session.candidate, session.tech_questions, session.tech_answers)
+    local_turns.append(("save", time.perf_counter() - started))
+
+    with lock:
+        turns.extend(local_turns)
+    return {"completed": session.completed and saved, "state": json.dumps(session.to_dict())}
+
+
+def session_memory(chatbot, states: list) -> float:
+    """Average bytes retained by an interview session restored from its JSON state."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = []
+    for state in states:
+        session = chatbot.new_interview_session()
+        session.restore(json.loads(state))
+        sessions.append(session)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained / max(len(sessions), 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=200)
+    parser.add_argument("--stacks", type=int, default=0,
+                        help="distinct tech stacks shared by candidates (0: every stack unique)")
+    parser.add_argument("--think-ms", type=float, default=200)
+    parser.add_argument("--ramp-s", type=float, default=5)
+    parser.add_argument("--answer-words", type=int, default=60)
+    parser.add_argument("--latency-ms", type=float, default=800)
+    parser.add_argument("--chunk-ms", type=float, default=20)
+    parser.add_argument("--failure-rate", type=float, default=0.02)
+    parser.add_argument("--batching", action="store_true", help="batch question generation requests")
+    parser.add_argument("--base-url", help="use a running (fake) API instead of starting one")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="compare against results saved with --json")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server, base_url = start_fake_api(args)
+
+    # Removed with everything the run stored (databases, CSV, archive) at the end
+    data_dir = tempfile.TemporaryDirectory(prefix="talentscout-load-")
+    # Config reads the environment on import, so it has to be set up first
+    os.environ.update({"OPENAI_API_KEY": "sk-load-test", "OPENAI_BASE_URL": base_url, "DATA_DIR": data_dir.name})
+    os.environ.setdefault("LLM_REQUESTS_PER_MINUTE", "100000")
+    if args.batching:
+        os.environ["QUESTION_BATCHING_ENABLED"] = "true"
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    try:
+        from core.chatbot_logic import TalentScoutChatbot
+
+        chatbot = TalentScoutChatbot()
+        run_id = f"{int(time.time())}"
+        turns, lock = [], threading.Lock()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.candidates, thread_name_prefix="candidate") as pool:
+            futures = [pool.submit(run_interview, chatbot, i, args, run_id, turns, lock)
+                       for i in range(args.candidates)]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"interview failed: {e!r}")
+        elapsed = time.perf_counter() - started
+
+        completed = [result for result in results if result["completed"]]
+        memory = session_memory(chatbot, [result["state"] for result in completed])
+        chatbot.data_handler.close()
+        api_requests = None
+        if server is not None:
+            with urllib.request.urlopen(base_url.rsplit("/v1", 1)[0] + "/stats") as response:
+                api_requests = json.load(response)["requests"]
+    finally:
+        if server is not None:
+            server.terminate()
+        data_dir.cleanup()
+
+    report = {
+        "candidates": args.candidates,
+        "completed": len(completed),
+        "elapsed_s": elapsed,
+        "interviews_per_minute": len(completed) / elapsed * 60,
+        "session_kib": memory / 1024,
+        "api_requests": api_requests,
+        "turns": {},
+    }
+    kinds = ["all", "greeting", "basic", "transition", "technical", "save"]
+    for kind in kinds:
+        samples = [seconds * 1000 for turn_kind, seconds in turns if kind in ("all", turn_kind)]
+        report["turns"][kind] = {
+            "count": len(samples),
+            "p50_ms": percentile(samples, 0.50),
+            "p95_ms": percentile(samples, 0.95),
+            "p99_ms": percentile(samples, 0.99),
+        }
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    def delta(value: float, old: float) -> str:
+        return f" ({(value - old) / old * 100:+.0f}%)" if baseline and old else ""
+
+    print(f"{report['completed']}/{args.candidates} interviews completed in {elapsed:.1f}s "
+          f"(fake API: {args.latency_ms:.0f} ms latency, {args.failure_rate:.0%} failures)\n")
+    print(f"{'turn':<10} {'count':>6} {'p50':>18} {'p95':>18} {'p99':>18}")
+    for kind in kinds:
+        stats = report["turns"][kind]
+        old = baseline["turns"][kind] if baseline else {}
+        cells = [f"{stats[key]:.1f}ms{delta(stats[key], old.get(key, 0))}" for key in ("p50_ms", "p95_ms", "p99_ms")]
+        print(f"{kind:<10} {stats['count']:>6} {cells[0]:>18} {cells[1]:>18} {cells[2]:>18}")
+    print(f"\ninterviews per minute: {report['interviews_per_minute']:.1f}"
+          f"{delta(report['interviews_per_minute'], baseline['interviews_per_minute'] if baseline else 0)}")
+    if api_requests is not None:
+        print(f"API requests:          {api_requests} ({api_requests / args.candidates:.2f} per candidate)")
+    print(f"memory per session:    {report['session_kib']:.1f} KiB"
+          f"{delta(report['session_kib'], baseline['session_kib'] if baseline else 0)}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0 if len(completed) == args.candidates else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Benchmark: overhead of the metrics instrumentation.
+
+Times the recording calls used on the hot paths (a counter increment and
+a timing span) with metrics disabled and enabled, next to an empty loop,
+and prints a sample of the Prometheus output. Exits non-zero if the
+disabled mode costs more than the budget per call.
+
+Usage:
+    python benchmarks/bench_metrics.py [--calls N] [--budget-ns NS]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.metrics import Metrics  # noqa: E402
+
+
+def per_call_ns(body, calls: int) -> float:
+    started = time.perf_counter()
+    body(calls)
+    return (time.perf_counter() - started) / calls * 1e9
+
+
+def empty(calls: int) -> None:
+    for _ in range(calls):
+        pass
+
+
+def counters(registry: Metrics):
+    def body(calls: int) -> None:
+        for _ in range(calls):
+            registry.inc("saves", outcome="ok")
+    return body
+
+
+def spans(registry: Metrics):
+    def body(calls: int) -> None:
+        for _ in range(calls):
+            with registry.span("save_seconds", durable=False):
+                pass
+    return body
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500000)
+    parser.add_argument("--budget-ns", type=float, default=1000.0)
+    args = parser.parse_args()
+
+    baseline = per_call_ns(empty, args.calls)
+    disabled, enabled = Metrics(enabled=False), Metrics(enabled=True)
+    results = {
+        "counter": (per_call_ns(counters(disabled), args.calls), per_call_ns(counters(enabled), args.calls)),
+        "span": (per_call_ns(spans(disabled), args.calls), per_call_ns(spans(enabled), args.calls)),
+    }
+
+    print(f"{args.calls} calls each, empty loop {baseline:.0f} ns/iteration\n")
+    print(f"{'call':<10} {'disabled':>12} {'enabled':>12}")
+    for name, (off, on) in results.items():
+        print(f"{name:<10} {off - baseline:>9.0f} ns {on - baseline:>9.0f} ns")
+
+    print("\nSample Prometheus output:\n")
+    print("\n".join(enabled.render_prometheus().splitlines()[:6]))
+
+    over = [name for name, (off, _) in results.items() if off - baseline > args.budget_ns]
+    if over:
+        print(f"\nFAIL: disabled {', '.join(over)} above {args.budget_ns:.0f} ns per call")
+        return 1
+    print(f"\nOK: disabled instrumentation within {args.budget_ns:.0f} ns per call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Benchmark: technical question parser correctness and throughput.
+
+Runs the parser over a set of pathological LLM outputs (very long
+responses, no numbering, markdown bullets, bold numbering, CRLF line
+endings), checks each result against the expected questions, and times
+the one-shot parser, the incremental stream parser fed in small chunks,
+and the previous per-line implementation for comparison.
+
+Usage:
+    python benchmarks/bench_parser.py [--iterations N] [--chunk-size N]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from utils import TechQuestionStreamParser, parse_tech_questions  # noqa: E402
+
+TYPICAL = """Here are five questions for the candidate:
+
+1. What is the difference between a list and a tuple in Python?
+2. How does Django's ORM translate querysets into SQL?
+3. Explain how you would index a PostgreSQL table for range queries.
+4. Describe a situation where you used caching to fix a slow endpoint.
+5. Why would you choose async views over sync views?
+"""
+
+LONG_RESPONSE = (
+    "Sure! Before the questions, some context about the role. "
+    + "The team maintains several services and values clean code. " * 400
+    + "\n" + "\n".join(
+        f"Background note {i}: the platform handles traffic spikes daily." for i in range(2000)
+    )
+    + "\n" + TYPICAL
+)
+
+NO_NUMBERING = (
+    "1. Python basics 2. Django middleware 3. SQL joins 4. Redis eviction 5. Docker layers"
+)
+
+MARKDOWN_BULLETS = """### Technical questions
+- What is a Python generator?
+- How do React hooks manage state?
+* Explain the virtual DOM.
+• Describe how you test async code.
+- Why use TypeScript over JavaScript?
+"""
+
+BOLD_NUMBERING = """**1.** What is dependency injection?
+**2.** How does Spring Boot auto-configuration work?
+**3)** Explain JPA lazy loading.
+"""
+
+CRLF = "1. What is a goroutine?\r\n2. How do channels synchronize?\r\n3. Explain the Go scheduler.\r\n"
+
+CASES = {
+    "typical": (TYPICAL, [
+        "What is the difference between a list and a tuple in Python?",
+        "How does Django's ORM translate querysets into SQL?",
+        "Explain how you would index a PostgreSQL table for range queries.",
+        "Describe a situation where you used caching to fix a slow endpoint.",
+        "Why would you choose async views over sync views?",
+    ]),
+    "long_response": (LONG_RESPONSE, None),
+    "no_numbering": (NO_NUMBERING, [
+        "Python basics", "Django middleware", "SQL joins", "Redis eviction", "Docker layers",
+    ]),
+    "markdown_bullets": (MARKDOWN_BULLETS, [
+        "What is a Python generator?",
+        "How do React hooks manage state?",
+        "Explain the virtual DOM.",
+        "Describe how you test async code.",
+        "Why use TypeScript over JavaScript?",
+    ]),
+    "bold_numbering": (BOLD_NUMBERING, [
+        "What is dependency injection?",
+        "How does Spring Boot auto-configuration work?",
+        "Explain JPA lazy loading.",
+    ]),
+    "crlf": (CRLF, [
+        "What is a goroutine?", "How do channels synchronize?", "Explain the Go scheduler.",
+    ]),
+}
+
+
+def legacy_parse_tech_questions(tech_response, max_questions=5):
+    """The previous implementation, kept here as the throughput baseline."""
+    questions = []
+    lines = tech_response.split('\n')
+
+    for line in lines:
+        line = line.strip()
+        if line:
+            clean_line = re.sub(r'^\d+[.)\-]\s*', '', line)
+            if clean_line and ('?' in clean_line or any(word in clean_line.lower() for word in ['what', 'how', 'why', 'when', 'where', 'explain', 'describe', 'discuss'])):
+                questions.append(clean_line)
+
+    if len(questions) < 3:
+        questions = [q.strip() for q in re.split(r'\d+[.)\-]', tech_response) if q.strip()]
+
+    return questions[:max_questions]
+
+
+def parse_streamed(text, chunk_size):
+    parser = TechQuestionStreamParser()
+    questions = []
+    for start in range(0, len(text), chunk_size):
+        questions.extend(parser.feed(text[start:start + chunk_size]))
+    questions.extend(parser.close())
+    return questions
+
+
+def check_correctness(chunk_size: int) -> bool:
+    ok = True
+    for name, (text, expected) in CASES.items():
+        parsed = parse_tech_questions(text)
+        streamed = parse_streamed(text, chunk_size)
+        # The long response buries the questions; only the parsers must agree
+        passed = streamed == parsed and (expected is None or parsed == expected)
+        ok = ok and passed
+        print(f"{name:<17} {'ok' if passed else 'MISMATCH'} ({len(parsed)} questions)")
+        if not passed:
+            print(f"  expected: {expected}\n  parsed:   {parsed}\n  streamed: {streamed}")
+    return ok
+
+
+def bench_throughput(iterations: int, chunk_size: int) -> None:
+    parsers = {
+        "legacy": legacy_parse_tech_questions,
+        "parse_tech_questions": parse_tech_questions,
+        f"stream ({chunk_size}-char chunks)": lambda text: parse_streamed(text, chunk_size),
+    }
+    for name, (text, _) in CASES.items():
+        size_kb = len(text.encode("utf-8")) / 1024
+        print(f"\n{name} ({size_kb:.1f} KiB)")
+        for label, parse in parsers.items():
+            started = time.perf_counter()
+            for _ in range(iterations):
+                parse(text)
+            elapsed = time.perf_counter() - started
+            mb_per_s = size_kb * iterations / 1024 / elapsed
+            print(f"  {label:<28} {elapsed / iterations * 1e6:9.1f} us/parse  {mb_per_s:8.1f} MiB/s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=8, help="stream chunk size in characters")
+    args = parser.parse_args()
+
+    ok = check_correctness(args.chunk_size)
+    bench_throughput(args.iterations, args.chunk_size)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
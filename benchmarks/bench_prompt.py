@@ -0,0 +1,130 @@
+"""Benchmark: prompt size and completion budget of question generation.
+
+Compares the compacted question prompt (fixed system instructions, a
+de-duplicated and truncated tech stack, max_tokens derived from the
+question count) with the previous prompt (long per-call instruction
+block, raw tech stack, max_tokens=800) for typical and pasted-essay tech
+stacks.
+
+With --base-url (and OPENAI_API_KEY) both variants are also sent to that
+endpoint and their latency is compared. The fake server in fake_openai.py
+does not model token costs, so latency only means something against the
+real API.
+
+Usage:
+    python benchmarks/bench_prompt.py [--questions 5] [--base-url URL --runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.prompt_templates import PromptTemplates, estimate_tokens  # noqa: E402
+
+LEGACY_SYSTEM_PROMPT = "You are a professional technical interviewer."
+LEGACY_PROMPT = """Generate exactly 5 technical interview questions for a candidate with the following tech stack: {tech_stack}
+
+Requirements:
+- Each question should be on a separate line
+- Number each question (1., 2., 3., etc.)
+- Focus on practical experience and problem-solving
+- Mix of conceptual understanding and real-world application
+- Difficulty level: intermediate
+- Avoid questions requiring code implementation
+- Make questions specific to the mentioned technologies
+- Questions should be suitable for a 15-20 minute interview
+
+Format example:
+1. Question about technology A
+2. Question about technology B
+3. Question about problem-solving
+4. Question about best practices
+5. Question about experience/challenges
+
+Generate the questions now:"""
+LEGACY_MAX_TOKENS = 800
+
+STACKS = {
+    "short": "Python, Django, PostgreSQL",
+    "repeated": "Python, python3, Django, django, Postgres, PostgreSQL, Docker, docker, JS, JavaScript, React",
+    "long list": ", ".join(
+        ["Python", "Django", "Flask", "FastAPI", "PostgreSQL", "MySQL", "Redis", "Celery", "RabbitMQ",
+         "Kafka", "Docker", "Kubernetes", "Helm", "Terraform", "AWS", "GCP", "React", "TypeScript",
+         "Next.js", "GraphQL", "gRPC", "Elasticsearch", "Prometheus", "Grafana", "Airflow", "Spark"] * 2
+    ),
+    "pasted essay": (
+        "I have been working as a software engineer for eight years, mostly on backend services "
+        "written in Python and Go, where I designed event-driven systems on Kafka and maintained "
+        "PostgreSQL clusters. Before that I built single page applications in React and Angular "
+    ) * 6,
+}
+
+
+def legacy_messages(tech_stack: str):
+    return [
+        {"role": "system", "content": LEGACY_SYSTEM_PROMPT},
+        {"role": "user", "content": LEGACY_PROMPT.format(tech_stack=tech_stack)},
+    ]
+
+
+def prompt_tokens(messages) -> int:
+    return sum(estimate_tokens(message["content"]) for message in messages)
+
+
+def measure_latency(base_url: str, variants, runs: int):
+    from config import Config
+    from core.llm_gateway import LLMGateway
+
+    gateway = LLMGateway(api_key=Config.OPENAI_API_KEY, model=Config.OPENAI_MODEL, base_url=base_url)
+    # Warm up the connection pool so the first variant is not charged for it
+    messages, max_tokens = next(iter(variants.values()))
+    gateway.complete_sync(messages, deadline=60, max_tokens=max_tokens)
+    results = {}
+    for name, (messages, max_tokens) in variants.items():
+        timings, completion_tokens = [], []
+        for _ in range(runs):
+            usage = {}
+            started = time.perf_counter()
+            gateway.complete_sync(messages, deadline=60, usage=usage, temperature=0.7, max_tokens=max_tokens)
+            timings.append(time.perf_counter() - started)
+            completion_tokens.append(usage.get("completion", 0))
+        results[name] = (statistics.median(timings) * 1000, statistics.median(completion_tokens))
+    gateway.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--base-url", help="chat completions endpoint to measure latency against")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    compact_max_tokens = PromptTemplates.tech_questions_max_tokens(args.questions)
+    shared_prefix = estimate_tokens(PromptTemplates.tech_questions_system_prompt(args.questions))
+    print(f"max_tokens: {LEGACY_MAX_TOKENS} -> {compact_max_tokens}; "
+          f"fixed system prefix: ~{shared_prefix} tokens\n")
+    print(f"{'tech stack':<14} {'legacy':>8} {'compact':>8} {'saved':>7}   (estimated prompt tokens)")
+    for name, stack in STACKS.items():
+        legacy = prompt_tokens(legacy_messages(stack))
+        compact = prompt_tokens(PromptTemplates.tech_questions_messages(stack, args.questions))
+        print(f"{name:<14} {legacy:>8} {compact:>8} {(legacy - compact) / legacy:>7.0%}")
+
+    if args.base_url:
+        stack = STACKS["short"]
+        results = measure_latency(args.base_url, {
+            "legacy": (legacy_messages(stack), LEGACY_MAX_TOKENS),
+            "compact": (PromptTemplates.tech_questions_messages(stack, args.questions), compact_max_tokens),
+        }, args.runs)
+        print(f"\n{'variant':<10} {'p50 latency':>12} {'completion tokens':>18}")
+        for name, (latency, tokens) in results.items():
+            print(f"{name:<10} {latency:>10.0f}ms {tokens:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark: per-save serialization latency and module import time.
+
+Compares the csv-module row serializer in core.schema against the old
+one-row pandas DataFrame path, and measures how long importing the data
+layer takes now that pandas is loaded lazily.
+
+Usage:
+    python benchmarks/bench_save.py [--iterations N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.schema import CSV_COLUMNS, build_candidate_record, write_records  # noqa: E402
+
+SAMPLE_CANDIDATE = {
+    "What is your full name?": "Jane Doe",
+    "What is your email address?": "jane@example.com",
+    "What is your phone number?": "+1 555 010 2030",
+    "How many years of experience do you have?": "6",
+    "Which position are you applying for?": "Backend Engineer",
+    "Where are you currently located?": "Berlin",
+    "Please list your tech stack (languages, frameworks, and tools you know).": "Python, Django, PostgreSQL",
+}
+SAMPLE_QUESTIONS = [f"Question {i} about distributed systems and caching?" for i in range(1, 6)]
+SAMPLE_ANSWERS = {f"Tech Question {i}": "A detailed answer " * 40 for i in range(1, 6)}
+
+
+def time_per_call(func, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def bench_serializers(iterations: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "csv_module.csv")
+        pandas_path = os.path.join(tmp, "pandas.csv")
+
+        def save_with_csv_module():
+            record = build_candidate_record(SAMPLE_CANDIDATE, SAMPLE_QUESTIONS, SAMPLE_ANSWERS)
+            with open(csv_path, "a", encoding="utf-8", newline="") as f:
+                write_records(f, [record], header=False)
+
+        print(f"csv module serializer: {time_per_call(save_with_csv_module, iterations):.3f} ms/save")
+
+        try:
+            import pandas as pd
+        except ImportError:
+            print("pandas serializer:     skipped (pandas not installed)")
+            return
+
+        def save_with_pandas():
+            record = build_candidate_record(SAMPLE_CANDIDATE, SAMPLE_QUESTIONS, SAMPLE_ANSWERS)
+            df = pd.DataFrame([record], columns=CSV_COLUMNS)
+            df.to_csv(pandas_path, mode="a", index=False, header=False, encoding="utf-8")
+
+        print(f"pandas serializer:     {time_per_call(save_with_pandas, iterations):.3f} ms/save")
+
+
+def bench_import(module: str, runs: int = 5) -> None:
+    """Import a module in fresh interpreters and report the best wall time."""
+    code = (
+        "import sys, time; t = time.perf_counter(); "
+        f"import {module}; "
+        "print(time.perf_counter() - t, 'pandas' in sys.modules)"
+    )
+    timings = []
+    pandas_loaded = False
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=PROJECT_ROOT,
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            print(f"import {module}: skipped (not importable)")
+            return
+        elapsed, loaded = result.stdout.split()
+        timings.append(float(elapsed) * 1000)
+        pandas_loaded = loaded == "True"
+    print(f"import {module}: {min(timings):.1f} ms (pandas loaded: {pandas_loaded})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    bench_serializers(args.iterations)
+    bench_import("core.data_handler")
+    bench_import("pandas")
+
+
+if __name__ == "__main__":
+    main()
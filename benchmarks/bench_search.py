@@ -0,0 +1,123 @@
+"""Benchmark: ranked full-text search over technical answers.
+
+Builds the FTS5 answer index for a synthetic set of interviews, then
+reports p50/p95 latency of ``AnswerSearchIndex.search`` for typical
+recruiter queries next to a substring scan over all answers (what
+filtering a loaded DataFrame amounts to). Exits non-zero if any query's
+p95 exceeds the latency budget.
+
+Usage:
+    python benchmarks/bench_search.py [--interviews N] [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.answer_search import ANSWER_HEADERS, AnswerSearchIndex  # noqa: E402
+
+TOPICS = [
+    "Kafka partitions let consumers in a group scale reads while keeping per-key ordering",
+    "React hooks such as useEffect and useMemo replace most class lifecycle methods",
+    "I would add a composite index on the PostgreSQL table to avoid sequential scans",
+    "Idempotent retries with exponential backoff protect the payment service",
+    "Docker multi-stage builds keep the production image small",
+    "Kubernetes readiness probes stop traffic until the pod has warmed its cache",
+    "Redis eviction policies decide which keys go first under memory pressure",
+    "Python generators stream large files without loading them into memory",
+    "The Django ORM select_related call removes the N+1 query problem",
+    "TypeScript generics keep the API client type safe",
+    "Terraform state locking prevents concurrent applies from corrupting infrastructure",
+    "GraphQL resolvers batch database lookups with a dataloader",
+]
+FILLER = [
+    "In my last project", "We measured this in production", "The trade-off was latency",
+    "This reduced our cloud bill", "Code review caught the regression early",
+    "We documented the decision in an ADR", "Monitoring alerted us within minutes",
+]
+QUERIES = ["Kafka partitions", "React hooks", "idempotent retries", "database index", "production", "zookeeper quorum"]
+
+
+def synthetic_records(count: int, rng: random.Random):
+    for i in range(count):
+        record = {
+            "interview_date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 10:00:00",
+            "What is your full name?": f"Candidate {i}",
+            "What is your email address?": f"candidate{i}@example.com",
+            "Which position are you applying for?": rng.choice(["Backend Engineer", "Frontend Engineer", "SRE"]),
+        }
+        for header in ANSWER_HEADERS:
+            sentences = rng.sample(TOPICS, 2) + rng.sample(FILLER, 3)
+            rng.shuffle(sentences)
+            record[header] = ". ".join(sentences) + "."
+        yield record
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interviews", type=int, default=100000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        index = AnswerSearchIndex(os.path.join(tmp, "answer_index.db"))
+        texts = []
+        started = time.perf_counter()
+        batch = []
+        for record in synthetic_records(args.interviews, rng):
+            batch.append(record)
+            texts.append("\n".join(record[header] for header in ANSWER_HEADERS).lower())
+            if len(batch) == 5000:
+                index.add_many(batch)
+                batch = []
+        index.add_many(batch)
+        print(f"indexed {index.count()} interviews in {time.perf_counter() - started:.1f}s "
+              f"({os.path.getsize(index.db_path) / 1024 / 1024:.1f} MiB)\n")
+
+        over_budget = []
+        print(f"{'query':<20} {'hits':>5} {'fts p50':>10} {'fts p95':>10} {'scan p50':>10}")
+        for query in QUERIES:
+            timings = []
+            for _ in range(args.runs):
+                t = time.perf_counter()
+                hits = index.search(query, args.limit)
+                timings.append((time.perf_counter() - t) * 1000)
+
+            terms = query.lower().split()
+            scan_timings = []
+            for _ in range(max(args.runs // 5, 1)):
+                t = time.perf_counter()
+                [text for text in texts if all(term in text for term in terms)][:args.limit]
+                scan_timings.append((time.perf_counter() - t) * 1000)
+
+            p95 = percentile(timings, 0.95)
+            if p95 > args.budget_ms:
+                over_budget.append(query)
+            print(f"{query:<20} {len(hits):>5} {statistics.median(timings):>8.2f}ms {p95:>8.2f}ms "
+                  f"{statistics.median(scan_timings):>8.2f}ms")
+        index.close()
+
+    if over_budget:
+        print(f"\nFAIL: p95 above {args.budget_ms:.0f} ms for {', '.join(over_budget)}")
+        return 1
+    print(f"\nOK: every query p95 within {args.budget_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Benchmark: per-session memory of the interview engine.
+
+Drives N concurrent interviews to completion with realistic, long
+technical answers and measures the heap they retain with tracemalloc.
+The same interviews are also rebuilt in the previous layout (a dict per
+chat message, a dict of "Tech Question N" answers) to show the overhead
+that layout added on top.
+
+Usage:
+    python benchmarks/bench_session_memory.py [--sessions N] [--answer-chars N]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.interview_engine import InterviewSession  # noqa: E402
+from core.question_feed import QuestionFeed  # noqa: E402
+from core.schema import CSV_COLUMNS  # noqa: E402
+
+BASIC_QUESTIONS = CSV_COLUMNS[1:8]
+WORDS = ("latency throughput cache index partition replica queue retry backoff "
+         "thread process lock schema migration deploy rollback metric alert").split()
+
+
+def finished_feed(questions):
+    feed = QuestionFeed()
+    for question in questions:
+        feed.publish(question)
+    feed.finish()
+    return feed
+
+
+def run_interview(session_id: int, answer_chars: int, rng: random.Random) -> InterviewSession:
+    questions = [f"Question {i} for session {session_id}: how would you tune {rng.choice(WORDS)}?"
+                 for i in range(1, 6)]
+    session = InterviewSession(
+        BASIC_QUESTIONS, BASIC_QUESTIONS[-1], lambda stack: finished_feed(questions)
+    )
+    session.start(f"👋 Hi! I'm TalentScout. We've helped {session_id} candidates so far!")
+    basic_answers = [
+        f"Candidate {session_id}", f"candidate{session_id}@example.com", f"+1555{session_id:07d}",
+        str(rng.randint(0, 20)), "Backend Engineer", "Berlin", "Python, Django, PostgreSQL, Redis",
+    ]
+    for answer in basic_answers:
+        session.submit(answer)
+    session.refresh(timeout=0)
+    while not session.completed:
+        text = " ".join(rng.choice(WORDS) for _ in range(answer_chars // 6))
+        session.submit(text[:answer_chars])
+    return session
+
+
+def legacy_layout(session: InterviewSession) -> dict:
+    """The same interview in the previous session-state shape."""
+    return {
+        "messages": [{"role": message.role, "content": message.content} for message in session.messages],
+        "candidate_data": dict(session.candidate),
+        "tech_questions": list(session.tech_questions),
+        "tech_answers": {f"Tech Question {i}": answer for i, answer in enumerate(session.answers, 1)},
+        "step": session.step,
+        "tech_step": session.tech_step,
+        "phase": session.phase,
+    }
+
+
+def measure(build, count: int):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(i) for i in range(count)]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return objects, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--answer-chars", type=int, default=1200)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    sessions, engine_bytes = measure(lambda i: run_interview(i, args.answer_chars, rng), args.sessions)
+    # Legacy layouts share the answer strings with the sessions, so only their overhead is counted
+    legacy, legacy_overhead = measure(lambda i: legacy_layout(sessions[i]), args.sessions)
+
+    text_bytes = sum(
+        sys.getsizeof(answer) for session in sessions for answer in session.answers
+    ) / args.sessions
+    engine_per_session = engine_bytes / args.sessions
+    structure = engine_per_session - text_bytes
+
+    print(f"{args.sessions} completed interviews, {args.answer_chars}-char technical answers\n")
+    print(f"engine session (total):       {engine_per_session / 1024:8.1f} KiB/session")
+    print(f"  of which answer text:       {text_bytes / 1024:8.1f} KiB/session")
+    print(f"  structure and short text:   {structure / 1024:8.1f} KiB/session")
+    print(f"legacy layout structure:      {(structure + legacy_overhead / args.sessions) / 1024:8.1f} KiB/session "
+          f"(+{legacy_overhead / args.sessions / 1024:.1f} KiB of dicts and keys)")
+    print(f"total for {args.sessions} sessions:      {engine_bytes / 1024 / 1024:8.1f} MiB")
+    print(f"chat messages per session:    {len(sessions[0].messages)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Local stand-in for the OpenAI chat completions API, for load tests.
+
+Serves ``POST /v1/chat/completions`` (streaming and non-streaming) with
+numbered technical questions, or in JSON mode one question array per
+numbered candidate, after a configurable time to first token and
+per-chunk delay. A configurable fraction of requests fails with an HTTP
+error, so retries and fallbacks are exercised too. ``GET /stats``
+returns request and failure counts. Point the app at it with
+``OPENAI_BASE_URL=http://127.0.0.1:PORT/v1``.
+
+Usage:
+    python benchmarks/fake_openai.py [--port 8765] [--latency-ms 800] [--chunk-ms 20]
+                                     [--failure-rate 0.02] [--failure-status 500]
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TOPICS = [
+    "how you would design a rate limiter",
+    "the trade-offs between SQL and NoSQL storage",
+    "how you debug a memory leak in production",
+    "how you would make an API idempotent",
+    "how you structure tests for asynchronous code",
+    "how caching can serve stale data and how you prevent it",
+    "how you would roll back a failed deployment",
+]
+
+
+def question_text(rng: random.Random, count: int = 5) -> str:
+    return "".join(
+        f"{i}. Explain {topic} in your current tech stack?\n"
+        for i, topic in enumerate(rng.sample(TOPICS, count), 1)
+    )
+
+
+def batch_json(rng: random.Random, prompt: str, count: int = 5) -> str:
+    """JSON-mode reply: a question array for every numbered candidate in the prompt."""
+    candidates = re.findall(r"^(\d+)\.", prompt, re.MULTILINE)
+    return json.dumps({
+        number: [f"Explain {topic} in your current tech stack?" for topic in rng.sample(TOPICS, count)]
+        for number in candidates
+    })
+
+
+def make_handler(latency: float, chunk_delay: float, failure_rate: float, failure_status: int, seed: int):
+    rng = random.Random(seed)
+    rng_lock = threading.Lock()
+    stats = {"requests": 0, "failures": 0}
+
+    class FakeOpenAIHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if self.path == "/stats":
+                with rng_lock:
+                    self._send_json(200, dict(stats))
+            else:
+                self._send_json(404, {"error": {"message": "not found"}})
+
+        def do_POST(self) -> None:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            json_mode = (body.get("response_format") or {}).get("type") == "json_object"
+            prompt = body.get("messages", [{}])[-1].get("content", "")
+            with rng_lock:
+                stats["requests"] += 1
+                failed = rng.random() < failure_rate
+                jitter = rng.uniform(0.75, 1.25)
+                text = batch_json(rng, prompt) if json_mode else question_text(rng)
+            if not self.path.endswith("/chat/completions"):
+                self._send_json(404, {"error": {"message": "not found"}})
+                return
+
+            time.sleep(latency * jitter)
+            if failed:
+                with rng_lock:
+                    stats["failures"] += 1
+                self._send_json(failure_status, {"error": {"message": "simulated failure", "type": "server_error"}})
+                return
+
+            model = body.get("model", "fake-model")
+            prompt_tokens = sum(len(m.get("content", "")) for m in body.get("messages", [])) // 4
+            usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(text) // 4,
+                     "total_tokens": prompt_tokens + len(text) // 4}
+            if body.get("stream"):
+                self._stream(model, text, usage, bool((body.get("stream_options") or {}).get("include_usage")))
+            else:
+                self._send_json(200, {
+                    "id": f"chatcmpl-{uuid.uuid4().hex}", "object": "chat.completion",
+                    "created": int(time.time()), "model": model,
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": text},
+                                 "finish_reason": "stop"}],
+                    "usage": usage,
+                })
+
+        def _stream(self, model: str, text: str, usage: dict, include_usage: bool) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+            def event(choices, extra=None) -> None:
+                payload = {"id": completion_id, "object": "chat.completion.chunk",
+                           "created": int(time.time()), "model": model, "choices": choices, **(extra or {})}
+                self._write_chunk(f"data: {json.dumps(payload)}\n\n")
+
+            words = text.split(" ")
+            for i in range(0, len(words), 4):
+                piece = " ".join(words[i:i + 4]) + (" " if i + 4 < len(words) else "")
+                event([{"index": 0, "delta": {"content": piece}, "finish_reason": None}])
+                time.sleep(chunk_delay)
+            event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+            if include_usage:
+                event([], {"usage": usage})
+            self._write_chunk("data: [DONE]\n\n")
+            self._write_chunk("")
+
+        def _write_chunk(self, data: str) -> None:
+            encoded = data.encode("utf-8")
+            self.wfile.write(f"{len(encoded):x}\r\n".encode("ascii") + encoded + b"\r\n")
+            self.wfile.flush()
+
+        def _send_json(self, status: int, payload: dict) -> None:
+            encoded = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    FakeOpenAIHandler.stats = stats
+    return FakeOpenAIHandler
+
+
+def start_server(port: int = 0, latency: float = 0.8, chunk_delay: float = 0.02, failure_rate: float = 0.0,
+                 failure_status: int = 500, seed: int = 1) -> ThreadingHTTPServer:
+    """Start the fake API on 127.0.0.1 in a daemon thread (port 0 picks a free port)."""
+    handler = make_handler(latency, chunk_delay, failure_rate, failure_status, seed)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-openai", daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=800)
+    parser.add_argument("--chunk-ms", type=float, default=20)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-status", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.latency_ms / 1000, args.chunk_ms / 1000,
+                          args.failure_rate, args.failure_status, args.seed)
+    # The first line tells a parent process which port was bound
+    print(f"http://127.0.0.1:{server.server_address[1]}/v1", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
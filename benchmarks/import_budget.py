@@ -0,0 +1,109 @@
+"""Startup-time budget check for the application entry point.
+
+Imports the modules app.py loads on first paint in a fresh interpreter and
+fails (exit code 1) if they take longer than the budget, or if any of the
+heavy modules that are meant to load lazily (openai, pandas) get imported.
+Streamlit itself is imported first and excluded from the measurement,
+since the entry point cannot avoid it.
+
+Usage:
+    python benchmarks/import_budget.py [--budget-ms 300] [--profile 15]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules app.py imports before the first question is shown
+ENTRY_MODULES = ["config", "core.chatbot_logic"]
+LAZY_MODULES = ["openai", "pandas"]
+
+PROBE = """
+import json, sys, time
+try:
+    import streamlit
+except ImportError:
+    pass
+before = set(sys.modules)
+started = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - started
+loaded = set(sys.modules) - before
+print(json.dumps({{
+    "elapsed_ms": elapsed * 1000,
+    "lazy_loaded": sorted(m for m in {lazy!r} if m in loaded),
+}}))
+"""
+
+
+def measure(modules, runs: int) -> dict:
+    """Best-of-N import time for the given modules in fresh interpreters."""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(modules=modules, lazy=LAZY_MODULES)],
+            cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        sample = json.loads(result.stdout)
+        if best is None or sample["elapsed_ms"] < best["elapsed_ms"]:
+            best = sample
+    return best
+
+
+def profile(modules, top: int) -> None:
+    """Print the slowest imports reported by ``python -X importtime``."""
+    code = "; ".join(f"import {name}" for name in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        rows.append((int(cumulative_us), int(self_us), name))
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_BUDGET_MS", "300")))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--profile", type=int, metavar="N", default=0,
+                        help="also print the N slowest imports")
+    args = parser.parse_args()
+
+    if args.profile:
+        profile(ENTRY_MODULES, args.profile)
+
+    try:
+        result = measure(ENTRY_MODULES, args.runs)
+    except RuntimeError as e:
+        print(f"Could not import entry modules: {e}")
+        return 1
+
+    print(f"Entry-point import: {result['elapsed_ms']:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    failed = False
+    if result["lazy_loaded"]:
+        print(f"FAIL: lazily-loaded modules imported at startup: {', '.join(result['lazy_loaded'])}")
+        failed = True
+    if result["elapsed_ms"] > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
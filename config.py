@@ -17,6 +17,15 @@ class Config:
     # OpenAI API Configuration
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     OPENAI_MODEL = "gpt-4o-mini"
+    OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+    
+    # LLM Gateway Limits
+    LLM_REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", "20"))
+    LLM_DEADLINE_SECONDS = float(os.getenv("LLM_DEADLINE_SECONDS", "30"))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+    LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
     
     # Application Settings
     APP_TITLE = os.getenv("APP_TITLE", "TalentScout Hiring Assistant")
@@ -27,10 +36,69 @@ class Config:
     MAX_TECH_QUESTIONS = int(os.getenv("MAX_TECH_QUESTIONS", "5"))
     MIN_ANSWER_LENGTH = int(os.getenv("MIN_ANSWER_LENGTH", "10"))
     MAX_EXPERIENCE_YEARS = int(os.getenv("MAX_EXPERIENCE_YEARS", "50"))
+    # Chat messages rendered as bubbles on each rerun; older ones are collapsed
+    CHAT_HISTORY_VISIBLE = int(os.getenv("CHAT_HISTORY_VISIBLE", "10"))
+    # Country calling code assumed for 10-digit phone numbers given without one
+    PHONE_DEFAULT_COUNTRY_CODE = os.getenv("PHONE_DEFAULT_COUNTRY_CODE", "1")
+    # Position of the tech stack question among the basic questions. Asking it
+    # early lets question generation run while the remaining answers are typed.
+    TECH_STACK_QUESTION_INDEX = int(os.getenv("TECH_STACK_QUESTION_INDEX", "3"))
+    # Sized like the gateway's concurrency limit, so prefetches wait there
+    # (within their deadline) rather than in the worker pool's queue
+    QUESTION_PREFETCH_WORKERS = int(os.getenv("QUESTION_PREFETCH_WORKERS", str(LLM_MAX_CONCURRENCY)))
+    # Stream questions so the first one can be shown before the rest are generated
+    STREAM_TECH_QUESTIONS = os.getenv("STREAM_TECH_QUESTIONS", "true").lower() == "true"
+    # Batch question generation for candidates arriving within a short window
+    # into one JSON-mode request (replaces streaming when enabled)
+    QUESTION_BATCHING_ENABLED = os.getenv("QUESTION_BATCHING_ENABLED", "false").lower() == "true"
+    QUESTION_BATCH_WINDOW_MS = float(os.getenv("QUESTION_BATCH_WINDOW_MS", "50"))
+    QUESTION_BATCH_MAX_SIZE = int(os.getenv("QUESTION_BATCH_MAX_SIZE", "8"))
+    # Token budget for the candidate's tech stack in the question prompt
+    TECH_STACK_MAX_TOKENS = int(os.getenv("TECH_STACK_MAX_TOKENS", "64"))
     
     # Data Storage Configuration
     DATA_DIR = os.getenv("DATA_DIR", "data")
     CSV_FILENAME = os.getenv("CSV_FILENAME", "candidate_data.csv")
+    # "sqlite" (system of record) or "csv" (legacy append-only file)
+    STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "sqlite").lower()
+    DB_FILENAME = os.getenv("DB_FILENAME", "candidates.db")
+    # Write-behind queue: saves are group-committed by a background flusher
+    WRITE_BEHIND_ENABLED = os.getenv("WRITE_BEHIND_ENABLED", "true").lower() == "true"
+    WRITE_BATCH_SIZE = int(os.getenv("WRITE_BATCH_SIZE", "50"))
+    WRITE_FLUSH_INTERVAL_MS = int(os.getenv("WRITE_FLUSH_INTERVAL_MS", "200"))
+    WRITE_QUEUE_SIZE = int(os.getenv("WRITE_QUEUE_SIZE", "1000"))
+    # Index of saved emails/phones used to stop repeat interviews early
+    RETURNING_CANDIDATE_CHECK = os.getenv("RETURNING_CANDIDATE_CHECK", "true").lower() == "true"
+    CANDIDATE_INDEX_FILENAME = os.getenv("CANDIDATE_INDEX_FILENAME", "candidate_index.db")
+    # Full-text index of technical answers (empty disables recruiter search)
+    ANSWER_INDEX_FILENAME = os.getenv("ANSWER_INDEX_FILENAME", "answer_index.db")
+    # Month-partitioned Parquet archive, compacted with `python -m core.archive`
+    ARCHIVE_ENABLED = os.getenv("ARCHIVE_ENABLED", "false").lower() == "true"
+    ARCHIVE_DIRNAME = os.getenv("ARCHIVE_DIRNAME", "archive")
+    ARCHIVE_COMPRESSION = os.getenv("ARCHIVE_COMPRESSION", "zstd")
+    
+    # Interview Session Store ("memory" per process, "sqlite" shared by all app processes)
+    SESSION_STORE = os.getenv("SESSION_STORE", "memory").lower()
+    SESSION_DB_FILENAME = os.getenv("SESSION_DB_FILENAME", "sessions.db")
+    SESSION_TTL_HOURS = float(os.getenv("SESSION_TTL_HOURS", "24"))
+    
+    # Logging and Performance Metrics (disabled metrics cost a single attribute check)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    # Port serving /metrics (Prometheus text) and /metrics.json; 0 disables it
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+    # JSON file in DATA_DIR rewritten periodically; empty disables the dump
+    METRICS_DUMP_FILENAME = os.getenv("METRICS_DUMP_FILENAME", "metrics.json")
+    METRICS_DUMP_INTERVAL_SECONDS = float(os.getenv("METRICS_DUMP_INTERVAL_SECONDS", "60"))
+    
+    # Technical Question Cache Configuration
+    QUESTION_CACHE_ENABLED = os.getenv("QUESTION_CACHE_ENABLED", "true").lower() == "true"
+    QUESTION_CACHE_FILENAME = os.getenv("QUESTION_CACHE_FILENAME", "question_cache.db")
+    QUESTION_CACHE_TTL_HOURS = float(os.getenv("QUESTION_CACHE_TTL_HOURS", "168"))
+    QUESTION_CACHE_MAX_ENTRIES = int(os.getenv("QUESTION_CACHE_MAX_ENTRIES", "1000"))
+    QUESTION_CACHE_POOL_SIZE = int(os.getenv("QUESTION_CACHE_POOL_SIZE", "3"))
+    # Pre-generated bank built offline with `python -m core.question_bank`
+    QUESTION_BANK_FILENAME = os.getenv("QUESTION_BANK_FILENAME", "question_bank.json")
     
     @classmethod
     def validate_config(cls) -> bool:
@@ -0,0 +1,174 @@
+"""Full-text search over stored technical answers.
+
+A SQLite FTS5 index with one row per saved interview holding its
+Technical_A1..A5 answers. DataHandler feeds it on every save, so
+recruiters can search answers ("Kafka partitions", "React hooks") with
+BM25 ranking instead of loading and substring-filtering every record.
+
+BM25 costs a few microseconds per matching row, so broad queries that
+match most interviews are ranked within the newest ``rank_window``
+matches. Those are found with a cheap rowid-ordered scan, which keeps
+latency bounded as the index grows. Queries with fewer matches are
+ranked exactly.
+
+Like the candidate index, it remembers the store ID of the last record
+it took in, so saves it missed are caught up on the next start.
+"""
+
+import re
+import sqlite3
+import threading
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.schema import HEADER_BY_COLUMN, TECH_QUESTION_SLOTS
+
+logger = logging.getLogger(__name__)
+
+ANSWER_HEADERS = [f"Technical_A{i}" for i in range(1, TECH_QUESTION_SLOTS + 1)]
+# Stored alongside the answers so hits can be shown without touching the store
+RESULT_COLUMNS = ("interview_date", "full_name", "email", "position")
+# Columns the index needs from a stored record
+INDEXED_COLUMNS = list(RESULT_COLUMNS) + ANSWER_HEADERS
+
+_QUERY_TOKEN = re.compile(r"\w+")
+
+
+def build_match_query(query: str, match_all: bool = True) -> str:
+    """Turn free text into a safe FTS5 query of quoted tokens.
+
+    Quoting keeps input such as "C++", "node.js" or "AND" from being
+    parsed as FTS5 syntax.
+    """
+    tokens = [f'"{token}"' for token in _QUERY_TOKEN.findall(query)]
+    return (" " if match_all else " OR ").join(tokens)
+
+
+def _answer_rows(records: Iterable[Dict[str, str]]) -> List[Tuple[str, ...]]:
+    rows = []
+    for record in records:
+        answers = "\n".join(record.get(header) or "" for header in ANSWER_HEADERS).strip()
+        if answers:
+            rows.append(tuple(record.get(HEADER_BY_COLUMN[column], "") for column in RESULT_COLUMNS) + (answers,))
+    return rows
+
+
+class AnswerSearchIndex:
+    """Incrementally maintained FTS5 index of technical answers."""
+
+    def __init__(self, db_path: str, rank_window: int = 5000):
+        self.db_path = db_path
+        self.rank_window = rank_window
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS answers_fts USING fts5(
+                    {', '.join(f'{column} UNINDEXED' for column in RESULT_COLUMNS)},
+                    answers,
+                    tokenize = 'porter unicode61'
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS index_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    indexed_id INTEGER NOT NULL
+                )
+            """)
+
+    def add_many(self, records: Iterable[Dict[str, str]]) -> None:
+        """Index the answers of saved records in one transaction."""
+        rows = _answer_rows(records)
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._insert(rows)
+
+    def add_stored(self, records: Sequence[Tuple[int, Dict[str, str]]]) -> int:
+        """Index ``(store ID, record)`` pairs and advance the high-water mark.
+
+        Pairs at or below the mark are skipped, since another process
+        sharing the index may have taken them in already.
+
+        Returns:
+            Number of records indexed
+        """
+        with self._lock, self._conn:
+            # Reserve the write lock before reading the mark
+            self._conn.execute("BEGIN IMMEDIATE")
+            indexed_id = self._read_indexed_id() or 0
+            new = [(record_id, record) for record_id, record in records if record_id > indexed_id]
+            if not new:
+                return 0
+            rows = _answer_rows(record for _, record in new)
+            if rows:
+                self._insert(rows)
+            self._write_indexed_id(new[-1][0])
+        return len(new)
+
+    def indexed_id(self) -> Optional[int]:
+        """Store ID of the last indexed record (None if no mark was ever set)."""
+        with self._lock:
+            return self._read_indexed_id()
+
+    def set_indexed_id(self, store_id: int) -> None:
+        with self._lock, self._conn:
+            self._write_indexed_id(store_id)
+
+    def _insert(self, rows: List[Tuple[str, ...]]) -> None:
+        placeholders = ", ".join("?" for _ in range(len(RESULT_COLUMNS) + 1))
+        self._conn.executemany(f"INSERT INTO answers_fts VALUES ({placeholders})", rows)
+
+    def _read_indexed_id(self) -> Optional[int]:
+        row = self._conn.execute("SELECT indexed_id FROM index_state WHERE id = 0").fetchone()
+        return row[0] if row else None
+
+    def _write_indexed_id(self, store_id: int) -> None:
+        self._conn.execute(
+            "INSERT INTO index_state (id, indexed_id) VALUES (0, ?) "
+            "ON CONFLICT (id) DO UPDATE SET indexed_id = excluded.indexed_id",
+            (store_id,)
+        )
+
+    def search(self, query: str, limit: int = 20, match_all: bool = True) -> List[Dict[str, Any]]:
+        """Return the best-matching interviews, most relevant first.
+
+        Args:
+            query: Free-text search terms
+            limit: Maximum number of results
+            match_all: Require every term (otherwise any term matches)
+
+        Returns:
+            Dicts with the candidate columns, a highlighted ``snippet`` and
+            the BM25 ``score`` (lower is better)
+        """
+        match = build_match_query(query, match_all)
+        if not match:
+            return []
+        with self._lock:
+            # Oldest rowid inside the ranking window (rowids grow with every save)
+            window_start = self._conn.execute(
+                "SELECT rowid FROM answers_fts WHERE answers_fts MATCH ? ORDER BY rowid DESC LIMIT 1 OFFSET ?",
+                (match, self.rank_window - 1)
+            ).fetchone()
+            rows = self._conn.execute(f"""
+                SELECT {', '.join(RESULT_COLUMNS)},
+                       snippet(answers_fts, -1, '**', '**', '…', 16), rank
+                FROM answers_fts
+                WHERE answers_fts MATCH ? AND rowid >= ?
+                ORDER BY rank
+                LIMIT ?
+            """, (match, window_start[0] if window_start else 0, limit)).fetchall()
+        return [
+            {**dict(zip(RESULT_COLUMNS, row)), "snippet": row[-2], "score": row[-1]}
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM answers_fts").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,242 @@
+"""Columnar Interview Archive for TalentScout Hiring Assistant
+
+Compacts stored interviews into compressed Parquet files partitioned by
+interview month. ``manifest.json`` lists every partition with its row
+count and date range, so readers only open the months a query can touch.
+Within those files, Parquet column projection and row-group statistics
+skip the long free-text answer columns and non-matching rows.
+
+Compaction is incremental: the manifest records the ID of the last
+archived store record, and each run reads only newer records and appends
+new part files. Run it
+periodically (e.g. from cron) with:
+
+    python -m core.archive --rows-per-file 50000
+
+pyarrow is only imported when the archive is used.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
+
+from core.schema import (
+    COLUMN_BY_HEADER, DB_COLUMNS, HEADER_BY_COLUMN, date_bound, resolve_columns, with_categoricals
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from core.storage import CandidateStore
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+MANIFEST_FILENAME = "manifest.json"
+# Partition for records whose interview date cannot be parsed
+UNDATED_PARTITION = "undated"
+
+
+def partition_for(interview_date: str) -> str:
+    """Month partition ("YYYY-MM") of a stored interview date."""
+    month = interview_date[:7]
+    if len(month) == 7 and month[4] == "-" and month.replace("-", "").isdigit():
+        return month
+    return UNDATED_PARTITION
+
+
+class ParquetArchive:
+    """Month-partitioned Parquet archive with a pruning manifest.
+
+    Args:
+        archive_dir: Directory holding the manifest and partition folders
+        compression: Parquet codec ("zstd", "snappy", "gzip", ...)
+        rows_per_file: Maximum rows written to one part file
+    """
+
+    def __init__(self, archive_dir: str, compression: str = "zstd", rows_per_file: int = 50000):
+        self.archive_dir = archive_dir
+        self.compression = compression
+        self.rows_per_file = rows_per_file
+        self.manifest_path = os.path.join(archive_dir, MANIFEST_FILENAME)
+        self._lock = threading.Lock()
+
+    def load_manifest(self) -> Dict:
+        """Read the manifest, returning an empty one if nothing was archived yet.
+
+        Raises:
+            ValueError: If the manifest was written by an unsupported format version
+        """
+        if not os.path.exists(self.manifest_path):
+            return {"format": MANIFEST_FORMAT_VERSION, "archived_records": 0, "archived_id": 0,
+                    "next_part": 1, "partitions": {}}
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != MANIFEST_FORMAT_VERSION:
+            raise ValueError(f"Unsupported archive manifest format: {manifest.get('format')}")
+        return manifest
+
+    def _save_manifest(self, manifest: Dict) -> None:
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _write_part(self, manifest: Dict, partition: str, records: List[Dict[str, str]]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pydict(
+            {column: [record.get(HEADER_BY_COLUMN[column], "") for record in records] for column in DB_COLUMNS},
+            schema=pa.schema([(column, pa.string()) for column in DB_COLUMNS])
+        )
+        relative_path = os.path.join(f"month={partition}", f"part-{manifest['next_part']:05d}.parquet")
+        path = os.path.join(self.archive_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pq.write_table(table, path, compression=self.compression)
+
+        dates = [record.get(HEADER_BY_COLUMN["interview_date"], "") for record in records]
+        entry = manifest["partitions"].setdefault(
+            partition, {"files": [], "rows": 0, "min_date": min(dates), "max_date": max(dates)}
+        )
+        entry["files"].append(relative_path)
+        entry["rows"] += len(records)
+        entry["min_date"] = min(entry["min_date"], min(dates))
+        entry["max_date"] = max(entry["max_date"], max(dates))
+        manifest["next_part"] += 1
+
+    def compact(self, store: "CandidateStore") -> Dict[str, Union[int, float]]:
+        """Append store records not archived yet as new part files.
+
+        Part files are written before the manifest is replaced, so an
+        interrupted run leaves the archive unchanged and is simply redone.
+
+        Returns:
+            Summary with the number of records and files written
+        """
+        with self._lock:
+            started = time.perf_counter()
+            manifest = self.load_manifest()
+            os.makedirs(self.archive_dir, exist_ok=True)
+
+            buckets: Dict[str, List[Dict[str, str]]] = {}
+            files_before = manifest["next_part"]
+            new_records = 0
+            # Manifests written before record IDs were tracked counted records;
+            # store IDs start at 1 and have no gaps, so the count is the last ID
+            archived_id = manifest.get("archived_id", manifest["archived_records"])
+            for archived_id, record in store.iter_records_after(archived_id):
+                partition = partition_for(record.get(HEADER_BY_COLUMN["interview_date"], ""))
+                bucket = buckets.setdefault(partition, [])
+                bucket.append(record)
+                new_records += 1
+                if len(bucket) >= self.rows_per_file:
+                    self._write_part(manifest, partition, bucket)
+                    buckets[partition] = []
+
+            for partition, bucket in buckets.items():
+                if bucket:
+                    self._write_part(manifest, partition, bucket)
+
+            if new_records:
+                manifest["archived_records"] += new_records
+                manifest["archived_id"] = archived_id
+                manifest["compacted_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self._save_manifest(manifest)
+
+            summary = {
+                "records": new_records,
+                "files": manifest["next_part"] - files_before,
+                "total_records": manifest["archived_records"],
+                "partitions": len(manifest["partitions"]),
+                "seconds": round(time.perf_counter() - started, 2),
+            }
+            logger.info(f"Archive compaction: {summary}")
+            return summary
+
+    def partition_files(self, since: Optional[str] = None, until: Optional[str] = None) -> List[str]:
+        """Paths of the part files whose date range overlaps [since, until)."""
+        files = []
+        for entry in self.load_manifest()["partitions"].values():
+            if since is not None and entry["max_date"] < since:
+                continue
+            if until is not None and entry["min_date"] >= until:
+                continue
+            files.extend(os.path.join(self.archive_dir, path) for path in entry["files"])
+        return files
+
+    def read(self, columns: Optional[Sequence[str]] = None,
+             since: Optional[Union[str, datetime]] = None, until: Optional[Union[str, datetime]] = None,
+             where: Optional[Dict[str, str]] = None) -> "pd.DataFrame":
+        """Load archived interviews into a DataFrame keyed by CSV header.
+
+        Args:
+            columns: Projection as CSV headers or database columns (None for all)
+            since: Only interviews on or after this date
+            until: Only interviews before this date
+            where: Equality filters, e.g. {"position": "Backend Engineer"}
+
+        Returns:
+            Matching interviews with position and location as categoricals
+        """
+        import pandas as pd
+        import pyarrow.dataset as ds
+
+        headers = resolve_columns(columns)
+        since, until = date_bound(since), date_bound(until)
+
+        conditions = []
+        for column, value in (where or {}).items():
+            header = resolve_columns([column])[0]
+            conditions.append(ds.field(COLUMN_BY_HEADER[header]) == value)
+        if since is not None:
+            conditions.append(ds.field("interview_date") >= since)
+        if until is not None:
+            conditions.append(ds.field("interview_date") < until)
+
+        files = self.partition_files(since, until)
+        if not files:
+            return with_categoricals(pd.DataFrame(columns=headers))
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        dataset = ds.dataset(files, format="parquet")
+        table = dataset.to_table(columns=[COLUMN_BY_HEADER[header] for header in headers], filter=expression)
+        df = table.to_pandas()
+        df.columns = headers
+        return with_categoricals(df)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from config import Config
+    from core.storage import create_store
+
+    parser = argparse.ArgumentParser(description="Compact stored interviews into the Parquet archive.")
+    parser.add_argument("--rows-per-file", type=int, default=50000)
+    parser.add_argument("--compression", default=Config.ARCHIVE_COMPRESSION)
+    parser.add_argument("--archive-dir", default=os.path.join(Config.DATA_DIR, Config.ARCHIVE_DIRNAME))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    # The store alone: a DataHandler would build the candidate and answer indexes
+    store = create_store(Config.STORAGE_BACKEND, Config.DATA_DIR, Config.CSV_FILENAME, Config.DB_FILENAME)
+    archive = ParquetArchive(args.archive_dir, args.compression, args.rows_per_file)
+    try:
+        summary = archive.compact(store)
+    finally:
+        store.close()
+
+    print(json.dumps(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
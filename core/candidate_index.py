@@ -0,0 +1,148 @@
+"""Returning-candidate index for TalentScout Hiring Assistant
+
+A small SQLite table keyed on normalized email address and phone number
+of every saved interview. DataHandler updates it on each save, so
+checking whether a candidate has interviewed before is a single primary
+key lookup instead of a scan over all stored interviews.
+
+The index remembers the store ID of the last record it took in (its
+high-water mark), so records saved while it was not being updated are
+caught up on the next start.
+"""
+
+import sqlite3
+import threading
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.schema import DATE_COLUMN, HEADER_BY_COLUMN
+from core.validation import normalize_email, normalize_phone
+
+logger = logging.getLogger(__name__)
+
+# Question IDs that identify a candidate
+IDENTITY_FIELDS = ("email", "phone")
+
+
+def identity_keys(record: Dict[str, str], phone_country_code: str = "1") -> List[Tuple[str, str]]:
+    """Normalized (field, key) pairs identifying the candidate of a stored record."""
+    normalizers = {
+        "email": normalize_email,
+        "phone": lambda phone: normalize_phone(phone, phone_country_code),
+    }
+    keys = []
+    for field in IDENTITY_FIELDS:
+        value = (record.get(HEADER_BY_COLUMN[field]) or "").strip()
+        if value:
+            keys.append((field, normalizers[field](value)))
+    return keys
+
+
+def _key_rows(records: Iterable[Dict[str, str]], phone_country_code: str) -> List[Tuple[str, str, str, str]]:
+    return [
+        (field, key, record.get(DATE_COLUMN, ""), record.get(DATE_COLUMN, ""))
+        for record in records
+        for field, key in identity_keys(record, phone_country_code)
+    ]
+
+
+class CandidateIndex:
+    """On-disk set of candidate identity keys with first/last seen dates."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS candidate_keys (
+                    field TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL,
+                    interviews INTEGER NOT NULL DEFAULT 1,
+                    PRIMARY KEY (field, key)
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS index_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    indexed_id INTEGER NOT NULL
+                )
+            """)
+
+    def add_many(self, records: Iterable[Dict[str, str]], phone_country_code: str = "1") -> None:
+        """Index the identity keys of saved records in one transaction."""
+        rows = _key_rows(records, phone_country_code)
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._insert(rows)
+
+    def add_stored(self, records: Sequence[Tuple[int, Dict[str, str]]], phone_country_code: str = "1") -> int:
+        """Index ``(store ID, record)`` pairs and advance the high-water mark.
+
+        Pairs at or below the mark are skipped, since another process
+        sharing the index may have taken them in already.
+
+        Returns:
+            Number of records indexed
+        """
+        with self._lock, self._conn:
+            # Reserve the write lock before reading the mark
+            self._conn.execute("BEGIN IMMEDIATE")
+            indexed_id = self._read_indexed_id() or 0
+            new = [(record_id, record) for record_id, record in records if record_id > indexed_id]
+            if not new:
+                return 0
+            self._insert(_key_rows((record for _, record in new), phone_country_code))
+            self._write_indexed_id(new[-1][0])
+        return len(new)
+
+    def indexed_id(self) -> Optional[int]:
+        """Store ID of the last indexed record (None if no mark was ever set)."""
+        with self._lock:
+            return self._read_indexed_id()
+
+    def set_indexed_id(self, store_id: int) -> None:
+        with self._lock, self._conn:
+            self._write_indexed_id(store_id)
+
+    def _insert(self, rows: List[Tuple[str, str, str, str]]) -> None:
+        self._conn.executemany("""
+            INSERT INTO candidate_keys (field, key, first_seen, last_seen) VALUES (?, ?, ?, ?)
+            ON CONFLICT (field, key) DO UPDATE SET
+                last_seen = MAX(last_seen, excluded.last_seen),
+                interviews = interviews + 1
+        """, rows)
+
+    def _read_indexed_id(self) -> Optional[int]:
+        row = self._conn.execute("SELECT indexed_id FROM index_state WHERE id = 0").fetchone()
+        return row[0] if row else None
+
+    def _write_indexed_id(self, store_id: int) -> None:
+        self._conn.execute(
+            "INSERT INTO index_state (id, indexed_id) VALUES (0, ?) "
+            "ON CONFLICT (id) DO UPDATE SET indexed_id = excluded.indexed_id",
+            (store_id,)
+        )
+
+    def lookup(self, field: str, key: str) -> Optional[Dict[str, object]]:
+        """Return what is known about a normalized identity key, if it was seen before."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT first_seen, last_seen, interviews FROM candidate_keys WHERE field = ? AND key = ?",
+                (field, key)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"first_seen": row[0], "last_seen": row[1], "interviews": row[2]}
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidate_keys").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,26 +1,133 @@
 import streamlit as st
-import pandas as pd
 import logging
-from typing import Dict, List, Any, Optional
-from openai import OpenAI
+import os
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 
 from config import Config
 from utils import (
-    validate_email, validate_phone, validate_experience, validate_name,
-    parse_tech_questions, get_fallback_tech_questions, sanitize_input
+    parse_tech_questions, get_fallback_tech_questions, TechQuestionStreamParser
 )
 from core.prompt_templates import PromptTemplates
 from core.data_handler import DataHandler
+from core.schema import build_candidate_record, serialize_records
+from core.question_cache import QuestionCache, normalize_tech_stack
+from core.question_bank import QuestionBank
+from core.question_feed import QuestionFeed
+from core.llm_gateway import LLMGateway, LLMDeadlineExceeded
+from core.single_flight import SingleFlight, normalize_prompt
+from core.question_batcher import BatchResult, QuestionBatcher
+from core.interview_engine import InterviewSession, InterviewPhases, InterviewPrompt, EventKinds
+from core.session_store import SessionConflict, SessionDecodeError, SessionStore, create_session_store
+from core.metrics import Metrics, TOKEN_BUCKETS, metrics, start_http_server, start_json_dump
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class InterviewPhases:
-    BASIC_INFO = "basic_info"
-    TECHNICAL = "technical"
-    COMPLETED = "completed"
+@st.cache_resource(show_spinner=False)
+def get_llm_gateway(api_key: str, model: str, base_url: Optional[str]) -> LLMGateway:
+    """Return the process-wide LLM gateway for this API key.
+    
+    Cached across reruns and sessions so the pooled HTTP connections
+    (and their keep-alives), the concurrency limit and the rate limiter
+    are shared by every interview in the process. The openai package is
+    only imported when the first request is made.
+    """
+    return LLMGateway(
+        api_key=api_key,
+        model=model,
+        base_url=base_url,
+        request_timeout=Config.LLM_REQUEST_TIMEOUT,
+        max_retries=Config.LLM_MAX_RETRIES,
+        max_concurrency=Config.LLM_MAX_CONCURRENCY,
+        requests_per_minute=Config.LLM_REQUESTS_PER_MINUTE,
+        max_connections=Config.LLM_MAX_CONNECTIONS
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_data_handler(data_dir: str, csv_filename: str, backend: str, db_filename: str) -> DataHandler:
+    """Return the process-wide DataHandler for this data location."""
+    return DataHandler(
+        data_dir=data_dir,
+        csv_filename=csv_filename,
+        backend=backend,
+        db_filename=db_filename,
+        write_behind=Config.WRITE_BEHIND_ENABLED,
+        write_batch_size=Config.WRITE_BATCH_SIZE,
+        write_flush_interval=Config.WRITE_FLUSH_INTERVAL_MS / 1000,
+        write_queue_size=Config.WRITE_QUEUE_SIZE,
+        archive_dir=os.path.join(data_dir, Config.ARCHIVE_DIRNAME) if Config.ARCHIVE_ENABLED else None,
+        archive_compression=Config.ARCHIVE_COMPRESSION,
+        index_filename=Config.CANDIDATE_INDEX_FILENAME,
+        phone_country_code=Config.PHONE_DEFAULT_COUNTRY_CODE,
+        search_index_filename=Config.ANSWER_INDEX_FILENAME or None
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_batcher(api_key: str, model: str, base_url: Optional[str],
+                         window_ms: float, max_batch: int) -> QuestionBatcher:
+    """Return the process-wide batcher sharing question generation calls across candidates."""
+    return QuestionBatcher(
+        get_llm_gateway(api_key, model, base_url),
+        max_questions=Config.MAX_TECH_QUESTIONS,
+        window=window_ms / 1000,
+        max_batch=max_batch,
+        deadline=Config.LLM_DEADLINE_SECONDS,
+        stack_token_limit=Config.TECH_STACK_MAX_TOKENS
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def start_metrics(enabled: bool, port: int, dump_path: Optional[str], dump_interval: float) -> Metrics:
+    """Enable the process-wide metrics registry and its exporters once per process."""
+    metrics.enabled = enabled
+    if enabled:
+        metrics.set_buckets("interview_llm_tokens", TOKEN_BUCKETS)
+        if port:
+            start_http_server(port)
+        if dump_path:
+            start_json_dump(dump_path, dump_interval)
+    return metrics
+
+
+@st.cache_resource(show_spinner=False)
+def get_session_store(backend: str, db_path: str, ttl_hours: float) -> SessionStore:
+    """Return the process-wide store interviews are persisted to between reruns."""
+    return create_session_store(backend, db_path, ttl_hours * 3600)
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_cache(db_path: str, ttl_hours: float, max_entries: int, pool_size: int) -> QuestionCache:
+    """Return the process-wide technical question cache."""
+    return QuestionCache(
+        db_path=db_path,
+        ttl_seconds=ttl_hours * 3600,
+        max_entries=max_entries,
+        pool_size=pool_size
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_bank(path: str) -> QuestionBank:
+    """Return the process-wide reader for the pre-generated question bank."""
+    return QuestionBank(path)
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the process-wide pool used to prefetch technical questions."""
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="question-prefetch")
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_flights() -> SingleFlight:
+    """Return the process-wide registry used to coalesce identical generations."""
+    return SingleFlight()
 
 
 class TalentScoutChatbot:
@@ -29,64 +136,213 @@ class TalentScoutChatbot:
     """
     
     def __init__(self):
-        """Initialize the chatbot with configuration and clients."""
-        self.config = Config()
-        self.data_handler = DataHandler(
-            data_dir=self.config.DATA_DIR,
-            csv_filename=self.config.CSV_FILENAME
+        """Initialize the chatbot with configuration and shared clients.
+        
+        The LLM gateway and DataHandler are process-wide resources, so
+        constructing a chatbot on every Streamlit rerun stays cheap.
+        """
+        self.config = Config
+        self.metrics = start_metrics(
+            self.config.METRICS_ENABLED,
+            self.config.METRICS_PORT,
+            os.path.join(self.config.DATA_DIR, self.config.METRICS_DUMP_FILENAME)
+            if self.config.METRICS_DUMP_FILENAME else None,
+            self.config.METRICS_DUMP_INTERVAL_SECONDS
+        )
+        self.data_handler = get_data_handler(
+            self.config.DATA_DIR,
+            self.config.CSV_FILENAME,
+            self.config.STORAGE_BACKEND,
+            self.config.DB_FILENAME
         )
         
-        # Initialize OpenAI client
-        try:
-            self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
-        except Exception as e:
-            logger.error(f"Failed to initialize OpenAI client: {e}")
-            st.error("Failed to initialize AI service. Please check your API key.")
-            st.stop()
+        self.llm = get_llm_gateway(
+            self.config.OPENAI_API_KEY,
+            self.config.OPENAI_MODEL,
+            self.config.OPENAI_BASE_URL
+        )
+        
+        self.question_batcher = None
+        if self.config.QUESTION_BATCHING_ENABLED:
+            self.question_batcher = get_question_batcher(
+                self.config.OPENAI_API_KEY,
+                self.config.OPENAI_MODEL,
+                self.config.OPENAI_BASE_URL,
+                self.config.QUESTION_BATCH_WINDOW_MS,
+                self.config.QUESTION_BATCH_MAX_SIZE
+            )
+        
+        self.session_store = get_session_store(
+            self.config.SESSION_STORE,
+            os.path.join(self.config.DATA_DIR, self.config.SESSION_DB_FILENAME),
+            self.config.SESSION_TTL_HOURS
+        )
         
+        self.question_cache = None
+        if self.config.QUESTION_CACHE_ENABLED:
+            self.question_cache = get_question_cache(
+                os.path.join(self.config.DATA_DIR, self.config.QUESTION_CACHE_FILENAME),
+                self.config.QUESTION_CACHE_TTL_HOURS,
+                self.config.QUESTION_CACHE_MAX_ENTRIES,
+                self.config.QUESTION_CACHE_POOL_SIZE
+            )
+        
+        self.question_bank = get_question_bank(
+            os.path.join(self.config.DATA_DIR, self.config.QUESTION_BANK_FILENAME)
+        )
+        self.question_executor = get_question_executor(self.config.QUESTION_PREFETCH_WORKERS)
+        self.question_flights = get_question_flights()
+        
+        self.tech_stack_question = "Please list your tech stack (languages, frameworks, and tools you know)."
         self.basic_questions = [
             "What is your full name?",
             "What is your email address?",
             "What is your phone number?",
             "How many years of experience do you have?",
             "Which position are you applying for?",
-            "Where are you currently located?",
-            "Please list your tech stack (languages, frameworks, and tools you know)."
+            "Where are you currently located?"
         ]
+        # Ask for the tech stack early so questions are generated in the background
+        tech_stack_index = min(max(self.config.TECH_STACK_QUESTION_INDEX, 0), len(self.basic_questions))
+        self.basic_questions.insert(tech_stack_index, self.tech_stack_question)
+    
+    def new_interview_session(self) -> InterviewSession:
+        """Create a fresh headless interview wired to this chatbot's resources."""
+        return InterviewSession(
+            basic_questions=self.basic_questions,
+            tech_stack_question=self.tech_stack_question,
+            question_source=self.prefetch_technical_questions,
+            max_tech_questions=self.config.MAX_TECH_QUESTIONS,
+            min_answer_length=self.config.MIN_ANSWER_LENGTH,
+            max_experience_years=self.config.MAX_EXPERIENCE_YEARS,
+            phone_country_code=self.config.PHONE_DEFAULT_COUNTRY_CODE,
+            seen_before=self.is_returning_candidate if self.config.RETURNING_CANDIDATE_CHECK else None
+        )
+    
+    def is_returning_candidate(self, field: str, value: str) -> bool:
+        """True if a saved interview already has this email or phone number."""
+        match = self.data_handler.find_returning_candidate(**{field: value})
+        if match is not None:
+            logger.info(f"Returning candidate matched on {field} (last interview {match['last_seen']})")
+        return match is not None
     
     def initialize_session_state(self) -> None:
-        """Initialize all session state variables."""
-        session_defaults = {
-            "step": 0,
-            "candidate": {},
-            "messages": [],
-            "completed": False,
-            "tech_questions": [],
-            "tech_step": 0,
-            "tech_answers": {},
-            "interview_phase": InterviewPhases.BASIC_INFO
-        }
-        
-        for key, default_value in session_defaults.items():
-            if key not in st.session_state:
-                st.session_state[key] = default_value
+        """Attach the interview named in the URL to the Streamlit session.
+        
+        The interview ID lives in the ``interview`` query parameter, so a
+        reconnect (possibly served by another app process) resumes it from
+        the session store. A URL without an ID starts a new interview.
+        """
+        interview_id = st.query_params.get("interview")
+        if interview_id and st.session_state.get("interview_id") == interview_id:
+            return
+        if not interview_id:
+            interview_id = uuid.uuid4().hex
+            st.query_params["interview"] = interview_id
+        self.load_session(interview_id)
+    
+    def restore_session(self, interview_id: str) -> Tuple[InterviewSession, int]:
+        """Restore an interview from the session store, or start a new one under this ID.
+        
+        An interview that cannot be restored (unsupported format, corrupt
+        row) starts over in a way the next save can replace: the fresh
+        session takes over the stored version, or an undecodable row is
+        deleted. Otherwise every save would conflict and reload it again.
+        
+        Returns:
+            Tuple[InterviewSession, int]: The session and its stored version (0 if new)
+            
+        Raises:
+            Exception: If the store itself failed (e.g. a locked database); the
+                stored interview is left untouched
+        """
+        try:
+            stored = self.session_store.load(interview_id)
+        except SessionDecodeError as e:
+            logger.warning(f"Could not decode interview {interview_id}, starting over: {e}")
+            try:
+                self.session_store.delete(interview_id)
+            except Exception as delete_error:
+                logger.error(f"Error deleting unreadable interview {interview_id}: {delete_error}")
+            return self.new_interview_session(), 0
+        
+        session = self.new_interview_session()
+        if stored is None:
+            return session, 0
+        try:
+            session.restore(stored[0])
+        except Exception as e:
+            logger.warning(f"Could not restore interview {interview_id}, starting over: {e}")
+            session = self.new_interview_session()
+        return session, stored[1]
+    
+    def load_session(self, interview_id: str) -> None:
+        """Attach the stored (or a new) interview with this ID to the Streamlit session."""
+        try:
+            session, version = self.restore_session(interview_id)
+        except Exception as e:
+            logger.error(f"Error loading interview {interview_id}: {e}")
+            st.error("Your interview could not be loaded right now. Please refresh the page in a moment.")
+            st.stop()
+        st.session_state.interview = session
+        st.session_state.interview_id = interview_id
+        st.session_state.interview_version = version
+    
+    def persist_session(self) -> None:
+        """Write the interview to the session store after its state changed.
+        
+        Saves are versioned: if another process or browser tab advanced the
+        same interview first, its progress wins and is reloaded here.
+        """
+        interview_id = st.session_state.interview_id
+        try:
+            st.session_state.interview_version = self.session_store.save(
+                interview_id, self.session.to_dict(), st.session_state.interview_version
+            )
+        except SessionConflict:
+            logger.warning(f"Interview {interview_id} was updated elsewhere, reloading it")
+            self.load_session(interview_id)
+            st.session_state.interview_conflict = True
+            st.rerun()
+        except Exception as e:
+            logger.error(f"Error persisting interview {interview_id}: {e}")
+    
+    @property
+    def session(self) -> InterviewSession:
+        """Interview state machine for the current Streamlit session."""
+        return st.session_state.interview
     
     def show_initial_greeting(self) -> None:
-        """Display the initial greeting message."""
-        if st.session_state.step == 0 and not st.session_state.messages:
+        """Add the initial greeting message to a new interview."""
+        if self.session.step == 0 and not self.session.messages:
             greeting = (
                 f"👋 Hi! I'm **{self.config.APP_TITLE.split()[0]}**, your AI Hiring Assistant.\n\n"
                 "I'll collect some quick details and then ask a few technical questions "
                 "based on your skills. Type **'exit'** anytime to end the chat.\n\n"
                 f"📊 *We've helped {self.data_handler.get_candidate_count()} candidates so far!*"
             )
-            st.chat_message("assistant").write(greeting)
-            st.session_state.messages.append({"role": "assistant", "content": greeting})
+            self.session.start(greeting)
+            self.persist_session()
     
     def display_chat_history(self) -> None:
-        """Display the chat message history."""
-        for msg in st.session_state.messages:
-            st.chat_message(msg["role"]).write(msg["content"])
+        """Display the chat message history.
+        
+        Only the most recent CHAT_HISTORY_VISIBLE messages are rendered as
+        chat bubbles on each rerun. Older ones stay collapsed behind a toggle
+        and, when shown, are rendered as a single markdown element.
+        """
+        messages = self.session.messages
+        older = len(messages) - self.config.CHAT_HISTORY_VISIBLE
+        
+        if older > 0:
+            if st.toggle(f"Show {older} earlier messages", key="show_earlier_messages"):
+                st.markdown("\n\n".join(
+                    f"**{'You' if msg.role == 'user' else 'TalentScout'}:** {msg.content}"
+                    for msg in messages[:older]
+                ))
+        
+        for msg in messages[max(older, 0):]:
+            st.chat_message(msg.role).write(msg.content)
     
     def validate_user_input(self, user_input: str, question_index: int) -> Optional[str]:
         """
@@ -99,210 +355,379 @@ class TalentScoutChatbot:
         Returns:
             Optional[str]: Error message if validation fails, None if valid
         """
-        current_question = self.basic_questions[question_index].lower()
-        
-        if "email" in current_question:
-            if not validate_email(user_input):
-                return "⚠️ Please enter a valid email address (e.g., john@example.com)"
-        
-        elif "phone" in current_question:
-            if not validate_phone(user_input):
-                return "⚠️ Please enter a valid phone number (at least 10 digits)"
-        
-        elif "experience" in current_question:
-            if not validate_experience(user_input, self.config.MAX_EXPERIENCE_YEARS):
-                return f"⚠️ Please enter a valid number of years (0-{self.config.MAX_EXPERIENCE_YEARS})"
-        
-        elif "name" in current_question:
-            if not validate_name(user_input):
-                return "⚠️ Please enter your full name (at least 2 characters)"
-        
-        elif "tech stack" in current_question:
-            if len(user_input.strip()) < 3:
-                return "⚠️ Please provide more details about your technology stack"
-        
-        return None
+        return self.session.validate_answer(user_input, question_index)
+    
+    def question_flight_key(self, tech_stack: str) -> str:
+        """Identity of a generation request: the normalized prompt for the canonical stack."""
+        stack_key = normalize_tech_stack(tech_stack) or tech_stack
+        return normalize_prompt(
+            PromptTemplates.tech_questions_user_prompt(stack_key, self.config.TECH_STACK_MAX_TOKENS)
+        )
     
-    def generate_technical_questions(self, tech_stack: str) -> List[str]:
+    def generate_technical_questions(self, tech_stack: str, usage: Optional[Dict[str, int]] = None,
+                                     deadline: Optional[float] = None) -> List[str]:
         """
         Generate technical questions using AI.
         
+        Question sets for an already-seen (normalized) tech stack are served
+        from the offline question bank or the question cache without calling
+        the API, and concurrent
+        calls for the same stack share a single in-flight request.
+        
         Args:
             tech_stack (str): Candidate's technology stack
+            usage (Optional[Dict[str, int]]): Receives the LLM tokens spent, if any
+            deadline (Optional[float]): Seconds left for the API call (LLM_DEADLINE_SECONDS by default)
             
         Returns:
             List[str]: List of technical questions
         """
+        flight_key = "questions:" + self.question_flight_key(tech_stack)
+        questions = self.question_flights.do(
+            flight_key, lambda: self._generate_technical_questions(tech_stack, usage, deadline)
+        )
+        return list(questions)
+    
+    def _generate_technical_questions(self, tech_stack: str, usage: Optional[Dict[str, int]] = None,
+                                      deadline: Optional[float] = None) -> List[str]:
+        stack_key = normalize_tech_stack(tech_stack)
+        cached_questions = self._get_cached_questions(stack_key)
+        if cached_questions:
+            return cached_questions
+        
         try:
-            prompt = PromptTemplates.generate_tech_questions_prompt(tech_stack)
+            started = time.perf_counter()
+            if self.question_batcher is not None:
+                questions = self.question_batcher.generate(tech_stack, usage)
+                return self._accept_batched_questions(tech_stack, questions, started)
             
-            response = self.client.chat.completions.create(
-                model=self.config.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a professional technical interviewer."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=800
-            )
+            with metrics.span("question_generation_seconds", stage="network"):
+                response = self.llm.complete_sync(
+                    messages=PromptTemplates.tech_questions_messages(
+                        tech_stack, self.config.MAX_TECH_QUESTIONS, self.config.TECH_STACK_MAX_TOKENS
+                    ),
+                    deadline=self.config.LLM_DEADLINE_SECONDS if deadline is None else deadline,
+                    usage=usage,
+                    temperature=0.7,
+                    max_tokens=PromptTemplates.tech_questions_max_tokens(self.config.MAX_TECH_QUESTIONS)
+                )
             
-            tech_response = response.choices[0].message.content
-            questions = parse_tech_questions(tech_response, self.config.MAX_TECH_QUESTIONS)
+            with metrics.span("question_generation_seconds", stage="parse"):
+                tech_response = response.choices[0].message.content
+                questions = parse_tech_questions(tech_response, self.config.MAX_TECH_QUESTIONS)
             
             if len(questions) < 3:
                 logger.warning("AI question generation failed, using fallback questions")
-                questions = get_fallback_tech_questions(tech_stack)
+                return self._fallback_questions(tech_stack)
             
+            metrics.inc("question_sets", source="llm")
+            self._cache_questions(stack_key, questions, time.perf_counter() - started)
             return questions
             
+        except LLMDeadlineExceeded as e:
+            logger.warning(f"{e}, using fallback questions")
+            return self._fallback_questions(tech_stack)
         except Exception as e:
             logger.error(f"Error generating technical questions: {e}")
+            return self._fallback_questions(tech_stack)
+    
+    def _fallback_questions(self, tech_stack: str) -> List[str]:
+        with metrics.span("question_generation_seconds", stage="fallback"):
+            metrics.inc("question_sets", source="fallback")
             return get_fallback_tech_questions(tech_stack)
     
-    def create_interview_csv(self) -> str:
-        """Create CSV data from current interview session."""
+    def stream_technical_questions(self, tech_stack: str, usage: Optional[Dict[str, int]] = None,
+                                   deadline: Optional[float] = None) -> Iterator[str]:
+        """
+        Generate technical questions with a streamed completion.
+        
+        Each question is yielded as soon as its line has been received, so
+        the first one can be shown while the rest are still being generated.
+        If the model yields fewer than three questions, fallback questions
+        fill up the set.
+        
+        Args:
+            tech_stack (str): Candidate's technology stack
+            usage (Optional[Dict[str, int]]): Receives the LLM tokens spent, if any
+            deadline (Optional[float]): Seconds left for the stream (LLM_DEADLINE_SECONDS by default)
+            
+        Yields:
+            str: Technical questions in interview order
+        """
+        stack_key = normalize_tech_stack(tech_stack)
+        cached_questions = self._get_cached_questions(stack_key)
+        if cached_questions:
+            yield from cached_questions
+            return
+        
+        parser = TechQuestionStreamParser(self.config.MAX_TECH_QUESTIONS)
+        parse_seconds = 0.0
+        streamed = False
+        started = time.perf_counter()
         try:
-            structured_data = {
-                "interview_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                **st.session_state.candidate
-            }
+            stream = self.llm.stream_sync(
+                messages=PromptTemplates.tech_questions_messages(
+                    tech_stack, self.config.MAX_TECH_QUESTIONS, self.config.TECH_STACK_MAX_TOKENS
+                ),
+                deadline=self.config.LLM_DEADLINE_SECONDS if deadline is None else deadline,
+                usage=usage,
+                temperature=0.7,
+                max_tokens=PromptTemplates.tech_questions_max_tokens(self.config.MAX_TECH_QUESTIONS)
+            )
             
-            if st.session_state.tech_questions and st.session_state.tech_answers:
-                for i, question in enumerate(st.session_state.tech_questions, 1):
-                    answer_key = f"Tech Question {i}"
-                    answer = st.session_state.tech_answers.get(answer_key, "No answer provided")
-                    structured_data[f"Technical_Q{i}"] = question.replace('"', '').replace(',', ';')
-                    structured_data[f"Technical_A{i}"] = answer.replace('"', '').replace(',', ';')
+            for piece in stream:
+                parse_started = time.perf_counter()
+                questions = parser.feed(piece)
+                parse_seconds += time.perf_counter() - parse_started
+                yield from questions
+            yield from parser.close()
+            streamed = True
             
-            for i in range(1, 6):
-                if f"Technical_Q{i}" not in structured_data:
-                    structured_data[f"Technical_Q{i}"] = ""
-                if f"Technical_A{i}" not in structured_data:
-                    structured_data[f"Technical_A{i}"] = ""
+        except LLMDeadlineExceeded as e:
+            logger.warning(f"{e}, topping up with fallback questions")
+        except Exception as e:
+            logger.error(f"Error streaming technical questions: {e}")
+        finally:
+            # Also recorded for deadline and error runs, the slow ones. Stream
+            # time not spent parsing is network (and model) time.
+            metrics.observe("question_generation_seconds", parse_seconds, stage="parse")
+            metrics.observe(
+                "question_generation_seconds", time.perf_counter() - started - parse_seconds, stage="network"
+            )
+        
+        if streamed:
+            if len(parser.emitted) >= 3:
+                metrics.inc("question_sets", source="llm")
+                self._cache_questions(stack_key, parser.emitted, time.perf_counter() - started)
+                return
+            logger.warning("AI question generation failed, using fallback questions")
+        
+        # Keep whatever was already shown and top up with fallback questions
+        missing = self.config.MAX_TECH_QUESTIONS - len(parser.emitted)
+        yield from [q for q in self._fallback_questions(tech_stack) if q not in parser.emitted][:missing]
+    
+    def _get_cached_questions(self, stack_key: str) -> Optional[List[str]]:
+        """Look up ready-made questions: the offline bank first, then the cache."""
+        banked_questions = self.question_bank.get(stack_key)
+        if banked_questions:
+            logger.info(f"Question bank hit for '{stack_key}'")
+            metrics.inc("question_sets", source="bank")
+            return banked_questions
+        
+        if self.question_cache is None:
+            return None
+        try:
+            cached_questions = self.question_cache.get(stack_key)
+            if cached_questions:
+                metrics.inc("question_sets", source="cache")
+                logger.info(f"Question cache hit for '{stack_key}': {self.question_cache.stats()}")
+            return cached_questions
+        except Exception as e:
+            logger.warning(f"Question cache lookup failed: {e}")
+            return None
+    
+    def _cache_questions(self, stack_key: str, questions: List[str], latency: float) -> None:
+        if self.question_cache is None:
+            return
+        try:
+            self.question_cache.put(stack_key, questions, latency=latency)
+        except Exception as e:
+            logger.warning(f"Question cache store failed: {e}")
+    
+    def _accept_batched_questions(self, tech_stack: str, questions: Optional[List[str]],
+                                  started: float) -> List[str]:
+        """Cache a candidate's section of a batched generation, or fall back if it failed."""
+        latency = time.perf_counter() - started
+        metrics.observe("question_generation_seconds", latency, stage="network")
+        if not questions:
+            logger.warning("Batched question generation failed for this candidate, using fallback questions")
+            return self._fallback_questions(tech_stack)
+        metrics.inc("question_sets", source="llm")
+        self._cache_questions(normalize_tech_stack(tech_stack), questions, latency)
+        return questions
+    
+    def _fill_question_feed(self, feed: QuestionFeed, tech_stack: str, flight_key: str) -> None:
+        """Background job publishing generated questions into a feed."""
+        if self.question_batcher is not None:
+            self._fill_question_feed_batched(feed, tech_stack, flight_key)
+            return
+        
+        usage: Dict[str, int] = {}
+        # The deadline runs from the feed's creation, so time spent queued for
+        # a worker counts and a late prefetch still falls back on time
+        deadline = max(self.config.LLM_DEADLINE_SECONDS - (time.perf_counter() - feed.started_at), 0.0)
+        try:
+            if self.config.STREAM_TECH_QUESTIONS:
+                for question in self.stream_technical_questions(tech_stack, usage, deadline):
+                    feed.publish(question)
+            else:
+                for question in self.generate_technical_questions(tech_stack, usage, deadline):
+                    feed.publish(question)
+        finally:
+            self._close_question_feed(feed, flight_key, usage)
+    
+    def _fill_question_feed_batched(self, feed: QuestionFeed, tech_stack: str, flight_key: str) -> None:
+        """Serve a feed from the bank or cache, or queue its stack with the batcher.
+        
+        The worker thread is not held while the batch is pending: when the
+        batch completes, another job publishes this candidate's section.
+        """
+        try:
+            questions = self._get_cached_questions(normalize_tech_stack(tech_stack))
+            if not questions:
+                started = time.perf_counter()
+                self.question_batcher.submit(tech_stack).add_done_callback(
+                    lambda batch: self._on_batch_done(feed, tech_stack, flight_key, batch, started)
+                )
+                return
+        except Exception as e:
+            logger.error(f"Error queueing batched question generation: {e}")
+            questions = self._fallback_questions(tech_stack)
+        
+        for question in questions:
+            feed.publish(question)
+        self._close_question_feed(feed, flight_key, {})
+    
+    def _on_batch_done(self, feed: QuestionFeed, tech_stack: str, flight_key: str,
+                       batch: "Future[BatchResult]", started: float) -> None:
+        """Hand a finished batch to a worker, or publish it here if the pool is gone."""
+        try:
+            self.question_executor.submit(self._publish_batch_result, feed, tech_stack, flight_key, batch, started)
+        except Exception as e:
+            logger.error(f"Error scheduling batched question publishing: {e}")
+            self._publish_batch_result(feed, tech_stack, flight_key, batch, started)
+    
+    def _publish_batch_result(self, feed: QuestionFeed, tech_stack: str, flight_key: str,
+                              batch: "Future[BatchResult]", started: float) -> None:
+        """Publish a candidate's section of a batch; a failed batch falls back to canned questions.
+        
+        The feed is always finished and its flight released, so candidates
+        sharing the stack never wait on a dead feed.
+        """
+        tokens = 0
+        try:
+            try:
+                questions, tokens = batch.result()
+                questions = self._accept_batched_questions(tech_stack, questions, started)
+            except Exception as e:
+                logger.error(f"Batched question generation failed: {e}, using fallback questions")
+                questions = self._fallback_questions(tech_stack)
+            for question in questions:
+                feed.publish(question)
+        finally:
+            self._close_question_feed(feed, flight_key, {"batched": tokens})
+    
+    def _close_question_feed(self, feed: QuestionFeed, flight_key: str, usage: Dict[str, int]) -> None:
+        self.question_flights.leave(flight_key)
+        feed.finish()
+        metrics.observe("interview_llm_tokens", sum(usage.values()))
+        # Time to first question is the latency a candidate waits at the transition
+        if feed.first_question_latency is not None:
+            metrics.observe("question_feed_seconds", feed.first_question_latency, until="first")
+        metrics.observe("question_feed_seconds", feed.total_latency, until="all")
+        logger.info(
+            f"Technical questions ready: first after {feed.first_question_latency or 0:.2f}s, "
+            f"all after {feed.total_latency:.2f}s"
+        )
+    
+    def prefetch_technical_questions(self, tech_stack: str) -> QuestionFeed:
+        """Start generating technical questions in the background.
+        
+        Used as the interview session's question source: the returned feed
+        lets the technical phase show each question as soon as it exists.
+        Sessions asking for the same stack while a generation is running
+        share that generation's feed instead of starting another request.
+        
+        Args:
+            tech_stack (str): Candidate's technology stack
             
-            df = pd.DataFrame([structured_data])
-            return df.to_csv(index=False)
+        Returns:
+            QuestionFeed: Feed the generated questions are published into
+        """
+        flight_key = "feed:" + self.question_flight_key(tech_stack)
+        feed, is_leader = self.question_flights.join(flight_key, QuestionFeed)
+        if is_leader:
+            self.question_executor.submit(self._fill_question_feed, feed, tech_stack, flight_key)
+        else:
+            # Interviews sharing a generation spend no tokens of their own
+            metrics.inc("question_prefetch_coalesced")
+            metrics.observe("interview_llm_tokens", 0)
+            logger.info(f"Coalesced question generation: {self.question_flights.stats()}")
+        return feed
+    
+    def create_interview_csv(self) -> str:
+        """Create CSV data from current interview session."""
+        try:
+            record = build_candidate_record(
+                self.session.candidate,
+                self.session.tech_questions,
+                self.session.tech_answers
+            )
+            return serialize_records([record])
             
         except Exception as e:
             logger.error(f"Error creating CSV: {e}")
             return ""
     
+    def render_prompt(self, prompt: InterviewPrompt) -> None:
+        """Show progress and the question awaiting an answer."""
+        st.progress(prompt.progress, f"{prompt.section}: {prompt.number}/{prompt.total}")
+        st.chat_message("assistant").write(
+            f"**{prompt.label} {prompt.number} of {prompt.total}:**\n{prompt.text}"
+        )
+    
+    def handle_answer(self, user_input: str) -> None:
+        """Submit an answer to the interview session and render its events."""
+        events = self.session.submit(user_input)
+        self.persist_session()
+        for event in events:
+            if event.kind == EventKinds.ERROR:
+                st.chat_message("assistant").write(event.text)
+                st.stop()
+            elif event.kind == EventKinds.USER:
+                st.chat_message("user").write(event.text)
+        st.rerun()
+    
     def handle_basic_info_phase(self) -> None:
         """Handle the basic information collection phase."""
-        if st.session_state.step < len(self.basic_questions):
-            # Show progress
-            progress = (st.session_state.step + 1) / len(self.basic_questions)
-            st.progress(progress, f"Basic Information: {st.session_state.step + 1}/{len(self.basic_questions)}")
-            
-            current_question = self.basic_questions[st.session_state.step]
-            st.chat_message("assistant").write(
-                f"**Question {st.session_state.step + 1} of {len(self.basic_questions)}:**\n{current_question}"
-            )
-
-        user_input = st.chat_input("Type your answer here...")
+        prompt = self.session.current_prompt()
+        if prompt is not None:
+            self.render_prompt(prompt)
         
+        user_input = st.chat_input("Type your answer here...")
         if user_input:
-            # Handle exit commands
-            if user_input.lower() in ["exit", "quit", "bye", "end"]:
-                st.chat_message("assistant").write(
-                    "👋 Thanks for chatting with TalentScout! We'll review your details and get back to you soon."
-                )
-                st.stop()
-
-            # Sanitize and validate input
-            user_input = sanitize_input(user_input)
-            
-            if len(user_input.strip()) == 0:
-                st.chat_message("assistant").write("⚠️ Sorry, I didn't catch that. Could you please rephrase?")
-                st.stop()
-
-            # Validate based on question type
-            validation_error = self.validate_user_input(user_input, st.session_state.step)
-            if validation_error:
-                st.chat_message("assistant").write(validation_error)
-                st.stop()
-
-            # Save valid response
-            st.chat_message("user").write(user_input)
-            st.session_state.messages.append({"role": "user", "content": user_input})
-
-            if st.session_state.step < len(self.basic_questions):
-                question_key = self.basic_questions[st.session_state.step]
-                st.session_state.candidate[question_key] = user_input
-                st.session_state.step += 1
-
-            # Transition to technical phase after last question
-            if st.session_state.step == len(self.basic_questions):
-                tech_stack = st.session_state.candidate[self.basic_questions[-1]]
-                
-                with st.spinner("🤖 Generating personalized technical questions..."):
-                    tech_questions = self.generate_technical_questions(tech_stack)
-                
-                st.session_state.tech_questions = tech_questions
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": "✅ Thanks for the basic details! Now let's move to the technical interview section."
-                })
-                
-                st.session_state.interview_phase = InterviewPhases.TECHNICAL
-                st.session_state.tech_step = 0
-                st.rerun()
-            
-            elif st.session_state.step < len(self.basic_questions):
-                st.rerun()
+            self.handle_answer(user_input)
     
     def handle_technical_phase(self) -> None:
         """Handle the technical interview phase."""
-        if st.session_state.tech_step < len(st.session_state.tech_questions):
-            # Show progress
-            progress = (st.session_state.tech_step + 1) / len(st.session_state.tech_questions)
-            st.progress(progress, f"Technical Interview: {st.session_state.tech_step + 1}/{len(st.session_state.tech_questions)}")
-            
-            current_question = st.session_state.tech_questions[st.session_state.tech_step]
-            st.chat_message("assistant").write(
-                f"**Technical Question {st.session_state.tech_step + 1} of {len(st.session_state.tech_questions)}:**\n{current_question}"
-            )
-
+        received = len(self.session.tech_questions)
+        if self.session.waiting_for_questions:
+            with st.spinner("🤖 Generating personalized technical questions..."):
+                self.session.refresh(timeout=None)
+        else:
+            self.session.refresh(timeout=0)
+        
+        if len(self.session.tech_questions) != received or self.session.completed:
+            self.persist_session()
+        if self.session.completed:
+            st.rerun()
+        
+        prompt = self.session.current_prompt()
+        if prompt is not None:
+            self.render_prompt(prompt)
+        
         user_input = st.chat_input("Type your technical answer here...")
-
         if user_input:
-            # Handle exit commands
-            if user_input.lower() in ["exit", "quit", "bye", "end"]:
-                st.chat_message("assistant").write(
-                    "👋 Thanks for participating in the technical interview! We'll review your responses and get back to you soon."
-                )
-                st.stop()
-
-            # Sanitize input
-            user_input = sanitize_input(user_input)
-            
-            # Validate answer length
-            if len(user_input.strip()) < self.config.MIN_ANSWER_LENGTH:
-                st.chat_message("assistant").write(
-                    f"⚠️ Please provide a more detailed answer (at least {self.config.MIN_ANSWER_LENGTH} characters). Technical questions require thoughtful responses."
-                )
-                st.stop()
-
-            # Save response
-            st.chat_message("user").write(user_input)
-            st.session_state.messages.append({"role": "user", "content": user_input})
-
-            if st.session_state.tech_step < len(st.session_state.tech_questions):
-                question_key = f"Tech Question {st.session_state.tech_step + 1}"
-                st.session_state.tech_answers[question_key] = user_input
-                st.session_state.tech_step += 1
-
-            # Check if technical interview is complete
-            if st.session_state.tech_step >= len(st.session_state.tech_questions):
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": "🎉 Excellent! You've completed both the basic information and technical interview sections."
-                })
-                st.session_state.interview_phase = InterviewPhases.COMPLETED
-                st.session_state.completed = True
-                st.rerun()
-            else:
-                st.rerun()
+            self.handle_answer(user_input)
+    
+    def reset_session(self) -> None:
+        """Drop the current interview and start over."""
+        if "interview_id" in st.session_state:
+            self.session_store.delete(st.session_state.interview_id)
+        st.query_params.pop("interview", None)
+        for key in list(st.session_state.keys()):
+            del st.session_state[key]
+        st.rerun()
     
     def display_completion_summary(self) -> None:
         """Display the completion summary and save options."""
@@ -310,30 +735,23 @@ class TalentScoutChatbot:
         
         # Basic Information
         with st.expander("**📋 Basic Information**", expanded=True):
+            import pandas as pd
             basic_df = pd.DataFrame.from_dict(
-                st.session_state.candidate, 
+                self.session.candidate, 
                 orient='index', 
                 columns=['Response']
             )
             st.table(basic_df)
         
         # Technical Questions and Answers
-        if st.session_state.tech_answers and st.session_state.tech_questions:
+        if self.session.answers and self.session.tech_questions:
             with st.expander("**🔧 Technical Interview Q&A**", expanded=True):
-                # Create a structured display of questions and answers
-                qa_data = []
-                for i, question in enumerate(st.session_state.tech_questions, 1):
-                    answer_key = f"Tech Question {i}"
-                    answer = st.session_state.tech_answers.get(answer_key, "No answer provided")
-                    qa_data.append({
-                        "Question": question,
-                        "Answer": answer
-                    })
-                
                 # Display Q&A pairs
-                for i, qa in enumerate(qa_data, 1):
-                    st.write(f"**Q{i}:** {qa['Question']}")
-                    st.write(f"**A{i}:** {qa['Answer']}")
+                answers = self.session.answers
+                for i, question in enumerate(self.session.tech_questions, 1):
+                    answer = answers[i - 1] if i <= len(answers) else "No answer provided"
+                    st.write(f"**Q{i}:** {question}")
+                    st.write(f"**A{i}:** {answer}")
                     st.write("---")
 
         # Save options
@@ -341,10 +759,12 @@ class TalentScoutChatbot:
         
         with col1:
             if st.button("💾 Save Interview Data", type="primary"):
+                # Wait for the commit: success is only reported once the record is on disk
                 success = self.data_handler.save_candidate_data(
-                    candidate_dict=st.session_state.candidate,
-                    tech_questions=st.session_state.tech_questions,
-                    tech_answers=st.session_state.tech_answers
+                    candidate_dict=self.session.candidate,
+                    tech_questions=self.session.tech_questions,
+                    tech_answers=self.session.tech_answers,
+                    durable=True
                 )
                 
                 if success:
@@ -366,9 +786,7 @@ class TalentScoutChatbot:
         
         with col3:
             if st.button("🔄 Start New Interview"):
-                for key in st.session_state.keys():
-                    del st.session_state[key]
-                st.rerun()
+                self.reset_session()
 
         st.info("💡 **For Deployed Apps:** Use the download button to get your interview data as CSV file since cloud storage is temporary.")
     
@@ -376,6 +794,8 @@ class TalentScoutChatbot:
         """Main chatbot execution method."""
         # Initialize session state
         self.initialize_session_state()
+        if st.session_state.pop("interview_conflict", False):
+            st.warning("This interview was continued in another window, so its latest progress is shown.")
         
         # Show initial greeting
         self.show_initial_greeting()
@@ -384,10 +804,13 @@ class TalentScoutChatbot:
         self.display_chat_history()
         
         # Handle different interview phases
-        if not st.session_state.completed:
-            if st.session_state.interview_phase == InterviewPhases.BASIC_INFO:
+        if self.session.exited:
+            if st.button("🔄 Start New Interview"):
+                self.reset_session()
+        elif not self.session.completed:
+            if self.session.phase == InterviewPhases.BASIC_INFO:
                 self.handle_basic_info_phase()
-            elif st.session_state.interview_phase == InterviewPhases.TECHNICAL:
+            elif self.session.phase == InterviewPhases.TECHNICAL:
                 self.handle_technical_phase()
         else:
             self.display_completion_summary()
@@ -399,7 +822,8 @@ def run_chatbot() -> None:
     """
     try:
         chatbot = TalentScoutChatbot()
-        chatbot.run()
+        with metrics.span("rerun_seconds"):
+            chatbot.run()
     except Exception as e:
         logger.error(f"Chatbot execution error: {e}")
         st.error("An unexpected error occurred. Please refresh the page and try again.")
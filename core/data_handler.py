@@ -1,98 +1,373 @@
 import os
-import pandas as pd
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import csv
+import threading
+from itertools import islice
+from typing import Dict, Any, Iterator, Optional, List, Sequence, TYPE_CHECKING
 import logging
 
-logging.basicConfig(level=logging.INFO)
+from core.schema import CSV_COLUMNS, HEADER_BY_COLUMN, build_candidate_record, write_records
+from core.answer_search import INDEXED_COLUMNS, AnswerSearchIndex
+from core.archive import ParquetArchive
+from core.candidate_index import CandidateIndex, identity_keys
+from core.metrics import metrics
+from core.storage import CandidateStore, DateBound, create_store
+from core.write_queue import WriteBehindQueue
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Records read from the store per index transaction when catching up
+INDEX_BATCH_SIZE = 5000
+
 
 class DataHandler:
-    
-    def __init__(self, data_dir: str = "data", csv_filename: str = "candidate_data.csv"):
+
+    def __init__(self, data_dir: str = "data", csv_filename: str = "candidate_data.csv",
+                 backend: str = "sqlite", db_filename: str = "candidates.db",
+                 write_behind: bool = False, write_batch_size: int = 50,
+                 write_flush_interval: float = 0.2, write_queue_size: int = 1000,
+                 archive_dir: Optional[str] = None, archive_compression: str = "zstd",
+                 index_filename: Optional[str] = "candidate_index.db", phone_country_code: str = "1",
+                 search_index_filename: Optional[str] = "answer_index.db"):
         self.data_dir = data_dir
         self.csv_filename = csv_filename
         self.file_path = os.path.join(data_dir, csv_filename)
-        
+        self.backend = backend
+
         # Ensure data directory exists
         os.makedirs(data_dir, exist_ok=True)
-    
-    def save_candidate_data(self, candidate_dict: Dict[str, Any], tech_questions: List[str] = None, tech_answers: Dict[str, str] = None) -> bool:
+
+        self.store: CandidateStore = create_store(backend, data_dir, csv_filename, db_filename)
+        if backend != "csv":
+            self._import_legacy_csv()
+
+        # Identity keys of saved candidates, for O(1) returning-candidate checks
+        self.phone_country_code = phone_country_code
+        self.candidate_index: Optional[CandidateIndex] = None
+        if index_filename:
+            self.candidate_index = CandidateIndex(os.path.join(data_dir, index_filename))
+
+        # Full-text index of technical answers for recruiter search
+        self.answer_index: Optional[AnswerSearchIndex] = None
+        if search_index_filename:
+            self.answer_index = AnswerSearchIndex(os.path.join(data_dir, search_index_filename))
+
+        # Take in interviews saved since the indexes were last updated
+        self._index_lock = threading.Lock()
+        for name, indexed in self._update_indexes().items():
+            if indexed:
+                logger.info(f"Caught up the {name} index with {indexed} saved interviews")
+
+        self.write_queue: Optional[WriteBehindQueue] = None
+        if write_behind:
+            self.write_queue = WriteBehindQueue(
+                self.store,
+                max_batch=write_batch_size,
+                flush_interval=write_flush_interval,
+                max_pending=write_queue_size,
+                on_commit=self._update_indexes
+            )
+
+        # Optional columnar archive for analytical queries over old interviews
+        self.archive: Optional[ParquetArchive] = None
+        if archive_dir:
+            self.archive = ParquetArchive(archive_dir, compression=archive_compression)
+
+    def _import_legacy_csv(self) -> None:
+        """Copy rows from an existing CSV store into an empty database once."""
+        if self.store.count() > 0 or not os.path.exists(self.file_path):
+            return
         try:
-            structured_data = {
-                "interview_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                **candidate_dict
-            }
-            
-            if tech_questions and tech_answers:
-                for i, question in enumerate(tech_questions, 1):
-                    answer_key = f"Tech Question {i}"
-                    answer = tech_answers.get(answer_key, "No answer provided")
-                    
-                    structured_data[f"Technical_Q{i}"] = question.replace('"', '').replace(',', ';')
-                    structured_data[f"Technical_A{i}"] = answer.replace('"', '').replace(',', ';')
-            
-            for i in range(1, 6):
-                if f"Technical_Q{i}" not in structured_data:
-                    structured_data[f"Technical_Q{i}"] = ""
-                if f"Technical_A{i}" not in structured_data:
-                    structured_data[f"Technical_A{i}"] = ""
-            
-            column_order = [
-                "interview_date",
-                "What is your full name?",
-                "What is your email address?",
-                "What is your phone number?",
-                "How many years of experience do you have?",
-                "Which position are you applying for?",
-                "Where are you currently located?",
-                "Please list your tech stack (languages, frameworks, and tools you know).",
-                "Technical_Q1", "Technical_A1",
-                "Technical_Q2", "Technical_A2",
-                "Technical_Q3", "Technical_A3",
-                "Technical_Q4", "Technical_A4",
-                "Technical_Q5", "Technical_A5"
-            ]
-            
-            for col in column_order:
-                if col not in structured_data:
-                    structured_data[col] = ""
-            
-            df = pd.DataFrame([structured_data], columns=column_order)
-            if os.path.exists(self.file_path):
-                df.to_csv(self.file_path, mode='a', index=False, header=False, encoding='utf-8')
-            else:
-                df.to_csv(self.file_path, index=False, encoding='utf-8')
-            
-            logger.info(f"Successfully saved candidate data to {self.file_path}")
-            return True
-            
+            with open(self.file_path, "r", encoding="utf-8", newline="") as f:
+                records = [
+                    {column: row.get(column) or "" for column in CSV_COLUMNS}
+                    for row in csv.DictReader(f)
+                ]
+            self.store.insert_many(records)
+            logger.info(f"Imported {len(records)} legacy candidate records from {self.file_path}")
+        except Exception as e:
+            logger.error(f"Error importing legacy candidate data: {e}")
+
+    def search_answers(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Find interviews whose technical answers mention all terms of ``query``.
+
+        Args:
+            query: Free-text search terms, e.g. "Kafka partitions"
+            limit: Maximum number of results
+
+        Returns:
+            Ranked matches (best first) with candidate details and a snippet
+        """
+        if self.answer_index is None:
+            return []
+        try:
+            return self.answer_index.search(query, limit)
         except Exception as e:
-            logger.error(f"Error saving candidate data: {e}")
-            return False
-    
-    def load_candidate_data(self) -> Optional[pd.DataFrame]:
+            logger.error(f"Error searching answers: {e}")
+            return []
+
+    def find_returning_candidate(self, email: Optional[str] = None,
+                                 phone: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Check whether a candidate with this email or phone was saved before.
+
+        Args:
+            email: Email address as entered or normalized
+            phone: Phone number as entered or normalized
+
+        Returns:
+            Match details (field, first_seen, last_seen, interviews), or None
+        """
+        if self.candidate_index is None:
+            return None
+        record = {
+            HEADER_BY_COLUMN["email"]: email or "",
+            HEADER_BY_COLUMN["phone"]: phone or "",
+        }
         try:
-            if os.path.exists(self.file_path):
-                df = pd.read_csv(self.file_path, encoding='utf-8')
-                logger.info(f"Loaded {len(df)} candidate records from {self.file_path}")
+            for field, key in identity_keys(record, self.phone_country_code):
+                match = self.candidate_index.lookup(field, key)
+                if match is not None:
+                    return {"field": field, **match}
+        except Exception as e:
+            logger.error(f"Error checking candidate index: {e}")
+        return None
+
+    def save_candidate_data(self, candidate_dict: Dict[str, Any], tech_questions: List[str] = None, tech_answers: Dict[str, str] = None,
+                            durable: bool = False, timeout: Optional[float] = 10.0) -> bool:
+        """Save one interview.
+
+        With the write-behind queue enabled the record is only enqueued and
+        the call returns immediately, unless ``durable`` is set, in which
+        case it waits until the record's batch has been committed. A durable
+        save that times out is withdrawn from the queue, so False always
+        means nothing was written and the save can be retried; if its batch
+        is already being committed, the commit's outcome is awaited instead.
+
+        Args:
+            candidate_dict: Basic-info answers keyed by question text
+            tech_questions: Technical questions asked
+            tech_answers: Answers keyed by "Tech Question N"
+            durable: Wait for the batch commit before returning
+            timeout: Maximum seconds to wait for queue room / commit
+
+        Returns:
+            bool: True if the record was accepted (or committed when durable)
+        """
+        with metrics.span("save_seconds", durable=durable):
+            try:
+                record = build_candidate_record(candidate_dict, tech_questions, tech_answers)
+
+                # Queued records are indexed after the flusher has committed their batch
+                if self.write_queue is not None:
+                    pending = self.write_queue.submit(record, timeout=timeout)
+                    if durable:
+                        if not pending.wait(timeout) and self.write_queue.cancel(pending):
+                            logger.warning(f"Save not committed within {timeout}s, withdrawn from the queue")
+                        # Resolved unless its batch is being committed right now
+                        saved = pending.wait()
+                        metrics.inc("saves", outcome="ok" if saved else "failed")
+                        return saved
+                    metrics.inc("saves", outcome="queued")
+                    return True
+
+                self.store.insert(record)
+                self._update_indexes()
+                metrics.inc("saves", outcome="ok")
+                logger.info(f"Successfully saved candidate data ({self.backend} backend)")
+                return True
+
+            except Exception as e:
+                metrics.inc("saves", outcome="failed")
+                logger.error(f"Error saving candidate data: {e}")
+                return False
+
+    def _update_indexes(self, committed: Optional[List[Dict[str, str]]] = None) -> Dict[str, int]:
+        """Index stored records past each index's high-water mark.
+
+        Runs at startup and after every commit. The committed batch passed
+        by the write queue is not indexed directly: reading back from the
+        store past the mark keeps the mark exact, so records saved while
+        the indexes were not updated (or by another process sharing them)
+        are taken in exactly once, and a failed save is never "seen".
+
+        Returns:
+            Number of records indexed, keyed by index name
+        """
+        indexed = {}
+        with self._index_lock:
+            if self.candidate_index is not None:
+                try:
+                    indexed["candidate"] = self._catch_up(
+                        self.candidate_index, ["interview_date", "email", "phone"],
+                        lambda batch: self.candidate_index.add_stored(batch, self.phone_country_code)
+                    )
+                except Exception as e:
+                    logger.error(f"Error updating candidate index: {e}")
+            if self.answer_index is not None:
+                try:
+                    indexed["answer search"] = self._catch_up(
+                        self.answer_index, INDEXED_COLUMNS, self.answer_index.add_stored
+                    )
+                except Exception as e:
+                    logger.error(f"Error updating answer search index: {e}")
+        return indexed
+
+    def _catch_up(self, index: Any, columns: Sequence[str], add_stored: Any) -> int:
+        indexed_id = index.indexed_id()
+        if indexed_id is None:
+            # Indexes built before the mark existed already cover every stored record
+            indexed_id = self._last_store_id() if index.count() > 0 else 0
+            index.set_indexed_id(indexed_id)
+        records = self.store.iter_records_after(indexed_id, columns)
+        indexed = 0
+        while True:
+            batch = list(islice(records, INDEX_BATCH_SIZE))
+            if not batch:
+                return indexed
+            indexed += add_stored(batch)
+
+    def _last_store_id(self) -> int:
+        last_id = 0
+        for last_id, _ in self.store.iter_records_after(0, ["interview_date"]):
+            pass
+        return last_id
+
+    def load_candidate_data(self, columns: Optional[Sequence[str]] = None,
+                            since: DateBound = None, until: DateBound = None) -> Optional["pd.DataFrame"]:
+        """Load stored interviews into a DataFrame (pandas is imported lazily).
+
+        Position and location are loaded as categoricals. For large datasets
+        prefer ``iter_candidate_frames``, which keeps memory constant.
+
+        Args:
+            columns: Projection as CSV headers or database columns (None for all)
+            since: Only interviews on or after this date (datetime or "YYYY-MM-DD..." prefix)
+            until: Only interviews before this date
+
+        Returns:
+            DataFrame of matching interviews, or None if nothing is stored
+        """
+        try:
+            if self.store.count() > 0:
+                df = self.store.load_dataframe(columns, since, until)
+                logger.info(f"Loaded {len(df)} candidate records ({self.backend} backend)")
                 return df
             else:
-                logger.info(f"No data file found at {self.file_path}")
+                logger.info(f"No candidate records stored ({self.backend} backend)")
                 return None
-                
+
         except Exception as e:
             logger.error(f"Error loading candidate data: {e}")
             return None
-    
+
+    def iter_candidate_data(self, columns: Optional[Sequence[str]] = None,
+                            since: DateBound = None, until: DateBound = None) -> Iterator[Dict[str, str]]:
+        """Stream stored interviews one record at a time, in insertion order.
+
+        Args:
+            columns: Projection as CSV headers or database columns (None for all)
+            since: Only interviews on or after this date
+            until: Only interviews before this date
+
+        Returns:
+            Iterator of records keyed by CSV header
+        """
+        return self.store.iter_records(columns, since, until)
+
+    def iter_candidate_frames(self, chunksize: int = 10000, columns: Optional[Sequence[str]] = None,
+                              since: DateBound = None, until: DateBound = None) -> Iterator["pd.DataFrame"]:
+        """Stream stored interviews as DataFrame chunks of at most ``chunksize`` rows.
+
+        Reporting and dedupe jobs can run in constant memory this way; see
+        ``load_candidate_data`` for the arguments.
+        """
+        return self.store.iter_frames(chunksize, columns, since, until)
+
+    def compact_archive(self) -> Optional[Dict[str, Any]]:
+        """Append newly stored interviews to the Parquet archive.
+
+        Returns:
+            Compaction summary, or None if archiving is disabled or failed
+        """
+        if self.archive is None:
+            return None
+        try:
+            return self.archive.compact(self.store)
+        except Exception as e:
+            logger.error(f"Error compacting candidate archive: {e}")
+            return None
+
+    def load_archived_candidates(self, columns: Optional[Sequence[str]] = None,
+                                 since: DateBound = None, until: DateBound = None,
+                                 where: Optional[Dict[str, str]] = None) -> Optional["pd.DataFrame"]:
+        """Query the Parquet archive, reading only the partitions and columns needed.
+
+        Interviews stored since the last compaction are not included.
+
+        Args:
+            columns: Projection as CSV headers or database columns (None for all)
+            since: Only interviews on or after this date
+            until: Only interviews before this date
+            where: Equality filters, e.g. {"position": "Backend Engineer"}
+
+        Returns:
+            DataFrame of matching interviews, or None if archiving is disabled or failed
+        """
+        if self.archive is None:
+            return None
+        try:
+            return self.archive.read(columns, since, until, where)
+        except Exception as e:
+            logger.error(f"Error loading archived candidate data: {e}")
+            return None
+
     def get_candidate_count(self) -> int:
+        """Return the number of stored interviews in constant time."""
         try:
-            df = self.load_candidate_data()
-            return len(df) if df is not None else 0
-        except Exception:
+            with metrics.span("candidate_count_seconds"):
+                return self.store.count()
+        except Exception as e:
+            logger.error(f"Error counting candidate records: {e}")
             return 0
 
+    def close(self) -> None:
+        """Drain pending writes and release the store."""
+        if self.write_queue is not None:
+            self.write_queue.close()
+        if self.candidate_index is not None:
+            self.candidate_index.close()
+        if self.answer_index is not None:
+            self.answer_index.close()
+        self.store.close()
+
+    def export_csv(self, export_path: Optional[str] = None) -> Optional[str]:
+        """Export all stored interviews to a CSV file.
+
+        Rows are streamed from the store, so the export runs in constant memory.
+
+        Args:
+            export_path: Destination file (defaults to the configured CSV path)
+
+        Returns:
+            Path of the written file, or None on failure
+        """
+        export_path = export_path or self.file_path
+        if self.backend == "csv" and os.path.abspath(export_path) == os.path.abspath(self.file_path):
+            return export_path
+
+        try:
+            tmp_path = export_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                write_records(f, self.store.iter_records())
+            os.replace(tmp_path, export_path)
+            logger.info(f"Exported candidate data to {export_path}")
+            return export_path
+        except Exception as e:
+            logger.error(f"Error exporting candidate data: {e}")
+            return None
+
 
 # Backward compatibility function
 def save_candidate_data(candidate_dict: Dict[str, Any], tech_questions: List[str] = None, tech_answers: Dict[str, str] = None) -> bool:
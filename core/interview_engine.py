@@ -0,0 +1,364 @@
+"""Headless Interview Engine for TalentScout Hiring Assistant
+
+Pure-Python state machine for one candidate interview. It has no
+Streamlit dependency: callers feed answers through ``submit`` and render
+the returned events, so the same engine backs the Streamlit UI, headless
+drivers, benchmarks, or an asyncio HTTP/WebSocket front end.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from utils import sanitize_input
+from core.question_feed import QuestionFeed
+from core.candidate_index import IDENTITY_FIELDS
+from core.validation import QUESTION_IDS, RAW_NORMALIZED_FIELDS, FieldValidator, get_validators
+
+EXIT_COMMANDS = ("exit", "quit", "bye", "end")
+
+# Version of the to_dict() layout, bumped on incompatible changes
+STATE_FORMAT_VERSION = 1
+
+
+class InterviewPhases:
+    BASIC_INFO = "basic_info"
+    TECHNICAL = "technical"
+    COMPLETED = "completed"
+
+
+class EventKinds:
+    USER = "user"              # accepted answer, echoed into the chat history
+    ASSISTANT = "assistant"    # assistant message added to the chat history
+    ERROR = "error"            # rejected answer; not stored, shown once
+    EXIT = "exit"              # candidate ended the chat
+    PHASE = "phase"            # interview moved to another phase
+    COMPLETED = "completed"    # all questions answered
+
+
+class InterviewEvent:
+    """Something the front end should render after a submit."""
+
+    __slots__ = ("kind", "text")
+
+    def __init__(self, kind: str, text: str = ""):
+        self.kind = kind
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"InterviewEvent({self.kind!r}, {self.text!r})"
+
+
+class ChatMessage:
+    """One chat history entry.
+
+    User messages reference the same string object stored as the answer,
+    so the history never holds a second copy of long answers.
+    """
+
+    __slots__ = ("role", "content")
+
+    def __init__(self, role: str, content: str):
+        self.role = role
+        self.content = content
+
+    def __repr__(self) -> str:
+        return f"ChatMessage({self.role!r}, {self.content!r})"
+
+
+# Fixed assistant messages are shared by every session instead of copied per interview
+TECH_FAREWELL = "👋 Thanks for participating in the technical interview! We'll review your responses and get back to you soon."
+BASIC_FAREWELL = "👋 Thanks for chatting with TalentScout! We'll review your details and get back to you soon."
+RETURNING_CANDIDATE_MESSAGE = ("👋 Welcome back! Our records show you've already completed an interview "
+                               "with TalentScout, so there's no need to repeat it. We'll be in touch soon.")
+TRANSITION_MESSAGE = "✅ Thanks for the basic details! Now let's move to the technical interview section."
+COMPLETION_MESSAGE = "🎉 Excellent! You've completed both the basic information and technical interview sections."
+
+
+class InterviewPrompt:
+    """The question currently waiting for an answer."""
+
+    __slots__ = ("section", "label", "text", "number", "total")
+
+    def __init__(self, section: str, label: str, text: str, number: int, total: int):
+        self.section = section
+        self.label = label
+        self.text = text
+        self.number = number
+        self.total = total
+
+    @property
+    def progress(self) -> float:
+        return min(self.number / self.total, 1.0) if self.total else 1.0
+
+
+class InterviewSession:
+    """State machine driving one interview from greeting to completion.
+
+    Args:
+        basic_questions: Basic-info questions in the order they are asked
+        tech_stack_question: Which basic question holds the tech stack
+        question_source: Starts technical question generation for a tech
+            stack and returns the feed the questions arrive in
+        max_tech_questions: Upper bound used for progress while questions stream in
+        min_answer_length: Minimum characters for a technical answer
+        max_experience_years: Upper bound for the experience answer
+        phone_country_code: Country code assumed for 10-digit phone numbers
+        seen_before: Optional check called with (question ID, normalized
+            answer) for identity questions (email, phone); returning True
+            ends the interview before any technical questions are generated
+    """
+
+    __slots__ = (
+        "basic_questions", "tech_stack_question", "question_source", "max_tech_questions",
+        "min_answer_length", "max_experience_years", "validators", "seen_before",
+        "phase", "step", "tech_step", "candidate", "tech_questions", "answers",
+        "messages", "exited", "question_feed"
+    )
+
+    def __init__(self, basic_questions: List[str], tech_stack_question: str,
+                 question_source: Callable[[str], QuestionFeed],
+                 max_tech_questions: int = 5, min_answer_length: int = 10,
+                 max_experience_years: int = 50, phone_country_code: str = "1",
+                 seen_before: Optional[Callable[[str, str], bool]] = None):
+        self.basic_questions = basic_questions
+        self.tech_stack_question = tech_stack_question
+        self.question_source = question_source
+        self.max_tech_questions = max_tech_questions
+        self.min_answer_length = min_answer_length
+        self.max_experience_years = max_experience_years
+        self.validators = get_validators(max_experience_years, phone_country_code)
+        self.seen_before = seen_before
+
+        self.phase = InterviewPhases.BASIC_INFO
+        self.step = 0
+        self.tech_step = 0
+        self.candidate: Dict[str, str] = {}
+        self.tech_questions: List[str] = []
+        self.answers: List[str] = []
+        self.messages: List[ChatMessage] = []
+        self.exited = False
+
+        # Process-local: the background job filling in technical questions
+        self.question_feed: Optional[QuestionFeed] = None
+
+    @property
+    def completed(self) -> bool:
+        return self.phase == InterviewPhases.COMPLETED
+
+    @property
+    def tech_answers(self) -> Dict[str, str]:
+        """Technical answers keyed by "Tech Question N" (the storage layout), built on demand."""
+        return {f"Tech Question {i}": answer for i, answer in enumerate(self.answers, 1)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable progress of the interview, for an external session store.
+
+        Wiring (questions, callbacks, limits) is not included; it comes from
+        the process that restores the session.
+        """
+        return {
+            "v": STATE_FORMAT_VERSION,
+            "phase": self.phase,
+            "step": self.step,
+            "tech_step": self.tech_step,
+            "candidate": self.candidate,
+            "tech_questions": self.tech_questions,
+            "answers": self.answers,
+            "messages": [[message.role, message.content] for message in self.messages],
+            "exited": self.exited,
+            "generating": self.question_feed is not None,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Load progress saved by ``to_dict``, possibly in another process.
+
+        The question feed is process-local. If questions were still being
+        generated, generation restarts when none had arrived yet; otherwise
+        the questions received so far become the final set, so answered
+        questions never change.
+
+        Raises:
+            ValueError: If the state was written in an unsupported format
+        """
+        if state.get("v") != STATE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported interview state format: {state.get('v')}")
+
+        self.phase = state["phase"]
+        self.step = state["step"]
+        self.tech_step = state["tech_step"]
+        self.candidate = state["candidate"]
+        self.tech_questions = state["tech_questions"]
+        self.answers = state["answers"]
+        self.messages = [ChatMessage(role, content) for role, content in state["messages"]]
+        self.exited = state["exited"]
+        self.question_feed = None
+
+        tech_stack = self.candidate.get(self.tech_stack_question)
+        if state["generating"] and not self.tech_questions and tech_stack and not self.exited:
+            self.question_feed = self.question_source(tech_stack)
+        elif self.phase == InterviewPhases.TECHNICAL:
+            # Completes the interview if every received question was answered
+            self.refresh(timeout=0)
+
+    def start(self, greeting: str) -> List[InterviewEvent]:
+        """Add the greeting once, before the first question."""
+        if self.messages or self.step:
+            return []
+        self.messages.append(ChatMessage("assistant", greeting))
+        return [InterviewEvent(EventKinds.ASSISTANT, greeting)]
+
+    def validate_answer(self, answer: str, question_index: int) -> Optional[str]:
+        """Validate a basic-info answer.
+
+        Returns:
+            Optional[str]: Error message if validation fails, None if valid
+        """
+        validator = self._validator(question_index)
+        if validator is not None and not validator.check(answer):
+            return validator.error
+        return None
+
+    def _validator(self, question_index: int) -> Optional[FieldValidator]:
+        """Registry entry for a basic question; questions without an ID are not validated."""
+        question_id = QUESTION_IDS.get(self.basic_questions[question_index])
+        return self.validators.get(question_id)
+
+    def refresh(self, timeout: Optional[float] = 0) -> List[InterviewEvent]:
+        """Pull newly generated technical questions from the feed.
+
+        Waits up to ``timeout`` seconds for the question of the current
+        step, and completes the interview once the final question set is
+        known and fully answered.
+        """
+        if self.phase != InterviewPhases.TECHNICAL:
+            return []
+
+        feed = self.question_feed
+        if feed is not None:
+            feed.wait_for(self.tech_step + 1, timeout)
+            self.tech_questions = feed.questions
+            if feed.done:
+                self.question_feed = None
+
+        if self.question_feed is None and self.tech_step >= len(self.tech_questions):
+            return self._complete()
+        return []
+
+    @property
+    def waiting_for_questions(self) -> bool:
+        """True while the current technical question has not been generated yet."""
+        return (self.phase == InterviewPhases.TECHNICAL and
+                self.tech_step >= len(self.tech_questions) and
+                self.question_feed is not None)
+
+    def current_prompt(self) -> Optional[InterviewPrompt]:
+        """Return the question awaiting an answer, if one is available."""
+        if self.phase == InterviewPhases.BASIC_INFO and self.step < len(self.basic_questions):
+            return InterviewPrompt(
+                "Basic Information", "Question", self.basic_questions[self.step],
+                self.step + 1, len(self.basic_questions)
+            )
+
+        if self.phase == InterviewPhases.TECHNICAL and self.tech_step < len(self.tech_questions):
+            # While questions are still streaming in, the final count is not known yet
+            total = len(self.tech_questions)
+            if self.question_feed is not None:
+                total = max(total, self.max_tech_questions)
+            return InterviewPrompt(
+                "Technical Interview", "Technical Question", self.tech_questions[self.tech_step],
+                self.tech_step + 1, total
+            )
+        return None
+
+    def submit(self, answer: str) -> List[InterviewEvent]:
+        """Process one answer from the candidate.
+
+        Args:
+            answer: Raw text typed by the candidate
+
+        Returns:
+            Events for the front end to render, in order
+        """
+        if self.completed or self.exited:
+            return []
+
+        if answer.lower() in EXIT_COMMANDS:
+            self.exited = True
+            farewell = TECH_FAREWELL if self.phase == InterviewPhases.TECHNICAL else BASIC_FAREWELL
+            self.messages.append(ChatMessage("assistant", farewell))
+            return [InterviewEvent(EventKinds.EXIT, farewell)]
+
+        raw_answer = answer
+        answer = sanitize_input(answer)
+
+        if self.phase == InterviewPhases.BASIC_INFO:
+            return self._submit_basic(answer, raw_answer)
+        return self._submit_technical(answer)
+
+    def _submit_basic(self, answer: str, raw_answer: str) -> List[InterviewEvent]:
+        if len(answer.strip()) == 0:
+            return [InterviewEvent(EventKinds.ERROR, "⚠️ Sorry, I didn't catch that. Could you please rephrase?")]
+
+        validation_error = self.validate_answer(answer, self.step)
+        if validation_error:
+            return [InterviewEvent(EventKinds.ERROR, validation_error)]
+
+        events = [InterviewEvent(EventKinds.USER, answer)]
+        self.messages.append(ChatMessage("user", answer))
+
+        question_key = self.basic_questions[self.step]
+        validator = self._validator(self.step)
+        if validator is not None and validator.normalize is not None:
+            answer = validator.normalize(raw_answer if validator.field in RAW_NORMALIZED_FIELDS else answer)
+        self.candidate[question_key] = answer
+        self.step += 1
+
+        # Short-circuit returning candidates before an LLM call is spent on them
+        if (self.seen_before is not None and validator is not None and
+                validator.field in IDENTITY_FIELDS and self.seen_before(validator.field, answer)):
+            self.exited = True
+            self.messages.append(ChatMessage("assistant", RETURNING_CANDIDATE_MESSAGE))
+            events.append(InterviewEvent(EventKinds.EXIT, RETURNING_CANDIDATE_MESSAGE))
+            return events
+
+        # Start generating as soon as the tech stack is known
+        if question_key == self.tech_stack_question:
+            self.question_feed = self.question_source(answer)
+
+        if self.step == len(self.basic_questions):
+            if self.question_feed is None and not self.tech_questions:
+                self.question_feed = self.question_source(self.candidate[self.tech_stack_question])
+
+            self.messages.append(ChatMessage("assistant", TRANSITION_MESSAGE))
+            self.phase = InterviewPhases.TECHNICAL
+            self.tech_step = 0
+            events.append(InterviewEvent(EventKinds.ASSISTANT, TRANSITION_MESSAGE))
+            events.append(InterviewEvent(EventKinds.PHASE, self.phase))
+
+        return events
+
+    def _submit_technical(self, answer: str) -> List[InterviewEvent]:
+        if self.tech_step >= len(self.tech_questions):
+            return [InterviewEvent(EventKinds.ERROR, "⏳ Your next question is still being prepared. Please wait a moment.")]
+
+        if len(answer.strip()) < self.min_answer_length:
+            return [InterviewEvent(
+                EventKinds.ERROR,
+                f"⚠️ Please provide a more detailed answer (at least {self.min_answer_length} characters). Technical questions require thoughtful responses."
+            )]
+
+        events = [InterviewEvent(EventKinds.USER, answer)]
+        self.messages.append(ChatMessage("user", answer))
+
+        self.answers.append(answer)
+        self.tech_step += 1
+
+        events.extend(self.refresh(timeout=0))
+        return events
+
+    def _complete(self) -> List[InterviewEvent]:
+        self.messages.append(ChatMessage("assistant", COMPLETION_MESSAGE))
+        self.phase = InterviewPhases.COMPLETED
+        return [
+            InterviewEvent(EventKinds.ASSISTANT, COMPLETION_MESSAGE),
+            InterviewEvent(EventKinds.COMPLETED)
+        ]
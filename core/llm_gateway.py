@@ -0,0 +1,242 @@
+"""LLM Gateway for TalentScout Hiring Assistant
+
+Single entry point for chat completions built on ``AsyncOpenAI``. One
+gateway per process owns a background event loop, a pooled HTTP client,
+a global concurrency limit and a token-bucket rate limiter. Every call
+has a deadline and transient upstream errors (429/5xx, connection
+failures) are retried with jittered exponential backoff. Synchronous
+wrappers let Streamlit worker threads use it without blocking on an
+unbounded upstream wait.
+"""
+
+import asyncio
+import queue
+import random
+import threading
+import time
+import logging
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_STREAM_DONE = object()
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """Raised when a completion does not finish within its deadline."""
+
+
+class TokenBucket:
+    """Async token bucket limiting request starts to ``rate`` per second."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _record_usage(usage: Any, totals: Optional[Dict[str, int]]) -> None:
+    """Count the tokens of a completion, adding them to ``totals`` if given."""
+    if usage is None:
+        return
+    for kind in ("prompt", "completion"):
+        tokens = getattr(usage, f"{kind}_tokens", None) or 0
+        metrics.inc("llm_tokens", tokens, kind=kind)
+        if totals is not None:
+            totals[kind] = totals.get(kind, 0) + tokens
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Transient upstream failures worth retrying: 429, 5xx, timeouts and connection errors."""
+    import openai
+
+    if isinstance(error, (openai.RateLimitError, openai.APIConnectionError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+class LLMGateway:
+    """Process-wide async OpenAI gateway with pooling, limits and retries.
+
+    Args:
+        api_key: OpenAI API key
+        model: Default chat model
+        base_url: Optional API base URL (e.g. a local test server)
+        request_timeout: Per-attempt HTTP timeout in seconds
+        max_retries: Retries after the first attempt for transient errors
+        max_concurrency: Maximum in-flight requests across the process
+        requests_per_minute: Request start rate matched to the API tier
+        max_connections: Size of the shared HTTP connection pool
+    """
+
+    def __init__(self, api_key: str, model: str, base_url: Optional[str] = None,
+                 request_timeout: float = 20.0, max_retries: int = 3,
+                 max_concurrency: int = 8, requests_per_minute: float = 500,
+                 max_connections: int = 20, backoff_base: float = 0.5, backoff_cap: float = 8.0):
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.rate_limiter = TokenBucket(requests_per_minute / 60.0)
+
+        self._client = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-gateway", daemon=True)
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def _get_client(self):
+        """Create the AsyncOpenAI client and its pooled HTTP client on first use."""
+        if self._client is None:
+            import httpx
+            from openai import AsyncOpenAI
+
+            http_client = httpx.AsyncClient(
+                timeout=self.request_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                max_retries=0,
+                timeout=self.request_timeout,
+                http_client=http_client
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt."""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    async def _create(self, **kwargs: Any):
+        """Start a completion under the rate limiter, retrying transient errors."""
+        client = self._get_client()
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            try:
+                return await client.chat.completions.create(model=self.model, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = self._backoff(attempt)
+                metrics.inc("llm_retries")
+                logger.warning(f"LLM request failed ({e}); retry {attempt + 1}/{self.max_retries} in {delay:.2f}s")
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def complete(self, messages: List[Dict[str, str]], usage: Optional[Dict[str, int]] = None,
+                       **kwargs: Any) -> Any:
+        """Run a non-streaming chat completion and return the response.
+
+        Token usage is counted in the metrics and, if ``usage`` is given,
+        added to it as "prompt" and "completion" totals.
+        """
+        self._get_client()
+        async with self._semaphore:
+            response = await self._create(messages=messages, **kwargs)
+        _record_usage(getattr(response, "usage", None), usage)
+        return response
+
+    async def stream(self, messages: List[Dict[str, str]], usage: Optional[Dict[str, int]] = None,
+                     **kwargs: Any) -> AsyncIterator[str]:
+        """Run a streaming chat completion, yielding content deltas.
+
+        Retries only apply to starting the stream; once content has been
+        yielded a failure propagates to the caller. Token usage is reported
+        in the final chunk and recorded as in ``complete``.
+        """
+        self._get_client()
+        async with self._semaphore:
+            stream = await self._create(
+                messages=messages, stream=True, stream_options={"include_usage": True}, **kwargs
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if getattr(chunk, "usage", None) is not None:
+                    _record_usage(chunk.usage, usage)
+
+    def complete_sync(self, messages: List[Dict[str, str]], deadline: float, **kwargs: Any) -> Any:
+        """Blocking ``complete`` for worker threads.
+
+        Raises:
+            LLMDeadlineExceeded: If no response arrived within ``deadline`` seconds
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(self.complete(messages, **kwargs), deadline), self._loop
+        )
+        try:
+            return future.result()
+        except (asyncio.TimeoutError, TimeoutError) as e:
+            raise LLMDeadlineExceeded(f"LLM completion exceeded {deadline:.1f}s deadline") from e
+
+    def stream_sync(self, messages: List[Dict[str, str]], deadline: float, **kwargs: Any) -> Iterator[str]:
+        """Blocking iterator over ``stream`` for worker threads.
+
+        Raises:
+            LLMDeadlineExceeded: If the stream has not finished within ``deadline`` seconds
+        """
+        pieces: "queue.Queue[Any]" = queue.Queue()
+
+        async def pump() -> None:
+            async def produce() -> None:
+                async for piece in self.stream(messages, **kwargs):
+                    pieces.put(piece)
+            try:
+                await asyncio.wait_for(produce(), deadline)
+                pieces.put(_STREAM_DONE)
+            except asyncio.TimeoutError:
+                pieces.put(LLMDeadlineExceeded(f"LLM stream exceeded {deadline:.1f}s deadline"))
+            except Exception as e:
+                pieces.put(e)
+
+        future = asyncio.run_coroutine_threadsafe(pump(), self._loop)
+        try:
+            while True:
+                item = pieces.get()
+                if item is _STREAM_DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            future.cancel()
+
+    def close(self) -> None:
+        """Close the HTTP pool and stop the event loop."""
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.close(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -0,0 +1,242 @@
+"""Performance Metrics for TalentScout Hiring Assistant
+
+A small in-process registry of counters and latency histograms for the
+interview hot paths (reruns, question generation, saves, LLM tokens).
+It is exposed as Prometheus text on an HTTP port and/or dumped to a JSON
+file periodically.
+
+Metrics are disabled by default. Every recording call then returns after
+a single attribute check, and ``span`` hands out a shared no-op context
+manager, so instrumented code costs nothing measurable.
+"""
+
+import json
+import os
+import threading
+import time
+import logging
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "talentscout_"
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Bucket bounds for token-count histograms
+TOKEN_BUCKETS = (0, 100, 250, 500, 750, 1000, 1500, 2000, 3000, 5000)
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Span:
+    """Times a block and records it as a histogram observation."""
+
+    __slots__ = ("registry", "name", "labels", "started")
+
+    def __init__(self, registry: "Metrics", name: str, labels: Dict[str, str]):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self) -> "_Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.registry.observe(self.name, time.perf_counter() - self.started, **self.labels)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _label_set(labels: Dict[str, Any]) -> LabelSet:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: LabelSet, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + "}"
+
+
+class Metrics:
+    """Thread-safe registry of counters and histograms."""
+
+    def __init__(self, enabled: bool = False, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._buckets_by_name: Dict[str, Tuple[float, ...]] = {}
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelSet], float] = {}
+        self._histograms: Dict[Tuple[str, LabelSet], _Histogram] = {}
+
+    def set_buckets(self, name: str, buckets: Sequence[float]) -> None:
+        """Use other bucket bounds than the latency defaults for a histogram."""
+        self._buckets_by_name[name] = tuple(buckets)
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add ``value`` to a counter."""
+        if not self.enabled:
+            return
+        key = (name, _label_set(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record one observation (usually seconds) in a histogram."""
+        if not self.enabled:
+            return
+        key = (name, _label_set(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                bounds = self._buckets_by_name.get(name, self.buckets)
+                histogram = self._histograms[key] = _Histogram(bounds)
+            for i, bound in enumerate(histogram.bounds):
+                if value <= bound:
+                    histogram.counts[i] += 1
+                    break
+            histogram.sum += value
+            histogram.count += 1
+
+    def span(self, name: str, **labels: Any):
+        """Context manager timing a block into the ``name`` histogram."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, labels)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current values as plain data (the JSON dump layout)."""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {
+                    "name": name, "labels": dict(labels), "count": histogram.count,
+                    "sum": histogram.sum, "buckets": dict(zip(map(str, histogram.bounds), histogram.counts)),
+                }
+                for (name, labels), histogram in sorted(self._histograms.items())
+            ]
+        return {
+            "timestamp": time.time(),
+            "uptime_seconds": time.time() - self.started_at,
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+    def render_prometheus(self) -> str:
+        """Current values in the Prometheus text exposition format."""
+        lines = []
+        typed = set()
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                metric = f"{PREFIX}{name}_total"
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                metric = f"{PREFIX}{name}"
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(histogram.bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{metric}_bucket{_format_labels(labels, ('le', f'{bound:g}'))} {cumulative}")
+                lines.append(f"{metric}_bucket{_format_labels(labels, ('le', '+Inf'))} {histogram.count}")
+                lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum:g}")
+                lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump_json(self, path: str) -> None:
+        """Atomically write the current snapshot to ``path``."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+
+
+# Process-wide registry used by the instrumented modules
+metrics = Metrics()
+
+
+def start_http_server(port: int, host: str = "0.0.0.0", registry: Metrics = metrics):
+    """Serve ``/metrics`` (Prometheus text) and ``/metrics.json`` from a daemon thread.
+
+    Returns:
+        The running ThreadingHTTPServer (call ``shutdown()`` to stop it)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            path = self.path.split("?")[0]
+            if path == "/metrics":
+                body = registry.render_prometheus().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/metrics.json":
+                body = json.dumps(registry.snapshot()).encode("utf-8")
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+    return server
+
+
+def start_json_dump(path: str, interval: float, registry: Metrics = metrics) -> threading.Event:
+    """Dump the registry to ``path`` every ``interval`` seconds; set the returned event to stop."""
+    stopped = threading.Event()
+
+    def run() -> None:
+        while not stopped.wait(interval):
+            try:
+                registry.dump_json(path)
+            except Exception as e:
+                logger.warning(f"Metrics dump to {path} failed: {e}")
+
+    threading.Thread(target=run, name="metrics-dump", daemon=True).start()
+    return stopped
@@ -2,55 +2,170 @@
 
 Contains carefully crafted prompt templates for AI-powered question
 generation with consistent formatting and quality standards.
+
+Question prompts are kept within a token budget: the instructions form
+a fixed system message (an identical prefix on every call, which
+providers can cache), the candidate's tech stack is de-duplicated and
+truncated, and ``max_tokens`` follows from the number of questions.
 """
 
+import math
+from typing import Dict, List
+
+from core.question_cache import STACK_SEPARATORS, TECH_ALIASES
+
+# Average characters per token of English text for GPT tokenizers
+CHARS_PER_TOKEN = 4
+# Completion budget per numbered question line, plus slack for stray text
+TOKENS_PER_QUESTION = 60
+COMPLETION_TOKEN_SLACK = 20
+# Tech stack budget; a list of technologies rarely needs more
+DEFAULT_STACK_TOKEN_LIMIT = 64
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token count estimate (about 4 characters per token)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def compact_tech_stack(tech_stack: str, max_tokens: int = DEFAULT_STACK_TOKEN_LIMIT) -> str:
+    """De-duplicate a tech stack and truncate it to a token budget.
+    
+    Items are split like the question cache key (commas, slashes, "and",
+    ...), kept in the candidate's order and spelling, and dropped when
+    they repeat an earlier item or an alias of it. Whole items are kept
+    while they fit; a single oversized item (pasted prose) is cut.
+    
+    Args:
+        tech_stack: Candidate's technology stack as typed
+        max_tokens: Estimated token budget for the result
+        
+    Returns:
+        Comma-separated technologies within the budget
+    """
+    budget = max_tokens * CHARS_PER_TOKEN
+    seen = set()
+    items = []
+    for raw in STACK_SEPARATORS.split(tech_stack or ""):
+        item = " ".join(raw.split()).strip(" .")
+        key = TECH_ALIASES.get(item.casefold(), item.casefold())
+        if item and key not in seen:
+            seen.add(key)
+            items.append(item)
+    
+    kept = []
+    used = 0
+    for item in items:
+        used += len(item) + (2 if kept else 0)
+        if used > budget:
+            break
+        kept.append(item)
+    if not kept and items:
+        return items[0][:budget].rstrip()
+    return ", ".join(kept)
+
 
 class PromptTemplates:
     """Collection of prompt templates for different interview scenarios."""
     
+    TECH_QUESTIONS_INSTRUCTIONS = (
+        "You are a professional technical interviewer. Write exactly {count} intermediate-level "
+        "interview questions for the tech stack the candidate gives. Focus on practical experience "
+        "and problem-solving, mixing concepts with real-world use. Make each question specific to "
+        "the listed technologies, suitable for a 15-20 minute interview, and not a coding task. "
+        "Reply with the numbered questions only, one per line (1. to {count}.)."
+    )
+    
+    BATCH_TECH_QUESTIONS_INSTRUCTIONS = (
+        "You are a professional technical interviewer. For each numbered candidate, write exactly "
+        "{count} intermediate-level interview questions for that candidate's tech stack. Focus on "
+        "practical experience and problem-solving, mixing concepts with real-world use. Make each "
+        "question specific to the candidate's technologies, suitable for a 15-20 minute interview, "
+        "and not a coding task. Reply with a JSON object mapping each candidate number to an array "
+        'of question strings, e.g. {{"1": ["...", "..."], "2": ["...", "..."]}}.'
+    )
+    # Completion tokens per candidate for JSON keys, quotes and commas
+    BATCH_TOKEN_OVERHEAD = 15
+    
+    @classmethod
+    def tech_questions_system_prompt(cls, num_questions: int = 5) -> str:
+        """Fixed instructions for question generation (the cacheable prompt prefix)."""
+        return cls.TECH_QUESTIONS_INSTRUCTIONS.format(count=num_questions)
+    
     @staticmethod
-    def generate_tech_questions_prompt(tech_stack: str) -> str:
-        """Generate prompt for AI-powered technical question creation.
+    def tech_questions_user_prompt(tech_stack: str,
+                                   stack_token_limit: int = DEFAULT_STACK_TOKEN_LIMIT) -> str:
+        """Generate the per-candidate user message of the question generation prompt.
         
-        Creates a structured prompt that instructs the AI to generate
-        relevant, practical technical questions based on the candidate's
-        technology stack.
+        Args:
+            tech_stack: Candidate's technology stack and skills
+            stack_token_limit: Token budget for the compacted tech stack
+            
+        Returns:
+            User message naming the candidate's technologies
+        """
+        return f"Tech stack: {compact_tech_stack(tech_stack, stack_token_limit)}"
+    
+    @classmethod
+    def tech_questions_messages(cls, tech_stack: str, num_questions: int = 5,
+                                stack_token_limit: int = DEFAULT_STACK_TOKEN_LIMIT) -> List[Dict[str, str]]:
+        """Build the chat messages for a technical question generation call.
         
         Args:
             tech_stack: Candidate's technology stack and skills
+            num_questions: Number of questions to ask for
+            stack_token_limit: Token budget for the compacted tech stack
             
         Returns:
-            Formatted prompt string for GPT API call
+            System and user messages for the chat completion API
         """
-        return f"""Generate exactly 5 technical interview questions for a candidate with the following tech stack: {tech_stack}
-
-Requirements:
-- Each question should be on a separate line
-- Number each question (1., 2., 3., etc.)
-- Focus on practical experience and problem-solving
-- Mix of conceptual understanding and real-world application
-- Difficulty level: intermediate
-- Avoid questions requiring code implementation
-- Make questions specific to the mentioned technologies
-- Questions should be suitable for a 15-20 minute interview
-
-Format example:
-1. Question about technology A
-2. Question about technology B
-3. Question about problem-solving
-4. Question about best practices
-5. Question about experience/challenges
-
-Generate the questions now:"""
+        return [
+            {"role": "system", "content": cls.tech_questions_system_prompt(num_questions)},
+            {"role": "user", "content": cls.tech_questions_user_prompt(tech_stack, stack_token_limit)}
+        ]
+    
+    @staticmethod
+    def tech_questions_max_tokens(num_questions: int = 5) -> int:
+        """Completion token limit for a question set of this size."""
+        return num_questions * TOKENS_PER_QUESTION + COMPLETION_TOKEN_SLACK
+    
+    @classmethod
+    def batch_tech_questions_messages(cls, tech_stacks: List[str], num_questions: int = 5,
+                                      stack_token_limit: int = DEFAULT_STACK_TOKEN_LIMIT) -> List[Dict[str, str]]:
+        """Build the messages for one JSON-mode call generating questions for several candidates.
+        
+        Args:
+            tech_stacks: Tech stacks of the batched candidates, numbered from 1 in the prompt
+            num_questions: Number of questions per candidate
+            stack_token_limit: Token budget for each compacted tech stack
+            
+        Returns:
+            System and user messages for the chat completion API
+        """
+        stacks = "\n".join(
+            f"{i}. {compact_tech_stack(stack, stack_token_limit)}" for i, stack in enumerate(tech_stacks, 1)
+        )
+        return [
+            {"role": "system", "content": cls.BATCH_TECH_QUESTIONS_INSTRUCTIONS.format(count=num_questions)},
+            {"role": "user", "content": f"Candidate tech stacks:\n{stacks}"}
+        ]
+    
+    @classmethod
+    def batch_tech_questions_max_tokens(cls, batch_size: int, num_questions: int = 5) -> int:
+        """Completion token limit for a batch of question sets."""
+        return batch_size * (cls.tech_questions_max_tokens(num_questions) + cls.BATCH_TOKEN_OVERHEAD)
 
 
-def generate_tech_questions_prompt(tech_stack: str) -> str:
+def generate_tech_questions_prompt(tech_stack: str, num_questions: int = 5) -> str:
     """Legacy function for backward compatibility.
     
     Args:
         tech_stack: Candidate's technology stack
+        num_questions: Number of questions to ask for
         
     Returns:
-        Formatted prompt string for GPT API call
+        Formatted prompt string for GPT API call: the instructions followed
+        by the candidate's tech stack, usable as a single user message
     """
-    return PromptTemplates.generate_tech_questions_prompt(tech_stack)
+    return (f"{PromptTemplates.tech_questions_system_prompt(num_questions)}\n\n"
+            f"{PromptTemplates.tech_questions_user_prompt(tech_stack)}")
@@ -0,0 +1,235 @@
+"""Offline Question Bank for TalentScout Hiring Assistant
+
+Pre-generates technical question sets for common tech stacks so that,
+at interview time, they are served with zero LLM latency. The bank is a
+versioned JSON file; live generation remains the fallback for stacks the
+bank has not seen.
+
+Build or extend the bank off-peak with:
+
+    python -m core.question_bank --stacks "Python, Django" "React, TypeScript"
+    python -m core.question_bank --from-data --top 50 --sets-per-stack 3 --workers 4
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from core.prompt_templates import PromptTemplates
+from core.question_cache import normalize_tech_stack
+
+logger = logging.getLogger(__name__)
+
+BANK_FORMAT_VERSION = 1
+TECH_STACK_COLUMN = "Please list your tech stack (languages, frameworks, and tools you know)."
+
+
+class QuestionBank:
+    """Read side of the versioned question bank file.
+
+    The file is reloaded automatically when its mtime changes, so a bank
+    rebuilt by the CLI is picked up without restarting the app.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.version = 0
+        self.entries: Dict[str, List[List[str]]] = {}
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> None:
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            self.entries, self.version, self._mtime_ns = {}, 0, None
+            return
+        if mtime_ns == self._mtime_ns:
+            return
+
+        data = load_bank_file(self.path)
+        self.entries = data["entries"]
+        self.version = data["version"]
+        self._mtime_ns = mtime_ns
+        logger.info(f"Loaded question bank v{self.version} with {len(self.entries)} stacks")
+
+    def get(self, stack_key: str) -> Optional[List[str]]:
+        """Return a random pre-generated question set for the stack, if any."""
+        with self._lock:
+            try:
+                self._refresh()
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load question bank: {e}")
+                return None
+            question_sets = self.entries.get(stack_key)
+        return list(random.choice(question_sets)) if question_sets else None
+
+
+def load_bank_file(path: str) -> Dict:
+    """Load a bank file, returning an empty bank if it does not exist.
+
+    Raises:
+        ValueError: If the file was written by an unsupported format version
+    """
+    if not os.path.exists(path):
+        return {"format": BANK_FORMAT_VERSION, "version": 0, "entries": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") != BANK_FORMAT_VERSION:
+        raise ValueError(f"Unsupported question bank format: {data.get('format')}")
+    return data
+
+
+def save_bank_file(path: str, entries: Dict[str, List[List[str]]], version: int, model: str) -> None:
+    """Atomically write a new bank version."""
+    data = {
+        "format": BANK_FORMAT_VERSION,
+        "version": version,
+        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "model": model,
+        "entries": entries,
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def mine_tech_stacks(records: Iterable[Dict[str, str]], top: int, min_count: int = 1) -> List[str]:
+    """Return the most frequent canonical tech stacks in stored interviews."""
+    counts = Counter(
+        normalize_tech_stack(record.get(TECH_STACK_COLUMN, "")) for record in records
+    )
+    counts.pop("", None)
+    return [stack for stack, count in counts.most_common(top) if count >= min_count]
+
+
+def generate_question_set(llm, tech_stack: str, max_questions: int, deadline: float) -> Optional[List[str]]:
+    """Generate one question set through the LLM gateway.
+
+    Returns:
+        Parsed questions, or None if generation failed (fallback questions
+        are never written to the bank)
+    """
+    from utils import parse_tech_questions
+
+    try:
+        response = llm.complete_sync(
+            messages=PromptTemplates.tech_questions_messages(tech_stack, max_questions),
+            deadline=deadline,
+            temperature=0.7,
+            max_tokens=PromptTemplates.tech_questions_max_tokens(max_questions)
+        )
+        questions = parse_tech_questions(response.choices[0].message.content, max_questions)
+        return questions if len(questions) >= 3 else None
+    except Exception as e:
+        logger.error(f"Error generating questions for '{tech_stack}': {e}")
+        return None
+
+
+def build_bank(llm, stacks: List[str], output: str, sets_per_stack: int, workers: int,
+               max_questions: int, deadline: float, model: str) -> Dict[str, int]:
+    """Generate missing question sets for every stack and write a new bank version.
+
+    Existing sets are kept; each stack is topped up to ``sets_per_stack``.
+    """
+    data = load_bank_file(output)
+    entries: Dict[str, List[List[str]]] = data["entries"]
+
+    jobs = []
+    stack_keys = dict.fromkeys(normalize_tech_stack(stack) for stack in stacks)
+    for stack_key in stack_keys:
+        if not stack_key:
+            continue
+        missing = sets_per_stack - len(entries.get(stack_key, []))
+        jobs.extend([stack_key] * max(missing, 0))
+
+    generated = failed = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        futures = {
+            pool.submit(generate_question_set, llm, stack_key, max_questions, deadline): stack_key
+            for stack_key in jobs
+        }
+        for future in as_completed(futures):
+            questions = future.result()
+            if questions:
+                entries.setdefault(futures[future], []).append(questions)
+                generated += 1
+            else:
+                failed += 1
+
+    save_bank_file(output, entries, data["version"] + 1, model)
+    return {
+        "version": data["version"] + 1,
+        "stacks": len(entries),
+        "generated": generated,
+        "failed": failed,
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from config import Config
+    from core.llm_gateway import LLMGateway
+    from core.storage import create_store
+
+    parser = argparse.ArgumentParser(description="Pre-generate technical question sets into the question bank.")
+    parser.add_argument("--stacks", nargs="*", default=[], help="tech stacks to generate questions for")
+    parser.add_argument("--from-data", action="store_true", help="mine tech stacks from stored interviews")
+    parser.add_argument("--top", type=int, default=50, help="number of most frequent stacks to mine")
+    parser.add_argument("--min-count", type=int, default=2, help="minimum occurrences for a mined stack")
+    parser.add_argument("--sets-per-stack", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=4, help="maximum parallel generations")
+    parser.add_argument("--output", default=os.path.join(Config.DATA_DIR, Config.QUESTION_BANK_FILENAME))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    Config.validate_config()
+
+    stacks = list(args.stacks)
+    if args.from_data:
+        # Read the store directly: a DataHandler would build indexes and start a writer thread
+        store = create_store(Config.STORAGE_BACKEND, Config.DATA_DIR, Config.CSV_FILENAME, Config.DB_FILENAME)
+        try:
+            records = store.iter_records(columns=[TECH_STACK_COLUMN])
+            stacks.extend(mine_tech_stacks(records, args.top, args.min_count))
+        finally:
+            store.close()
+    if not stacks:
+        parser.error("no tech stacks given; use --stacks and/or --from-data")
+
+    llm = LLMGateway(
+        api_key=Config.OPENAI_API_KEY,
+        model=Config.OPENAI_MODEL,
+        base_url=Config.OPENAI_BASE_URL,
+        request_timeout=Config.LLM_REQUEST_TIMEOUT,
+        max_retries=Config.LLM_MAX_RETRIES,
+        max_concurrency=args.workers,
+        requests_per_minute=Config.LLM_REQUESTS_PER_MINUTE,
+        max_connections=args.workers
+    )
+    try:
+        summary = build_bank(
+            llm, stacks, args.output, args.sets_per_stack, args.workers,
+            Config.MAX_TECH_QUESTIONS, Config.LLM_DEADLINE_SECONDS, Config.OPENAI_MODEL
+        )
+    finally:
+        llm.close()
+
+    print(json.dumps(summary))
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
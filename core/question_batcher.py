@@ -0,0 +1,170 @@
+"""Batched technical question generation.
+
+During bursts (a campus drive queueing dozens of candidates) one request
+per candidate spends most of its tokens and rate limit on repeated
+instructions. The batcher collects tech stacks submitted within a short
+window and generates all of their question sets with a single JSON-mode
+completion, then hands each caller its own section. A section that is
+missing or unparseable yields None, so the caller can fall back for that
+candidate alone.
+
+The scheduler runs on the LLM gateway's event loop. Waiting callers hold
+a future, not a thread.
+"""
+
+import asyncio
+import json
+import logging
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from utils import MIN_PARSED_QUESTIONS, parse_tech_questions
+from core.llm_gateway import LLMGateway
+from core.metrics import metrics
+from core.prompt_templates import DEFAULT_STACK_TOKEN_LIMIT, PromptTemplates
+
+logger = logging.getLogger(__name__)
+
+# Bucket bounds for the batch size histogram
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32)
+
+# (questions or None, tokens charged to this candidate)
+BatchResult = Tuple[Optional[List[str]], int]
+
+
+def parse_batch_response(content: str, batch_size: int, max_questions: int) -> List[Optional[List[str]]]:
+    """Split a JSON-mode batch reply into one question list per candidate.
+
+    Accepts ``{"1": [...], "2": [...]}`` (the requested shape), a top-level
+    list of arrays, either of them inside a single-key envelope such as
+    ``{"candidates": {...}}``, or sections wrapped as ``{"questions": [...]}``.
+    A batch of one may also come back unnumbered, as ``{"questions": [...]}``
+    or a plain list of questions. Each section goes through the regular
+    question parser. Sections with fewer than three questions come back as
+    None.
+    """
+    try:
+        data = json.loads(content)
+    except (TypeError, ValueError):
+        return [None] * batch_size
+
+    if isinstance(data, dict) and len(data) == 1 and "1" not in data:
+        envelope = next(iter(data.values()))
+        if (isinstance(envelope, dict) and "1" in envelope) or (
+                isinstance(envelope, list) and not _is_question_list(envelope)):
+            data = envelope
+    if batch_size == 1 and ((isinstance(data, dict) and "1" not in data) or _is_question_list(data)):
+        # The only candidate's section, without the numbering
+        data = [data]
+
+    sections = []
+    for i in range(batch_size):
+        if isinstance(data, dict):
+            section = data.get(str(i + 1))
+        else:
+            section = data[i] if isinstance(data, list) and i < len(data) else None
+        if isinstance(section, dict):
+            section = section.get("questions")
+        if not isinstance(section, list):
+            sections.append(None)
+            continue
+        text = "\n".join(item.strip() for item in section if isinstance(item, str))
+        questions = parse_tech_questions(text, max_questions)
+        sections.append(questions if len(questions) >= MIN_PARSED_QUESTIONS else None)
+    return sections
+
+
+def _is_question_list(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+class QuestionBatcher:
+    """Collects question requests for a short window and serves them with one completion.
+
+    Args:
+        llm: Gateway whose event loop and limits the batches run under
+        max_questions: Questions per candidate
+        window: Seconds to wait for more requests after the first one
+        max_batch: Batch size that triggers an immediate call
+        deadline: Deadline in seconds for each batched completion
+        stack_token_limit: Token budget for each tech stack in the prompt
+    """
+
+    def __init__(self, llm: LLMGateway, max_questions: int = 5, window: float = 0.05,
+                 max_batch: int = 8, deadline: float = 30.0,
+                 stack_token_limit: int = DEFAULT_STACK_TOKEN_LIMIT):
+        self.llm = llm
+        self.max_questions = max_questions
+        self.window = window
+        self.max_batch = max_batch
+        self.deadline = deadline
+        self.stack_token_limit = stack_token_limit
+        metrics.set_buckets("question_batch_size", BATCH_SIZE_BUCKETS)
+
+        # Only touched on the gateway loop
+        self._pending: List[Tuple[str, Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def submit(self, tech_stack: str) -> "Future[BatchResult]":
+        """Queue a tech stack; the future resolves to (questions or None, tokens)."""
+        future: Future = Future()
+        self.llm.loop.call_soon_threadsafe(self._enqueue, tech_stack, future)
+        return future
+
+    def generate(self, tech_stack: str, usage: Optional[Dict[str, int]] = None) -> Optional[List[str]]:
+        """Blocking ``submit`` for worker threads.
+
+        Returns:
+            The candidate's questions, or None if its section failed
+        """
+        questions, tokens = self.submit(tech_stack).result(timeout=self.window + self.deadline + 5)
+        if usage is not None:
+            usage["batched"] = usage.get("batched", 0) + tokens
+        return questions
+
+    def _enqueue(self, tech_stack: str, future: Future) -> None:
+        self._pending.append((tech_stack, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = self.llm.loop.call_later(self.window, self._flush)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            self.llm.loop.create_task(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[str, Future]]) -> None:
+        stacks = [stack for stack, _ in batch]
+        usage: Dict[str, int] = {}
+        try:
+            response = await asyncio.wait_for(self.llm.complete(
+                PromptTemplates.batch_tech_questions_messages(stacks, self.max_questions, self.stack_token_limit),
+                usage=usage,
+                response_format={"type": "json_object"},
+                temperature=0.7,
+                max_tokens=PromptTemplates.batch_tech_questions_max_tokens(len(stacks), self.max_questions)
+            ), self.deadline)
+            sections = parse_batch_response(response.choices[0].message.content, len(stacks), self.max_questions)
+        except asyncio.TimeoutError:
+            logger.warning(f"Batched question generation for {len(stacks)} candidates exceeded {self.deadline:.1f}s")
+            sections = [None] * len(stacks)
+        except Exception as e:
+            logger.error(f"Error in batched question generation for {len(stacks)} candidates: {e}")
+            sections = [None] * len(stacks)
+
+        metrics.observe("question_batch_size", len(stacks))
+        failed = sum(section is None for section in sections)
+        metrics.inc("question_batch_sections", len(stacks) - failed, outcome="ok")
+        metrics.inc("question_batch_sections", failed, outcome="failed")
+        if failed:
+            logger.warning(f"{failed} of {len(stacks)} batched question sets failed to parse")
+
+        # Tokens are shared evenly by the candidates of the batch
+        share = sum(usage.values()) // len(stacks)
+        for (_, future), questions in zip(batch, sections):
+            if not future.done():
+                future.set_result((questions, share))
@@ -0,0 +1,184 @@
+"""Persistent cache for AI-generated technical questions.
+
+Question sets are stored in a small SQLite database keyed by a canonical
+form of the candidate's tech stack, so candidates listing the same
+technologies can be served without another API round trip.
+"""
+
+import json
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, List, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+# Common spellings folded onto one canonical token
+TECH_ALIASES = {
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "react.js": "react",
+    "reactjs": "react",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "vue.js": "vue",
+    "vuejs": "vue",
+    "angular.js": "angularjs",
+    "next": "next.js",
+    "nextjs": "next.js",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "ml": "machine learning",
+}
+
+STACK_SEPARATORS = re.compile(r"[,;/|\n&]+|\s+and\s+", re.IGNORECASE)
+
+
+def normalize_tech_stack(tech_stack: str) -> str:
+    """Canonicalize a free-text tech stack into a stable cache key.
+
+    Tokens are case-folded, alias-merged, de-duplicated and sorted, so
+    "Python, Django, Postgres" and "django / postgresql and python"
+    produce the same key.
+
+    Args:
+        tech_stack: Candidate's technology stack as typed
+
+    Returns:
+        Comma-joined canonical tokens (empty string if nothing usable)
+    """
+    tokens = set()
+    for raw in STACK_SEPARATORS.split(tech_stack or ""):
+        token = " ".join(raw.casefold().split()).strip(" .")
+        if token:
+            tokens.add(TECH_ALIASES.get(token, token))
+    return ",".join(sorted(tokens))
+
+
+class QuestionCache:
+    """SQLite-backed question cache with TTL, LRU eviction and a variety pool.
+
+    Each stack key collects up to ``pool_size`` distinct question sets.
+    Until the pool is full every lookup is a miss, so new sets keep being
+    generated; after that, hits sample one set at random from the pool.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float = 7 * 24 * 3600,
+                 max_entries: int = 1000, pool_size: int = 3):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.pool_size = max(pool_size, 1)
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._miss_seconds = 0.0
+        self._timed_misses = 0
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS question_sets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                stack_key TEXT NOT NULL,
+                questions TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_question_sets_key ON question_sets(stack_key);
+            CREATE INDEX IF NOT EXISTS idx_question_sets_used ON question_sets(last_used_at);
+        """)
+        self._conn.commit()
+
+    def get(self, stack_key: str) -> Optional[List[str]]:
+        """Return a cached question set for the key, or None on a miss."""
+        if not stack_key:
+            return None
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM question_sets WHERE stack_key = ? AND created_at < ?",
+                (stack_key, now - self.ttl_seconds)
+            )
+            rows = self._conn.execute(
+                "SELECT id, questions FROM question_sets WHERE stack_key = ?",
+                (stack_key,)
+            ).fetchall()
+
+            if len(rows) < self.pool_size:
+                self._misses += 1
+                self._conn.commit()
+                return None
+
+            row_id, questions = random.choice(rows)
+            self._conn.execute(
+                "UPDATE question_sets SET last_used_at = ? WHERE id = ?", (now, row_id)
+            )
+            self._conn.commit()
+            self._hits += 1
+
+        return json.loads(questions)
+
+    def put(self, stack_key: str, questions: List[str], latency: Optional[float] = None) -> None:
+        """Store a freshly generated question set and evict old entries.
+
+        Args:
+            stack_key: Key from normalize_tech_stack
+            questions: Parsed questions returned by the model
+            latency: Seconds the generation took, used for savings estimates
+        """
+        if not stack_key or not questions:
+            return
+
+        now = time.time()
+        with self._lock:
+            if latency is not None:
+                self._miss_seconds += latency
+                self._timed_misses += 1
+
+            self._conn.execute(
+                "INSERT INTO question_sets (stack_key, questions, created_at, last_used_at) VALUES (?, ?, ?, ?)",
+                (stack_key, json.dumps(questions), now, now)
+            )
+            # Keep only the newest pool_size sets for this stack
+            self._conn.execute(
+                """DELETE FROM question_sets WHERE stack_key = ? AND id NOT IN (
+                       SELECT id FROM question_sets WHERE stack_key = ? ORDER BY id DESC LIMIT ?)""",
+                (stack_key, stack_key, self.pool_size)
+            )
+            # Global LRU eviction once the cache grows past max_entries
+            (total,) = self._conn.execute("SELECT COUNT(*) FROM question_sets").fetchone()
+            if total > self.max_entries:
+                self._conn.execute(
+                    """DELETE FROM question_sets WHERE id IN (
+                           SELECT id FROM question_sets ORDER BY last_used_at ASC LIMIT ?)""",
+                    (total - self.max_entries,)
+                )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the estimated generation time saved."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            avg_miss = self._miss_seconds / self._timed_misses if self._timed_misses else 0.0
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "avg_miss_seconds": avg_miss,
+                "estimated_seconds_saved": self._hits * avg_miss,
+            }
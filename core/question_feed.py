@@ -0,0 +1,63 @@
+"""Thread-safe buffer for technical questions that arrive incrementally.
+
+A background worker publishes questions as they are parsed from a
+streamed model response, while the interview reads them as soon as the
+one it needs next is available.
+"""
+
+import threading
+import time
+from typing import List, Optional
+
+
+class QuestionFeed:
+    """Questions produced by one background generation job."""
+
+    def __init__(self):
+        self._questions: List[str] = []
+        self._done = False
+        self._condition = threading.Condition()
+        self.started_at = time.perf_counter()
+        self.first_question_latency: Optional[float] = None
+        self.total_latency: Optional[float] = None
+
+    def publish(self, question: str) -> None:
+        """Append a newly available question and wake up any waiting reader."""
+        with self._condition:
+            if self.first_question_latency is None:
+                self.first_question_latency = time.perf_counter() - self.started_at
+            self._questions.append(question)
+            self._condition.notify_all()
+
+    def finish(self) -> None:
+        """Mark the feed complete; no more questions will be published."""
+        with self._condition:
+            self._done = True
+            self.total_latency = time.perf_counter() - self.started_at
+            self._condition.notify_all()
+
+    def wait_for(self, count: int, timeout: Optional[float] = None) -> bool:
+        """Block until at least ``count`` questions exist or the feed is done.
+
+        Args:
+            count: Number of questions the caller needs
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if ``count`` questions are available
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: len(self._questions) >= count or self._done, timeout
+            )
+            return len(self._questions) >= count
+
+    @property
+    def questions(self) -> List[str]:
+        with self._condition:
+            return list(self._questions)
+
+    @property
+    def done(self) -> bool:
+        with self._condition:
+            return self._done
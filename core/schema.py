@@ -0,0 +1,130 @@
+"""Candidate Record Schema for TalentScout Hiring Assistant
+
+Single definition of the stored interview columns, shared by every
+storage backend and the CSV export so the layouts never drift apart.
+"""
+
+import csv
+import io
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TextIO, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Number of technical question/answer column pairs in a record
+TECH_QUESTION_SLOTS = 5
+
+# (CSV header, database column) pairs in storage order
+CANDIDATE_FIELDS = [
+    ("interview_date", "interview_date"),
+    ("What is your full name?", "full_name"),
+    ("What is your email address?", "email"),
+    ("What is your phone number?", "phone"),
+    ("How many years of experience do you have?", "experience_years"),
+    ("Which position are you applying for?", "position"),
+    ("Where are you currently located?", "location"),
+    ("Please list your tech stack (languages, frameworks, and tools you know).", "tech_stack"),
+]
+for _i in range(1, TECH_QUESTION_SLOTS + 1):
+    CANDIDATE_FIELDS.append((f"Technical_Q{_i}", f"technical_q{_i}"))
+    CANDIDATE_FIELDS.append((f"Technical_A{_i}", f"technical_a{_i}"))
+
+CSV_COLUMNS = [header for header, _ in CANDIDATE_FIELDS]
+DB_COLUMNS = [column for _, column in CANDIDATE_FIELDS]
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+HEADER_BY_COLUMN = {column: header for header, column in CANDIDATE_FIELDS}
+COLUMN_BY_HEADER = dict(CANDIDATE_FIELDS)
+DATE_COLUMN = HEADER_BY_COLUMN["interview_date"]
+# Low-cardinality answers loaded as pandas categoricals
+CATEGORICAL_COLUMNS = [HEADER_BY_COLUMN["position"], HEADER_BY_COLUMN["location"]]
+
+
+def resolve_columns(columns: Optional[Sequence[str]] = None) -> List[str]:
+    """Map a column projection to CSV headers, in the order given.
+
+    Args:
+        columns: CSV headers and/or database column names (None for all)
+
+    Raises:
+        ValueError: If a column is not part of the schema
+    """
+    if columns is None:
+        return list(CSV_COLUMNS)
+    headers = []
+    for column in columns:
+        header = HEADER_BY_COLUMN.get(column, column)
+        if header not in CSV_COLUMNS:
+            raise ValueError(f"Unknown candidate column: {column}")
+        headers.append(header)
+    return headers
+
+
+def with_categoricals(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Convert the low-cardinality columns present in ``df`` to categoricals."""
+    categorical = {column: "category" for column in CATEGORICAL_COLUMNS if column in df.columns}
+    return df.astype(categorical) if categorical else df
+
+
+def date_bound(value: Optional[Union[str, datetime]]) -> Optional[str]:
+    """Render an interview date bound as a string comparable with stored dates.
+
+    Stored dates use DATE_FORMAT, which sorts lexicographically, so a
+    prefix such as "2025-01" is also a valid bound.
+    """
+    if isinstance(value, datetime):
+        return value.strftime(DATE_FORMAT)
+    return value
+
+
+def build_candidate_record(candidate_dict: Dict[str, Any], tech_questions: Optional[List[str]] = None,
+                           tech_answers: Optional[Dict[str, str]] = None,
+                           interview_date: Optional[str] = None) -> Dict[str, str]:
+    """Flatten one interview into a record keyed by CSV header.
+
+    Args:
+        candidate_dict: Basic-info answers keyed by question text
+        tech_questions: Technical questions asked, in order
+        tech_answers: Answers keyed by "Tech Question N"
+        interview_date: Timestamp to store (defaults to now)
+
+    Returns:
+        Dict with exactly the CSV_COLUMNS keys, in column order
+    """
+    structured_data = {
+        "interview_date": interview_date or datetime.now().strftime(DATE_FORMAT),
+        **candidate_dict
+    }
+
+    if tech_questions and tech_answers:
+        for i, question in enumerate(tech_questions, 1):
+            answer_key = f"Tech Question {i}"
+            answer = tech_answers.get(answer_key, "No answer provided")
+
+            structured_data[f"Technical_Q{i}"] = question.replace('"', '').replace(',', ';')
+            structured_data[f"Technical_A{i}"] = answer.replace('"', '').replace(',', ';')
+
+    return {column: str(structured_data.get(column, "")) for column in CSV_COLUMNS}
+
+
+def write_records(stream: TextIO, records: Iterable[Dict[str, str]], header: bool = True) -> None:
+    """Write records as CSV rows in the fixed column order.
+
+    Args:
+        stream: Text stream opened with newline=""
+        records: Records keyed by CSV header
+        header: Whether to write the header row first
+    """
+    writer = csv.writer(stream, lineterminator="\n")
+    if header:
+        writer.writerow(CSV_COLUMNS)
+    writer.writerows([record.get(column, "") for column in CSV_COLUMNS] for record in records)
+
+
+def serialize_records(records: Iterable[Dict[str, str]], header: bool = True) -> str:
+    """Serialize records to a CSV string (used for downloads)."""
+    buffer = io.StringIO()
+    write_records(buffer, records, header)
+    return buffer.getvalue()
@@ -0,0 +1,211 @@
+"""Interview Session Stores for TalentScout Hiring Assistant
+
+Keeps interview progress outside Streamlit's per-process session state,
+so any app process can resume any interview. A restart, or a load
+balancer sending a reconnect to another worker, then no longer loses
+progress.
+
+State is stored as compact JSON, zlib-compressed when large, and every
+save carries the version it was based on. A save from a stale copy
+raises SessionConflict instead of silently overwriting newer progress
+(optimistic concurrency).
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# States at least this large are stored zlib-compressed
+COMPRESS_MIN_BYTES = 512
+_RAW, _ZLIB = b"j", b"z"
+
+
+class SessionConflict(Exception):
+    """Raised when a session was changed by someone else since it was loaded."""
+
+
+class SessionDecodeError(ValueError):
+    """Raised when a stored session state is not readable (corrupt or unknown encoding)."""
+
+
+def encode_state(state: Dict[str, Any]) -> bytes:
+    """Serialize a session state to compact bytes."""
+    data = json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(data) >= COMPRESS_MIN_BYTES:
+        return _ZLIB + zlib.compress(data, 6)
+    return _RAW + data
+
+
+def decode_state(blob: bytes) -> Dict[str, Any]:
+    """Inverse of encode_state.
+
+    Raises:
+        SessionDecodeError: If the blob is not a valid encoded state
+    """
+    kind, data = blob[:1], blob[1:]
+    try:
+        if kind == _ZLIB:
+            data = zlib.decompress(data)
+        elif kind != _RAW:
+            raise ValueError(f"Unknown session encoding: {kind!r}")
+        return json.loads(data.decode("utf-8"))
+    except (ValueError, zlib.error) as e:
+        raise SessionDecodeError(str(e)) from e
+
+
+class SessionStore(ABC):
+    """Versioned key-value store of interview states.
+
+    Versions start at 1 for a newly created session; ``expected_version``
+    0 means "create, the session must not exist yet".
+    """
+
+    def __init__(self, ttl_seconds: float = 24 * 3600):
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        """Return (state, version), or None if the session is unknown or expired."""
+
+    @abstractmethod
+    def save(self, session_id: str, state: Dict[str, Any], expected_version: int) -> int:
+        """Store a new state and return its version.
+
+        Raises:
+            SessionConflict: If the stored version is not ``expected_version``
+        """
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Forget a session."""
+
+    def close(self) -> None:
+        pass
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local store (the default for single-process deployments)."""
+
+    def __init__(self, ttl_seconds: float = 24 * 3600):
+        super().__init__(ttl_seconds)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Tuple[bytes, int, float]] = {}
+
+    def _purge_expired(self, now: float) -> None:
+        expired = [key for key, (_, _, updated) in self._sessions.items() if now - updated > self.ttl_seconds]
+        for key in expired:
+            del self._sessions[key]
+
+    def load(self, session_id: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+        if entry is None or time.time() - entry[2] > self.ttl_seconds:
+            return None
+        return decode_state(entry[0]), entry[1]
+
+    def save(self, session_id: str, state: Dict[str, Any], expected_version: int) -> int:
+        blob = encode_state(state)
+        now = time.time()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            current = entry[1] if entry is not None and now - entry[2] <= self.ttl_seconds else 0
+            if current != expected_version:
+                raise SessionConflict(f"Session {session_id} is at version {current}, not {expected_version}")
+            self._sessions[session_id] = (blob, current + 1, now)
+            if current == 0:
+                self._purge_expired(now)
+            return current + 1
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+
+class SqliteSessionStore(SessionStore):
+    """Shared store in a SQLite file (WAL), usable by every process on a host or shared volume."""
+
+    def __init__(self, db_path: str, ttl_seconds: float = 24 * 3600):
+        super().__init__(ttl_seconds)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS interview_sessions (
+                    id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    state BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_interview_sessions_updated
+                    ON interview_sessions(updated_at);
+            """)
+
+    def load(self, session_id: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state, version FROM interview_sessions WHERE id = ? AND updated_at >= ?",
+                (session_id, time.time() - self.ttl_seconds)
+            ).fetchone()
+        if row is None:
+            return None
+        return decode_state(row[0]), row[1]
+
+    def save(self, session_id: str, state: Dict[str, Any], expected_version: int) -> int:
+        blob = encode_state(state)
+        now = time.time()
+        with self._lock, self._conn:
+            if expected_version == 0:
+                # Replace only an expired row; a live one means someone else created it
+                cursor = self._conn.execute("""
+                    INSERT INTO interview_sessions (id, version, updated_at, state) VALUES (?, 1, ?, ?)
+                    ON CONFLICT (id) DO UPDATE SET version = 1, updated_at = excluded.updated_at,
+                        state = excluded.state
+                    WHERE interview_sessions.updated_at < ?
+                """, (session_id, now, blob, now - self.ttl_seconds))
+                self._conn.execute(
+                    "DELETE FROM interview_sessions WHERE updated_at < ?", (now - self.ttl_seconds,)
+                )
+            else:
+                cursor = self._conn.execute("""
+                    UPDATE interview_sessions SET version = version + 1, updated_at = ?, state = ?
+                    WHERE id = ? AND version = ? AND updated_at >= ?
+                """, (now, blob, session_id, expected_version, now - self.ttl_seconds))
+            if cursor.rowcount != 1:
+                raise SessionConflict(f"Session {session_id} changed since version {expected_version}")
+        return expected_version + 1
+
+    def delete(self, session_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM interview_sessions WHERE id = ?", (session_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_session_store(backend: str, db_path: str, ttl_seconds: float) -> SessionStore:
+    """Build the configured session store.
+
+    Args:
+        backend: "memory" or "sqlite"
+        db_path: Database file used by the SQLite backend
+        ttl_seconds: Idle time after which an interview can no longer be resumed
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if backend == "memory":
+        return InMemorySessionStore(ttl_seconds)
+    if backend == "sqlite":
+        return SqliteSessionStore(db_path, ttl_seconds)
+    raise ValueError(f"Unknown session store backend: {backend}")
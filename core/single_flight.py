@@ -0,0 +1,75 @@
+"""Request coalescing for identical concurrent work.
+
+When several interviews ask for questions for the same stack at the same
+moment, only the first caller (the leader) starts a generation; the rest
+share its in-flight result instead of firing identical LLM requests.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Tuple
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace and case so trivially different prompts share a key."""
+    return " ".join(prompt.split()).casefold()
+
+
+class SingleFlight:
+    """Registry of in-flight work keyed by request identity."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Any] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    def join(self, key: str, factory: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return the in-flight handle for ``key``, creating it if needed.
+
+        The handle (a feed, future, ...) must support several readers. The
+        leader is responsible for calling ``leave`` when its work finishes.
+
+        Returns:
+            Tuple of (handle, is_leader)
+        """
+        with self._lock:
+            self._calls += 1
+            handle = self._in_flight.get(key)
+            if handle is not None:
+                self._coalesced += 1
+                return handle, False
+            handle = factory()
+            self._in_flight[key] = handle
+            return handle, True
+
+    def leave(self, key: str) -> None:
+        """Forget the in-flight handle so later calls start fresh work."""
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` once for all concurrent callers with the same key."""
+        future, is_leader = self.join(key, Future)
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self.leave(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Return call counters: total calls, coalesced calls, work in flight."""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._in_flight),
+            }
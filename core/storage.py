@@ -0,0 +1,365 @@
+"""Storage Backends for Candidate Interview Records
+
+DataHandler talks to a CandidateStore; SQLite (WAL mode) is the system of
+record and the legacy append-only CSV file remains available as a backend
+and as an export format.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import threading
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+from core.schema import (
+    CANDIDATE_FIELDS, COLUMN_BY_HEADER, DATE_COLUMN, DB_COLUMNS,
+    date_bound, resolve_columns, with_categoricals, write_records
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DateBound = Optional[Union[str, datetime]]
+
+
+def _records_to_frame(records: List[Dict[str, str]], headers: List[str]) -> "pd.DataFrame":
+    import pandas as pd
+    return with_categoricals(pd.DataFrame.from_records(records, columns=headers))
+
+
+class CandidateStore(ABC):
+    """Interface every candidate storage backend implements.
+
+    Records are dicts keyed by the CSV headers in core.schema.
+    """
+
+    @abstractmethod
+    def insert_many(self, records: List[Dict[str, str]]) -> None:
+        """Persist a batch of records atomically."""
+
+    def insert(self, record: Dict[str, str]) -> None:
+        self.insert_many([record])
+
+    @abstractmethod
+    def count(self) -> int:
+        """Return the number of stored records."""
+
+    @abstractmethod
+    def iter_records(self, columns: Optional[Sequence[str]] = None,
+                     since: DateBound = None, until: DateBound = None) -> Iterator[Dict[str, str]]:
+        """Yield stored records in insertion order.
+
+        Args:
+            columns: Projection as CSV headers or database columns (None for all)
+            since: Only interviews on or after this date
+            until: Only interviews before this date
+        """
+
+    def iter_records_after(self, after_id: int,
+                           columns: Optional[Sequence[str]] = None) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """Yield ``(record ID, record)`` for records stored after ``after_id``.
+
+        Record IDs grow in insertion order, so the last ID seen is a
+        high-water mark for incremental consumers (archive, indexes). This
+        default numbers records from 1 in insertion order and still reads
+        the skipped ones; backends with a real key seek past them instead.
+        """
+        for record_id, record in enumerate(self.iter_records(columns), 1):
+            if record_id > after_id:
+                yield record_id, record
+
+    def iter_frames(self, chunksize: int = 10000, columns: Optional[Sequence[str]] = None,
+                    since: DateBound = None, until: DateBound = None) -> Iterator["pd.DataFrame"]:
+        """Yield records as DataFrames of at most ``chunksize`` rows.
+
+        Position and location are categoricals; categories are per chunk.
+        """
+        headers = resolve_columns(columns)
+        records = self.iter_records(headers, since, until)
+        while True:
+            batch = list(islice(records, chunksize))
+            if not batch:
+                return
+            yield _records_to_frame(batch, headers)
+
+    def load_dataframe(self, columns: Optional[Sequence[str]] = None,
+                       since: DateBound = None, until: DateBound = None) -> "pd.DataFrame":
+        headers = resolve_columns(columns)
+        return _records_to_frame(list(self.iter_records(headers, since, until)), headers)
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteCandidateStore(CandidateStore):
+    """SQLite store in WAL mode with indexed lookup columns.
+
+    WAL lets concurrent Streamlit sessions (and processes) read while one
+    writer commits, and each batch is written in a single transaction.
+    The row count is kept in a trigger-maintained table so counting is O(1).
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # FULL syncs the WAL on every commit, i.e. once per inserted batch
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        columns = ",\n".join(
+            f"{column} TEXT NOT NULL DEFAULT ''" for column in DB_COLUMNS if column != "interview_date"
+        )
+        with self._conn:
+            self._conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS candidates (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    interview_date TEXT NOT NULL,
+                    {columns}
+                );
+                CREATE INDEX IF NOT EXISTS idx_candidates_email ON candidates(email);
+                CREATE INDEX IF NOT EXISTS idx_candidates_position ON candidates(position);
+                CREATE INDEX IF NOT EXISTS idx_candidates_interview_date ON candidates(interview_date);
+
+                CREATE TABLE IF NOT EXISTS candidate_stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    row_count INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO candidate_stats (id, row_count)
+                    SELECT 1, COUNT(*) FROM candidates;
+                CREATE TRIGGER IF NOT EXISTS candidates_count_insert AFTER INSERT ON candidates
+                    BEGIN UPDATE candidate_stats SET row_count = row_count + 1 WHERE id = 1; END;
+                CREATE TRIGGER IF NOT EXISTS candidates_count_delete AFTER DELETE ON candidates
+                    BEGIN UPDATE candidate_stats SET row_count = row_count - 1 WHERE id = 1; END;
+            """)
+
+    def insert_many(self, records: List[Dict[str, str]]) -> None:
+        if not records:
+            return
+        placeholders = ", ".join("?" for _ in DB_COLUMNS)
+        rows = [tuple(record.get(header, "") for header, _ in CANDIDATE_FIELDS) for record in records]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO candidates ({', '.join(DB_COLUMNS)}) VALUES ({placeholders})", rows
+            )
+
+    def count(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT row_count FROM candidate_stats WHERE id = 1").fetchone()
+        return row[0] if row else 0
+
+    def iter_records(self, columns: Optional[Sequence[str]] = None,
+                     since: DateBound = None, until: DateBound = None) -> Iterator[Dict[str, str]]:
+        headers = resolve_columns(columns)
+        selected = ", ".join(COLUMN_BY_HEADER[header] for header in headers)
+
+        # The date bounds are pushed down to the interview_date index
+        conditions, params = [], []
+        if since is not None:
+            conditions.append("interview_date >= ?")
+            params.append(date_bound(since))
+        if until is not None:
+            conditions.append("interview_date < ?")
+            params.append(date_bound(until))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        # Separate connection so a long export never holds the shared one
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            cursor = conn.execute(f"SELECT {selected} FROM candidates{where} ORDER BY id", params)
+            for row in cursor:
+                yield dict(zip(headers, row))
+        finally:
+            conn.close()
+
+    def iter_records_after(self, after_id: int,
+                           columns: Optional[Sequence[str]] = None) -> Iterator[Tuple[int, Dict[str, str]]]:
+        headers = resolve_columns(columns)
+        selected = ", ".join(COLUMN_BY_HEADER[header] for header in headers)
+
+        # Seeks on the primary key: earlier records are never read
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            cursor = conn.execute(f"SELECT id, {selected} FROM candidates WHERE id > ? ORDER BY id", (after_id,))
+            for row in cursor:
+                yield row[0], dict(zip(headers, row[1:]))
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CsvCandidateStore(CandidateStore):
+    """Append-only CSV file store (the original storage format).
+
+    Keeps a sidecar row-count index stamped with the file's size and mtime
+    so counting does not require parsing the file.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        # Sidecar holding the row count, stamped with the CSV size/mtime it was taken at
+        self.count_path = file_path + ".count.json"
+        self._count_cache: Optional[Dict[str, int]] = None
+        self._lock = threading.Lock()
+
+    def _file_stamp(self) -> Optional[Dict[str, int]]:
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _read_count_index(self, stamp: Dict[str, int]) -> Optional[int]:
+        """Return the indexed row count if it still matches the CSV on disk."""
+        index = self._count_cache
+        if index is None:
+            try:
+                with open(self.count_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                return None
+
+        if index.get("size") == stamp["size"] and index.get("mtime_ns") == stamp["mtime_ns"]:
+            self._count_cache = index
+            return int(index["count"])
+        return None
+
+    def _write_count_index(self, stamp: Dict[str, int], count: int) -> None:
+        index = {**stamp, "count": count}
+        tmp_path = self.count_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self.count_path)
+            self._count_cache = index
+        except OSError as e:
+            logger.warning(f"Could not update candidate count index: {e}")
+
+    def _count_rows(self) -> int:
+        """Count data rows with a streaming CSV scan (used only when the index is stale)."""
+        with open(self.file_path, "r", encoding="utf-8", newline="") as f:
+            rows = sum(1 for _ in csv.reader(f))
+        return max(rows - 1, 0)
+
+    def insert_many(self, records: List[Dict[str, str]]) -> None:
+        if not records:
+            return
+        with self._lock:
+            # Only trust the previous count if the index matched the file before this append
+            stamp_before = self._file_stamp()
+            previous_count = self._read_count_index(stamp_before) if stamp_before else 0
+
+            with open(self.file_path, "a", encoding="utf-8", newline="") as f:
+                write_records(f, records, header=stamp_before is None)
+                f.flush()
+                os.fsync(f.fileno())
+
+            if previous_count is not None:
+                self._write_count_index(self._file_stamp(), previous_count + len(records))
+
+    def count(self) -> int:
+        stamp = self._file_stamp()
+        if stamp is None:
+            return 0
+
+        count = self._read_count_index(stamp)
+        if count is None:
+            count = self._count_rows()
+            self._write_count_index(stamp, count)
+        return count
+
+    def iter_records(self, columns: Optional[Sequence[str]] = None,
+                     since: DateBound = None, until: DateBound = None) -> Iterator[Dict[str, str]]:
+        if not os.path.exists(self.file_path):
+            return
+        headers = resolve_columns(columns)
+        since, until = date_bound(since), date_bound(until)
+
+        with open(self.file_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            positions = {name: i for i, name in enumerate(next(reader, []))}
+            wanted = [(header, positions.get(header)) for header in headers]
+            date_position = positions.get(DATE_COLUMN)
+
+            for row in reader:
+                # Filter on the raw row before any dict is built
+                if since is not None or until is not None:
+                    date = row[date_position] if date_position is not None and date_position < len(row) else ""
+                    if (since is not None and date < since) or (until is not None and date >= until):
+                        continue
+                yield {
+                    header: row[i] if i is not None and i < len(row) else ""
+                    for header, i in wanted
+                }
+
+    def _read_csv(self, headers: List[str], since: Optional[str], until: Optional[str],
+                  chunksize: Optional[int] = None):
+        """pandas reader limited to the projected columns (plus the date when filtering)."""
+        import pandas as pd
+
+        needed = set(headers)
+        if since is not None or until is not None:
+            needed.add(DATE_COLUMN)
+        return pd.read_csv(
+            self.file_path, encoding='utf-8', usecols=lambda column: column in needed,
+            dtype=str, keep_default_na=False, chunksize=chunksize
+        )
+
+    @staticmethod
+    def _prepare_frame(df: "pd.DataFrame", headers: List[str],
+                       since: Optional[str], until: Optional[str]) -> "pd.DataFrame":
+        if since is not None:
+            df = df[df[DATE_COLUMN] >= since]
+        if until is not None:
+            df = df[df[DATE_COLUMN] < until]
+        return with_categoricals(df.reindex(columns=headers, fill_value="").reset_index(drop=True))
+
+    def iter_frames(self, chunksize: int = 10000, columns: Optional[Sequence[str]] = None,
+                    since: DateBound = None, until: DateBound = None) -> Iterator["pd.DataFrame"]:
+        if not os.path.exists(self.file_path):
+            return
+        headers = resolve_columns(columns)
+        since, until = date_bound(since), date_bound(until)
+        for chunk in self._read_csv(headers, since, until, chunksize):
+            chunk = self._prepare_frame(chunk, headers, since, until)
+            if len(chunk):
+                yield chunk
+
+    def load_dataframe(self, columns: Optional[Sequence[str]] = None,
+                       since: DateBound = None, until: DateBound = None) -> "pd.DataFrame":
+        headers = resolve_columns(columns)
+        if not os.path.exists(self.file_path):
+            return _records_to_frame([], headers)
+        since, until = date_bound(since), date_bound(until)
+        return self._prepare_frame(self._read_csv(headers, since, until), headers, since, until)
+
+
+def create_store(backend: str, data_dir: str, csv_filename: str, db_filename: str) -> CandidateStore:
+    """Build the configured storage backend.
+
+    Args:
+        backend: "sqlite" or "csv"
+        data_dir: Directory holding the data files
+        csv_filename: File name used by the CSV backend
+        db_filename: File name used by the SQLite backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if backend == "sqlite":
+        return SqliteCandidateStore(os.path.join(data_dir, db_filename))
+    if backend == "csv":
+        return CsvCandidateStore(os.path.join(data_dir, csv_filename))
+    raise ValueError(f"Unknown storage backend: {backend}")
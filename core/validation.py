@@ -0,0 +1,192 @@
+"""Basic-Info Validation for TalentScout Hiring Assistant
+
+Table-driven validators keyed by question ID, the database column name
+from ``core.schema``. Each entry pairs a check with the error shown to
+the candidate and a normalizer for the stored value, such as E.164 phone
+numbers or lowercased email addresses. Registries are built once per
+configuration and reused by every interview.
+
+``validate_many`` and ``normalize_many`` apply the same rules as column
+operations on a DataFrame, e.g. one from ``DataHandler.load_candidate_data``,
+to bulk re-validate historical records.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+from core.schema import CANDIDATE_FIELDS
+from utils import (
+    EMAIL_PATTERN, NON_DIGIT_PATTERN, PHONE_MIN_DIGITS, PHONE_MAX_DIGITS,
+    validate_email, validate_phone, validate_experience, validate_name
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Question text (CSV header) -> question ID (database column)
+QUESTION_IDS: Dict[str, str] = dict(CANDIDATE_FIELDS)
+
+# Fields normalized from the raw answer, before sanitize_input strips the
+# leading "+" of an international number. Their normalizers keep only safe
+# characters.
+RAW_NORMALIZED_FIELDS = frozenset({"phone"})
+
+
+def normalize_email(email: str) -> str:
+    """Canonical form of an email address: trimmed and lowercased."""
+    return email.strip().lower()
+
+
+def normalize_phone(phone: str, default_country_code: str = "1") -> str:
+    """Normalize a phone number to E.164 (``+`` followed by digits only).
+
+    Numbers starting with ``+`` or ``00`` already carry a country code;
+    bare 10-digit numbers get ``default_country_code``.
+    """
+    phone = phone.strip()
+    digits = NON_DIGIT_PATTERN.sub('', phone)
+    if phone.startswith('00') and not phone.startswith('+'):
+        digits = digits[2:]
+    elif not phone.startswith('+') and len(digits) == PHONE_MIN_DIGITS:
+        digits = default_country_code + digits
+    return '+' + digits
+
+
+class FieldValidator:
+    """Validation rule for one basic-info question.
+
+    Args:
+        field: Question ID the rule applies to
+        error: Message shown when the answer is rejected
+        check: Returns True if a single answer is valid
+        vector_check: Same rule applied to a pandas Series of answers
+        normalize: Returns the value to store for a valid answer
+        vector_normalize: Same normalizer applied to a pandas Series
+    """
+
+    __slots__ = ("field", "error", "check", "vector_check", "normalize", "vector_normalize")
+
+    def __init__(self, field: str, error: str, check: Callable[[str], bool],
+                 vector_check: Callable[["pd.Series"], "pd.Series"],
+                 normalize: Optional[Callable[[str], str]] = None,
+                 vector_normalize: Optional[Callable[["pd.Series"], "pd.Series"]] = None):
+        self.field = field
+        self.error = error
+        self.check = check
+        self.vector_check = vector_check
+        self.normalize = normalize
+        self.vector_normalize = vector_normalize
+
+
+def _min_length(min_length: int) -> Callable[["pd.Series"], "pd.Series"]:
+    return lambda s: s.str.strip().str.len() >= min_length
+
+
+def _phone_digits(s: "pd.Series") -> "pd.Series":
+    return s.str.replace(NON_DIGIT_PATTERN.pattern, '', regex=True)
+
+
+def _normalize_phones(s: "pd.Series", default_country_code: str) -> "pd.Series":
+    stripped = s.str.strip()
+    digits = _phone_digits(stripped)
+    international = stripped.str.startswith('+')
+    digits = digits.mask(~international & stripped.str.startswith('00'), digits.str[2:])
+    local = ~international & ~stripped.str.startswith('00') & (digits.str.len() == PHONE_MIN_DIGITS)
+    digits = digits.mask(local, default_country_code + digits)
+    return '+' + digits
+
+
+def _valid_experience(s: "pd.Series", max_years: int) -> "pd.Series":
+    import pandas as pd
+
+    return pd.to_numeric(s.str.strip(), errors='coerce').between(0, max_years)
+
+
+def build_validators(max_experience_years: int = 50,
+                     phone_country_code: str = "1") -> Dict[str, FieldValidator]:
+    """Build the validator registry for one configuration.
+
+    Returns:
+        Dict mapping question ID to its FieldValidator
+    """
+    validators = [
+        FieldValidator(
+            "full_name", "⚠️ Please enter your full name (at least 2 characters)",
+            validate_name, _min_length(2)
+        ),
+        FieldValidator(
+            "email", "⚠️ Please enter a valid email address (e.g., john@example.com)",
+            validate_email, lambda s: s.str.match(EMAIL_PATTERN.pattern),
+            normalize_email, lambda s: s.str.strip().str.lower()
+        ),
+        FieldValidator(
+            "phone", f"⚠️ Please enter a valid phone number ({PHONE_MIN_DIGITS}-{PHONE_MAX_DIGITS} digits)",
+            validate_phone,
+            lambda s: _phone_digits(s).str.len().between(PHONE_MIN_DIGITS, PHONE_MAX_DIGITS),
+            lambda phone: normalize_phone(phone, phone_country_code),
+            lambda s: _normalize_phones(s, phone_country_code)
+        ),
+        FieldValidator(
+            "experience_years", f"⚠️ Please enter a valid number of years (0-{max_experience_years})",
+            lambda exp: validate_experience(exp, max_experience_years),
+            lambda s: _valid_experience(s, max_experience_years),
+            str.strip, lambda s: s.str.strip()
+        ),
+        FieldValidator(
+            "tech_stack", "⚠️ Please provide more details about your technology stack",
+            lambda stack: len(stack.strip()) >= 3, _min_length(3)
+        ),
+    ]
+    return {validator.field: validator for validator in validators}
+
+
+@lru_cache(maxsize=None)
+def get_validators(max_experience_years: int = 50, phone_country_code: str = "1") -> Dict[str, FieldValidator]:
+    """Shared registry for a configuration, built on first use."""
+    return build_validators(max_experience_years, phone_country_code)
+
+
+def _answer_columns(df: "pd.DataFrame", validators: Dict[str, FieldValidator]) -> Dict[str, str]:
+    """Map question ID -> DataFrame column, accepting CSV headers or database columns."""
+    columns = {}
+    for column in df.columns:
+        field = QUESTION_IDS.get(column, column)
+        if field in validators:
+            columns[field] = column
+    return columns
+
+
+def validate_many(df: "pd.DataFrame", max_experience_years: int = 50,
+                  phone_country_code: str = "1") -> "pd.DataFrame":
+    """Validate stored answers column by column.
+
+    Args:
+        df: Candidate records, with CSV headers or database columns
+        max_experience_years: Upper bound for the experience answer
+        phone_country_code: Country code assumed for 10-digit phone numbers
+
+    Returns:
+        Boolean DataFrame on the same index with one column per validated
+        question ID plus ``valid``, True where every answer passed
+    """
+    import pandas as pd
+
+    validators = get_validators(max_experience_years, phone_country_code)
+    results = pd.DataFrame(index=df.index)
+    for field, column in _answer_columns(df, validators).items():
+        answers = df[column].fillna("").astype(str)
+        results[field] = validators[field].vector_check(answers).fillna(False).astype(bool)
+    results["valid"] = results.all(axis=1)
+    return results
+
+
+def normalize_many(df: "pd.DataFrame", phone_country_code: str = "1") -> "pd.DataFrame":
+    """Return a copy of ``df`` with normalized answers (E.164 phones, canonical emails)."""
+    validators = get_validators(phone_country_code=phone_country_code)
+    normalized = df.copy()
+    for field, column in _answer_columns(df, validators).items():
+        vector_normalize = validators[field].vector_normalize
+        if vector_normalize is not None:
+            answers = df[column].fillna("").astype(str)
+            normalized[column] = vector_normalize(answers)
+    return normalized
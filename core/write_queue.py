@@ -0,0 +1,169 @@
+"""Write-behind queue for candidate records.
+
+Saves are enqueued and a background flusher group-commits them to the
+store, by batch size or time window, so bursts of completed interviews
+do not each pay for a separate transaction and fsync.
+"""
+
+import atexit
+import queue
+import threading
+import time
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.storage import CandidateStore
+
+logger = logging.getLogger(__name__)
+
+
+class PendingWrite:
+    """Acknowledgement handle for one queued record."""
+
+    __slots__ = ("record", "_event", "success", "claimed", "cancelled")
+
+    def __init__(self, record: Dict[str, str]):
+        self.record = record
+        self._event = threading.Event()
+        self.success = False
+        # Guarded by the queue's claim lock
+        self.claimed = False
+        self.cancelled = False
+
+    def resolve(self, success: bool) -> None:
+        self.success = success
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the record's batch is committed.
+
+        Returns:
+            bool: True if the record was durably written
+        """
+        return self._event.wait(timeout) and self.success
+
+
+class WriteBehindQueue:
+    """Bounded in-process queue with a background group-commit flusher.
+
+    ``on_commit`` is called on the flusher thread with the records of each
+    committed batch, before their writers are acknowledged. Failed batches
+    are not passed to it.
+    """
+
+    def __init__(self, store: CandidateStore, max_batch: int = 50,
+                 flush_interval: float = 0.5, max_pending: int = 1000,
+                 on_commit: Optional[Callable[[List[Dict[str, str]]], None]] = None):
+        self.store = store
+        self.max_batch = max(max_batch, 1)
+        self.flush_interval = flush_interval
+        self.on_commit = on_commit
+
+        self._queue: "queue.Queue[Optional[PendingWrite]]" = queue.Queue(maxsize=max_pending)
+        self._claim_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="candidate-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, record: Dict[str, str], timeout: Optional[float] = None) -> PendingWrite:
+        """Queue a record for the next batch.
+
+        Args:
+            record: Record keyed by CSV header
+            timeout: Seconds to wait for room when the queue is full
+
+        Raises:
+            RuntimeError: If the queue has been closed
+            queue.Full: If no room became available within ``timeout``
+        """
+        if self._closed:
+            raise RuntimeError("Write queue is closed")
+        pending = PendingWrite(record)
+        self._queue.put(pending, timeout=timeout)
+        return pending
+
+    def cancel(self, pending: PendingWrite) -> bool:
+        """Withdraw a queued record that no commit has picked up yet.
+
+        Returns:
+            bool: True if the record will not be written, False if its batch
+            is already being committed
+        """
+        with self._claim_lock:
+            if pending.claimed:
+                return False
+            pending.cancelled = True
+        pending.resolve(False)
+        return True
+
+    def _collect_batch(self) -> Tuple[List[PendingWrite], bool]:
+        """Wait for the first record, then gather more until the batch or window fills."""
+        first = self._queue.get()
+        if first is None:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _flush(self, batch: List[PendingWrite]) -> None:
+        with self._claim_lock:
+            batch = [pending for pending in batch if not pending.cancelled]
+            for pending in batch:
+                pending.claimed = True
+        if not batch:
+            return
+        records = [pending.record for pending in batch]
+        try:
+            self.store.insert_many(records)
+            logger.info(f"Flushed {len(batch)} candidate record(s)")
+            success = True
+        except Exception as e:
+            logger.error(f"Error flushing candidate records: {e}")
+            success = False
+        if success and self.on_commit is not None:
+            try:
+                self.on_commit(records)
+            except Exception as e:
+                logger.error(f"Error in write queue commit callback: {e}")
+        for pending in batch:
+            pending.resolve(success)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect_batch()
+            if batch:
+                self._flush(batch)
+
+        # Drain anything queued behind the stop marker
+        leftovers = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                leftovers.append(item)
+        for start in range(0, len(leftovers), self.max_batch):
+            self._flush(leftovers[start:start + self.max_batch])
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Stop accepting records and flush everything still queued."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
@@ -0,0 +1,15 @@
+import os
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Config reads the environment on import: keep test data out of the repo's data dir
+_data_dir = tempfile.TemporaryDirectory(prefix="talentscout-tests-")
+os.environ["DATA_DIR"] = _data_dir.name
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+
+def pytest_unconfigure(config):
+    _data_dir.cleanup()
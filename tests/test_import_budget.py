@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from import_budget import ENTRY_MODULES, measure  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def startup():
+    return measure(ENTRY_MODULES, runs=3)
+
+
+def test_heavy_modules_load_lazily(startup):
+    assert startup["lazy_loaded"] == []
+
+
+@pytest.mark.skipif("IMPORT_BUDGET_MS" not in os.environ, reason="timing budget is machine-dependent; set IMPORT_BUDGET_MS")
+def test_entry_point_import_within_budget(startup):
+    assert startup["elapsed_ms"] <= float(os.environ["IMPORT_BUDGET_MS"])
@@ -0,0 +1,50 @@
+from core.data_handler import DataHandler
+from core.schema import HEADER_BY_COLUMN
+
+
+def stored_record(email, answer):
+    return {
+        HEADER_BY_COLUMN["interview_date"]: "2026-01-05 10:00:00",
+        HEADER_BY_COLUMN["email"]: email,
+        "Technical_A1": answer,
+    }
+
+
+def test_indexes_catch_up_with_records_they_missed(tmp_path):
+    handler = DataHandler(data_dir=str(tmp_path))
+    handler.store.insert(stored_record("ada@example.com", "Kafka partitions"))
+    handler._update_indexes()
+    handler.close()
+
+    # Saved while no index was being updated (another process, or a crash)
+    handler = DataHandler(data_dir=str(tmp_path), index_filename=None, search_index_filename=None)
+    handler.store.insert(stored_record("grace@example.com", "React hooks"))
+    handler.close()
+
+    handler = DataHandler(data_dir=str(tmp_path))
+    try:
+        assert handler.find_returning_candidate(email="grace@example.com") is not None
+        assert [hit["email"] for hit in handler.search_answers("hooks")] == ["grace@example.com"]
+        # Records below the mark are not indexed a second time
+        assert handler.find_returning_candidate(email="ada@example.com")["interviews"] == 1
+        assert handler.answer_index.count() == 2
+        assert handler.candidate_index.indexed_id() == handler.answer_index.indexed_id() == 2
+    finally:
+        handler.close()
+
+
+def test_index_without_mark_is_taken_as_complete(tmp_path):
+    handler = DataHandler(data_dir=str(tmp_path))
+    handler.store.insert(stored_record("ada@example.com", "Kafka partitions"))
+    handler._update_indexes()
+    # An index written before high-water marks were recorded
+    with handler.answer_index._conn:
+        handler.answer_index._conn.execute("DELETE FROM index_state")
+    handler.close()
+
+    handler = DataHandler(data_dir=str(tmp_path))
+    try:
+        assert handler.answer_index.count() == 1
+        assert handler.answer_index.indexed_id() == 1
+    finally:
+        handler.close()
@@ -0,0 +1,28 @@
+import json
+
+from core.question_batcher import parse_batch_response
+
+QUESTIONS = [
+    "How do you design a Django model for soft deletes?",
+    "When would you use select_related in the Django ORM?",
+    "How do you tune a slow PostgreSQL query?",
+]
+
+
+def test_numbered_sections():
+    content = json.dumps({"1": QUESTIONS, "2": ["Too short?"]})
+    assert parse_batch_response(content, 2, 5) == [QUESTIONS, None]
+
+
+def test_envelope_around_numbered_sections():
+    content = json.dumps({"candidates": {"1": QUESTIONS, "2": QUESTIONS}})
+    assert parse_batch_response(content, 2, 5) == [QUESTIONS, QUESTIONS]
+
+
+def test_single_candidate_questions_object():
+    content = json.dumps({"questions": QUESTIONS})
+    assert parse_batch_response(content, 1, 5) == [QUESTIONS]
+
+
+def test_single_candidate_top_level_list():
+    assert parse_batch_response(json.dumps(QUESTIONS), 1, 5) == [QUESTIONS]
@@ -0,0 +1,60 @@
+import sqlite3
+import time
+
+import pytest
+
+from core.chatbot_logic import TalentScoutChatbot
+from core.session_store import SqliteSessionStore
+
+
+@pytest.fixture
+def chatbot(tmp_path):
+    chatbot = TalentScoutChatbot()
+    chatbot.session_store = SqliteSessionStore(str(tmp_path / "sessions.db"))
+    yield chatbot
+    chatbot.session_store.close()
+
+
+def test_unsupported_state_is_overwritten_by_the_fresh_session(chatbot):
+    version = chatbot.session_store.save("abc123", {"v": 0, "step": 3}, 0)
+
+    session, restored_version = chatbot.restore_session("abc123")
+
+    assert session.step == 0
+    assert restored_version == version
+    # The next save replaces the bad row instead of conflicting forever
+    session.start("Hi!")
+    assert chatbot.session_store.save("abc123", session.to_dict(), restored_version) == version + 1
+    assert chatbot.restore_session("abc123")[0].messages[0].content == "Hi!"
+
+
+def test_corrupt_row_is_deleted(chatbot):
+    with sqlite3.connect(chatbot.session_store.db_path) as conn:
+        conn.execute(
+            "INSERT INTO interview_sessions (id, version, updated_at, state) VALUES (?, 7, ?, ?)",
+            ("abc123", time.time(), b"?not a state")
+        )
+
+    session, version = chatbot.restore_session("abc123")
+
+    assert version == 0
+    assert chatbot.session_store.load("abc123") is None
+    assert chatbot.session_store.save("abc123", session.to_dict(), version) == 1
+
+
+def test_store_error_keeps_the_interview(chatbot, monkeypatch):
+    session = chatbot.new_interview_session()
+    session.start("Hi!")
+    version = chatbot.session_store.save("abc123", session.to_dict(), 0)
+
+    def locked(session_id):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(chatbot.session_store, "load", locked)
+    with pytest.raises(sqlite3.OperationalError):
+        chatbot.restore_session("abc123")
+    monkeypatch.undo()
+
+    restored, restored_version = chatbot.restore_session("abc123")
+    assert restored_version == version
+    assert restored.messages[0].content == "Hi!"
@@ -0,0 +1,87 @@
+import pytest
+
+from core import session_store
+from core.session_store import (
+    InMemorySessionStore, SessionConflict, SqliteSessionStore, decode_state, encode_state,
+)
+
+TTL = 60.0
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(session_store, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        store = InMemorySessionStore(ttl_seconds=TTL)
+    else:
+        store = SqliteSessionStore(str(tmp_path / "sessions.db"), ttl_seconds=TTL)
+    yield store
+    store.close()
+
+
+def test_versions_advance_with_each_save(store, clock):
+    assert store.load("s1") is None
+    assert store.save("s1", {"step": 1}, expected_version=0) == 1
+    assert store.save("s1", {"step": 2}, expected_version=1) == 2
+    assert store.load("s1") == ({"step": 2}, 2)
+
+
+def test_stale_version_raises_conflict(store, clock):
+    store.save("s1", {"step": 1}, expected_version=0)
+    store.save("s1", {"step": 2}, expected_version=1)
+
+    with pytest.raises(SessionConflict):
+        store.save("s1", {"step": "stale"}, expected_version=1)
+    # Creating a session that already exists is a conflict too
+    with pytest.raises(SessionConflict):
+        store.save("s1", {"step": "new"}, expected_version=0)
+    assert store.load("s1") == ({"step": 2}, 2)
+
+
+def test_expired_session_is_gone(store, clock):
+    store.save("s1", {"step": 1}, expected_version=0)
+    clock.now += TTL / 2
+    assert store.load("s1") == ({"step": 1}, 1)
+
+    clock.now += TTL + 1
+    assert store.load("s1") is None
+    with pytest.raises(SessionConflict):
+        store.save("s1", {"step": 2}, expected_version=1)
+    # The id can be used again for a new interview
+    assert store.save("s1", {"step": "fresh"}, expected_version=0) == 1
+    assert store.load("s1") == ({"step": "fresh"}, 1)
+
+
+def test_saving_keeps_a_session_alive(store, clock):
+    store.save("s1", {"step": 1}, expected_version=0)
+    for version in range(1, 4):
+        clock.now += TTL - 1
+        store.save("s1", {"step": version + 1}, expected_version=version)
+    assert store.load("s1") == ({"step": 4}, 4)
+
+
+def test_delete_forgets_the_session(store, clock):
+    store.save("s1", {"step": 1}, expected_version=0)
+    store.delete("s1")
+    assert store.load("s1") is None
+
+
+def test_large_states_round_trip_compressed():
+    state = {"answers": ["x" * 100] * 20}
+    blob = encode_state(state)
+    assert blob[:1] == b"z"
+    assert decode_state(blob) == state
@@ -0,0 +1,81 @@
+import threading
+import time
+
+import pytest
+
+from core.single_flight import SingleFlight
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def run_callers(flight, key, fn, callers):
+    """Start ``callers`` threads calling ``flight.do``; return (threads, outcomes)."""
+    outcomes = []
+
+    def call():
+        try:
+            outcomes.append(flight.do(key, fn))
+        except Exception as e:
+            outcomes.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def test_followers_share_the_leaders_result():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def generate():
+        calls.append(1)
+        release.wait(5)
+        return ["What is a goroutine?"]
+
+    threads, outcomes = run_callers(flight, "go", generate, 4)
+    wait_until(lambda: flight.stats()["coalesced"] == 3)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(outcomes) == 4
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert flight.stats() == {"calls": 4, "coalesced": 3, "in_flight": 0}
+
+
+def test_leader_error_reaches_every_follower():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def generate():
+        release.wait(5)
+        raise TimeoutError("LLM deadline exceeded")
+
+    threads, outcomes = run_callers(flight, "go", generate, 3)
+    wait_until(lambda: flight.stats()["coalesced"] == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(outcomes) == 3
+    assert all(isinstance(outcome, TimeoutError) for outcome in outcomes)
+
+    # The failed call is forgotten, so the next one starts fresh work
+    assert flight.do("go", lambda: "retried") == "retried"
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+    assert flight.do("go", lambda: 1) == 1
+    assert flight.do("rust", lambda: 2) == 2
+    with pytest.raises(ValueError):
+        flight.do("go", lambda: int("not a number"))
+    assert flight.stats()["coalesced"] == 0
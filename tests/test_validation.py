@@ -0,0 +1,49 @@
+import pandas as pd
+
+from core.interview_engine import InterviewSession
+from core.validation import normalize_many, normalize_phone, validate_many
+
+PHONE_QUESTION = "What is your phone number?"
+TECH_STACK_QUESTION = "Please list your tech stack (languages, frameworks, and tools you know)."
+
+
+def test_normalize_phone():
+    assert normalize_phone("+49 30 123456") == "+4930123456"
+    assert normalize_phone("0049 30 123456") == "+4930123456"
+    assert normalize_phone("(555) 123-4567") == "+15551234567"
+    assert normalize_phone("555 123 4567", default_country_code="44") == "+445551234567"
+
+
+def test_interview_keeps_the_country_code_of_international_numbers():
+    session = InterviewSession([PHONE_QUESTION, TECH_STACK_QUESTION], TECH_STACK_QUESTION, question_source=None)
+
+    session.submit("+49 30 123456")
+
+    assert session.candidate[PHONE_QUESTION] == "+4930123456"
+
+
+def test_validate_many():
+    df = pd.DataFrame({
+        "email": ["john@example.com", "not an email"],
+        "phone": ["+49 30 1234567", "12345"],
+        "experience_years": ["5", "99"],
+    })
+
+    results = validate_many(df, max_experience_years=50)
+
+    assert results["email"].tolist() == [True, False]
+    assert results["phone"].tolist() == [True, False]
+    assert results["experience_years"].tolist() == [True, False]
+    assert results["valid"].tolist() == [True, False]
+
+
+def test_normalize_many_matches_the_scalar_normalizers():
+    phones = ["+49 30 1234567", "0049 30 1234567", "(555) 123-4567"]
+    df = pd.DataFrame({"What is your email address?": [" John@Example.COM", "a@b.co", "c@d.io"],
+                       "phone": phones})
+
+    normalized = normalize_many(df)
+
+    assert normalized["phone"].tolist() == [normalize_phone(phone) for phone in phones]
+    assert normalized["What is your email address?"].tolist() == ["john@example.com", "a@b.co", "c@d.io"]
+    assert df["phone"].tolist() == phones
@@ -0,0 +1,115 @@
+import threading
+import time
+
+import pytest
+
+from core.write_queue import WriteBehindQueue
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+class RecordingStore:
+    """Candidate store stand-in recording each committed batch."""
+
+    def __init__(self, block: threading.Event = None):
+        self.batches = []
+        self.block = block
+
+    def insert_many(self, records):
+        if self.block is not None:
+            self.block.wait()
+        self.batches.append(list(records))
+
+
+def test_cancelled_record_is_never_written():
+    block = threading.Event()
+    store = RecordingStore(block)
+    write_queue = WriteBehindQueue(store, max_batch=1, flush_interval=0)
+    first = write_queue.submit({"id": "1"})
+    second = write_queue.submit({"id": "2"})
+
+    # The first record's commit is in progress, the second is still queued
+    wait_until(lambda: first.claimed)
+    assert not write_queue.cancel(first)
+    assert write_queue.cancel(second)
+    assert not second.wait(0)
+
+    block.set()
+    assert first.wait(5)
+    write_queue.close()
+    assert store.batches == [[{"id": "1"}]]
+
+
+def test_full_batch_is_committed_in_one_transaction():
+    store = RecordingStore()
+    # The time window alone would hold the batch open for a minute
+    write_queue = WriteBehindQueue(store, max_batch=3, flush_interval=60)
+    pending = [write_queue.submit({"id": str(i)}) for i in range(3)]
+
+    assert all(p.wait(5) for p in pending)
+    assert store.batches == [[{"id": "0"}, {"id": "1"}, {"id": "2"}]]
+    write_queue.close()
+
+
+def test_time_window_flushes_a_partial_batch():
+    store = RecordingStore()
+    write_queue = WriteBehindQueue(store, max_batch=50, flush_interval=0.05)
+    pending = [write_queue.submit({"id": str(i)}) for i in range(2)]
+
+    assert all(p.wait(5) for p in pending)
+    assert store.batches == [[{"id": "0"}, {"id": "1"}]]
+    write_queue.close()
+
+
+def test_close_drains_queued_records():
+    block = threading.Event()
+    store = RecordingStore(block)
+    write_queue = WriteBehindQueue(store, max_batch=2, flush_interval=60)
+    pending = [write_queue.submit({"id": str(i)}) for i in range(5)]
+
+    block.set()
+    write_queue.close()
+
+    assert all(p.wait(0) for p in pending)
+    assert [record["id"] for batch in store.batches for record in batch] == ["0", "1", "2", "3", "4"]
+    assert max(len(batch) for batch in store.batches) <= 2
+    with pytest.raises(RuntimeError):
+        write_queue.submit({"id": "late"})
+
+
+def test_on_commit_runs_after_commit_and_before_acknowledgement():
+    block = threading.Event()
+    store = RecordingStore(block)
+    events = []
+
+    def on_commit(records):
+        events.append(("commit", [record["id"] for record in records], len(store.batches), pending.wait(0)))
+
+    write_queue = WriteBehindQueue(store, max_batch=1, flush_interval=0, on_commit=on_commit)
+    pending = write_queue.submit({"id": "1"})
+    block.set()
+
+    assert pending.wait(5)
+    # The batch was already stored, but its writer not yet acknowledged
+    assert events == [("commit", ["1"], 1, False)]
+    write_queue.close()
+
+
+def test_failed_batch_is_not_passed_to_on_commit():
+    class FailingStore:
+        def insert_many(self, records):
+            raise OSError("disk full")
+
+    committed = []
+    write_queue = WriteBehindQueue(FailingStore(), max_batch=1, flush_interval=0, on_commit=committed.append)
+    pending = write_queue.submit({"id": "1"})
+
+    assert pending._event.wait(5)
+    assert not pending.wait(0)
+    assert committed == []
+    write_queue.close()
@@ -5,7 +5,16 @@ used throughout the application.
 """
 
 import re
-from typing import List
+from typing import List, Optional
+
+# Compiled once at import; validators run on every submitted answer
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+NON_DIGIT_PATTERN = re.compile(r'\D')
+UNSAFE_CHARS_PATTERN = re.compile(r'[<>"\'%;()&+]')
+
+# E.164 numbers carry at most 15 digits; local numbers need at least 10
+PHONE_MIN_DIGITS = 10
+PHONE_MAX_DIGITS = 15
 
 
 def validate_email(email: str) -> bool:
@@ -17,8 +26,7 @@ def validate_email(email: str) -> bool:
     Returns:
         bool: True if email format is valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return EMAIL_PATTERN.match(email) is not None
 
 
 def validate_phone(phone: str) -> bool:
@@ -28,11 +36,11 @@ def validate_phone(phone: str) -> bool:
         phone: Phone number string to validate
         
     Returns:
-        bool: True if phone has at least 10 digits, False otherwise
+        bool: True if phone has 10 to 15 digits, False otherwise
     """
     # Extract only digits from phone number
-    digits_only = re.sub(r'\D', '', phone)
-    return len(digits_only) >= 10
+    digits_only = NON_DIGIT_PATTERN.sub('', phone)
+    return PHONE_MIN_DIGITS <= len(digits_only) <= PHONE_MAX_DIGITS
 
 
 def validate_experience(exp: str, max_years: int = 50) -> bool:
@@ -65,11 +73,41 @@ def validate_name(name: str, min_length: int = 2) -> bool:
     return len(name.strip()) >= min_length
 
 
+# Precompiled once at import; the parsers run on every generated response.
+# Leading list markers: "1.", "2)", "3-", "- ", "* ", "• " and "**1.**".
+_QUESTION_PREFIX = re.compile(r'(?:[-*•]\s+)?(?:\*\*(?=\d))?(?:\d+[.)\-](?:\*\*)?\s*)?')
+# A line is a question if it has a "?" or contains a question keyword. The
+# keywords are factored into one alternation and matched against the
+# lowercased line, which is much faster than re.IGNORECASE on long lines.
+_QUESTION_KEYWORDS = re.compile(r'wh(?:at|y|en|ere)|how|explain|describe|discuss')
+_NUMBER_MARKER = re.compile(r'\d+[.)\-]')
+
+# Primary parsing needs at least this many questions before the fallback is skipped
+MIN_PARSED_QUESTIONS = 3
+
+
+def _parse_question_line(line: str) -> Optional[str]:
+    """Return the cleaned question on a line, or None if it is not a question."""
+    line = line.strip()
+    if not line:
+        return None
+    clean_line = line[_QUESTION_PREFIX.match(line).end():]
+    if '?' in clean_line or _QUESTION_KEYWORDS.search(clean_line.lower()):
+        return clean_line
+    return None
+
+
+def _split_on_numbering(text: str) -> List[str]:
+    """Fallback strategy: split the whole text on numbering markers."""
+    return [q.strip() for q in _NUMBER_MARKER.split(text) if q.strip()]
+
+
 def parse_tech_questions(tech_response: str, max_questions: int = 5) -> List[str]:
     """Parse technical questions from GPT response text.
     
-    Uses multiple parsing strategies to extract individual questions
-    from AI-generated response text.
+    Scans the response once, line by line, and stops as soon as enough
+    questions were found. Only if fewer than three question lines exist
+    is the whole text re-split on numbering markers.
     
     Args:
         tech_response: Raw response text from GPT containing questions
@@ -78,30 +116,90 @@ def parse_tech_questions(tech_response: str, max_questions: int = 5) -> List[str
     Returns:
         List of parsed question strings, limited to max_questions
     """
-    lines = tech_response.split('\n')
+    enough = max(max_questions, MIN_PARSED_QUESTIONS)
     questions = []
     
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Remove numbering patterns (1., 2), etc.)
-        clean_line = re.sub(r'^\d+[.)\-]\s*', '', line)
-        
-        # Check if line contains question indicators
-        if ('?' in clean_line or 
-            any(word in clean_line.lower() for word in 
-                ['what', 'how', 'why', 'when', 'where', 'explain', 'describe', 'discuss'])):
-            questions.append(clean_line)
+    for line in tech_response.split('\n'):
+        question = _parse_question_line(line)
+        if question:
+            questions.append(question)
+            if len(questions) >= enough:
+                break
     
     # Fallback parsing strategy if primary method fails
-    if len(questions) < 3:
-        questions = [q.strip() for q in re.split(r'\d+[.)\-]', tech_response) if q.strip()]
+    if len(questions) < MIN_PARSED_QUESTIONS:
+        questions = _split_on_numbering(tech_response)
     
     return questions[:max_questions]
 
 
+class TechQuestionStreamParser:
+    """Incremental counterpart of parse_tech_questions for streamed responses.
+    
+    Text chunks are fed as they arrive from the model and each question is
+    emitted as soon as its line is complete. ``close`` then applies the same
+    fallback strategy as parse_tech_questions and returns whatever was not
+    emitted yet. Each chunk is scanned once, so total work stays linear in
+    the response length regardless of chunk size.
+    """
+    
+    def __init__(self, max_questions: int = 5):
+        self.max_questions = max_questions
+        self.emitted: List[str] = []
+        self._buffer = ""
+        self._chunks: List[str] = []
+    
+    def _accept(self, line: str) -> Optional[str]:
+        if len(self.emitted) >= self.max_questions:
+            return None
+        question = _parse_question_line(line)
+        if question:
+            self.emitted.append(question)
+        return question
+    
+    def feed(self, chunk: str) -> List[str]:
+        """Consume a chunk of response text.
+        
+        Args:
+            chunk: Next piece of streamed response text
+            
+        Returns:
+            Questions completed by this chunk (possibly empty)
+        """
+        self._chunks.append(chunk)
+        if '\n' not in chunk:
+            self._buffer += chunk
+            return []
+        
+        head, *lines, self._buffer = (self._buffer + chunk).split('\n')
+        new_questions = []
+        for line in (head, *lines):
+            question = self._accept(line)
+            if question:
+                new_questions.append(question)
+        return new_questions
+    
+    def close(self) -> List[str]:
+        """Finish parsing once the stream has ended.
+        
+        Returns:
+            Remaining questions that were not emitted by ``feed``
+        """
+        remaining = []
+        question = self._accept(self._buffer)
+        if question:
+            remaining.append(question)
+        self._buffer = ""
+        
+        if len(self.emitted) < MIN_PARSED_QUESTIONS:
+            fallback = _split_on_numbering(''.join(self._chunks))[:self.max_questions]
+            extra = [q for q in fallback if q not in self.emitted]
+            extra = extra[:max(self.max_questions - len(self.emitted), 0)]
+            self.emitted.extend(extra)
+            remaining.extend(extra)
+        return remaining
+
+
 def get_fallback_tech_questions(tech_stack: str) -> List[str]:
     """Generate fallback technical questions when AI generation fails.
     
@@ -139,5 +237,5 @@ def sanitize_input(user_input: str) -> str:
     # Remove excessive whitespace and normalize spacing
     sanitized = ' '.join(user_input.split())
     # Remove potentially harmful characters (basic sanitization)
-    sanitized = re.sub(r'[<>"\'%;()&+]', '', sanitized)
+    sanitized = UNSAFE_CHARS_PATTERN.sub('', sanitized)
     return sanitized.strip()
\ No newline at end of file